@@ -1,3 +1,5 @@
+from typing import List, Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -6,14 +8,91 @@ class Settings(BaseSettings):
     BIND_PORT: str
     DB_URL: str
 
+    # Prepared statements: 'direct' caches them per connection, 'pooler' also uses unique statement names,
+    # which is safe behind a transaction-mode pooler (PgBouncer >= 1.21 with max_prepared_statements set)
+    DB_STATEMENT_CACHE_MODE: Literal['disabled', 'direct', 'pooler'] = 'direct'
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 30 * 60
+    DB_POOL_PRE_PING: bool = True
+
     JWT_SECRET_SALT: str
+    # users allowed to call /admin endpoints
+    ADMIN_USER_IDS: List[int] = []
 
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_PASSWORD: str
     REDIS_BATTLESHIP_CACHE_PREFIX: str = 'battleship'
 
+    # Sliding TTLs (seconds) of game keys, refreshed on every write
+    REDIS_GAME_SETUP_TTL: int = 60 * 60
+    REDIS_GAME_ACTIVE_TTL: int = 24 * 60 * 60
+    REDIS_GAME_FINISHED_TTL: int = 60 * 60
+
+    # Idle games sweeper, 0 interval disables it.
+    # Idle timeout should be shorter than the TTLs to record abandoned games before they expire.
+    GAME_SWEEPER_INTERVAL: int = 60
+    GAME_SWEEPER_IDLE_TIMEOUT: int = 30 * 60
+    GAME_SWEEPER_BATCH_SIZE: int = 500
+    GAME_SWEEPER_RECORD_ABANDONED: bool = False
+    GAME_SWEEPER_MEMORY_SAMPLES: int = 50
+
+    # Leaderboards kept in Redis sorted sets, periodic ones expire after the TTLs (seconds)
+    LEADERBOARD_WEEK_TTL: int = 5 * 7 * 24 * 60 * 60
+    LEADERBOARD_MONTH_TTL: int = 13 * 31 * 24 * 60 * 60
+    LEADERBOARD_WIN_RATE_MIN_GAMES: int = 5
+
+    # day and week buckets of /stats/timeline are read from sirius.game_daily_stats
+    STATS_TIMELINE_USE_ROLLUPS: bool = True
+
+    # rows fetched per round trip by the games export server side cursor
+    EXPORT_FETCH_SIZE: int = 1000
+
+    # Monthly partitions of sirius.game created around the current month, older ones are archived by retention.
+    # GAME_PARTITIONS_BEHIND should stay below GAME_RETENTION_MONTHS, so archived partitions are not recreated.
+    GAME_PARTITIONS_BEHIND: int = 12
+    GAME_PARTITIONS_AHEAD: int = 3
+    GAME_RETENTION_MONTHS: int = 24
+    # seconds between partition checks of a worker, partitions are also checked on start, 0 disables both
+    GAME_PARTITIONS_INTERVAL: int = 24 * 60 * 60
+
+    # username -> user id cache in front of login, 0 disables it
+    USER_ID_CACHE_SIZE: int = 10000
+
+    # /admin/profile sampling profiler of a worker
+    PROFILER_INTERVAL: float = 0.01
+    PROFILER_MAX_SECONDS: float = 60
+    # admins' requests with the X-Profile header run under cProfile, keep it off on production workers
+    REQUEST_PROFILING: bool = False
+    REQUEST_PROFILE_DIR: str = '/tmp/profiles'
+    # the oldest profiles are removed above this number
+    REQUEST_PROFILE_MAX_FILES: int = 50
+
+    # engine calls on boards of at least ENGINE_OFFLOAD_MIN_CELLS squares run in a thread or process pool,
+    # 'inline' runs everything on the event loop
+    ENGINE_EXECUTOR: Literal['inline', 'thread', 'process'] = 'thread'
+    ENGINE_EXECUTOR_WORKERS: int = 4
+    ENGINE_OFFLOAD_MIN_CELLS: int = 400
+    # the AI's next target is chosen in the background after the player's miss and used by /game/ai_strike
+    AI_MOVE_PRECOMPUTE: bool = True
+
+    # seconds between event loop lag measurements, 0 disables them
+    LOOP_LAG_INTERVAL: float = 0.5
+
+    # correlation ids attached as exemplars to integration metrics, exposed to OpenMetrics scrapers
+    METRICS_EXEMPLARS: bool = False
+
+    # per phase timings of requests sent in the Server-Timing response header
+    SERVER_TIMING_HEADER: bool = True
+
     LOG_LEVEL: str = 'debug'
+    # formatter of conf/logging.conf.yml used by all handlers
+    LOG_FORMAT: Literal['json', 'console'] = 'json'
+    # share of debug records written, the rest is dropped before reaching the log queue
+    LOG_DEBUG_SAMPLE_RATE: float = 1.0
 
 
 settings = Settings()
@@ -0,0 +1,95 @@
+"""Per page latency of /stats/history keyset pagination compared with OFFSET pagination.
+
+Seeds `--games` games for a new user into the configured Postgres, then times
+pages at increasing depths. Keyset pages should stay flat while OFFSET pages grow
+linearly with the depth.
+"""
+import random
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any, Awaitable, Callable, List
+
+from sqlalchemy import delete, select
+
+from scripts.benchmarks.common import print_summary, seed_games, summarize
+
+from webapp.crud.stats import get_game_history
+from webapp.crud.user import get_or_create_user
+from webapp.db.postgres import async_session, engine
+from webapp.models.sirius.game import Game
+from webapp.schema.user import UserInfo
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument('--games', type=int, default=1_000_000)
+parser.add_argument('--page-size', type=int, default=20)
+parser.add_argument('--depths', type=int, nargs='+', default=[0, 100, 1000, 10000, 49000])
+parser.add_argument('--repeat', type=int, default=50)
+parser.add_argument('--keep', action='store_true', help="Don't delete seeded games")
+
+args = parser.parse_args()
+
+
+async def time_page(query: Callable[[], Awaitable[Any]]) -> List[float]:
+    latencies = []
+    for _ in range(args.repeat):
+        start = perf_counter()
+        await query()
+        latencies.append(perf_counter() - start)
+    return latencies
+
+
+async def main() -> None:
+    async with async_session() as session:
+        user_id = await get_or_create_user(session, UserInfo(username=random.randint(10**12, 10**13)))
+
+    print(f'seeding {args.games} games for user {user_id}')
+    await seed_games(engine, [user_id], args.games, datetime.utcnow() - timedelta(days=365), timedelta(days=365))
+
+    try:
+        async with async_session() as session:
+            for depth in args.depths:
+                offset = depth * args.page_size
+
+                # keyset position of the page, found once outside of the timed part
+                before = None
+                if offset:
+                    row = (
+                        await session.execute(
+                            select(Game.timestamp, Game.id)
+                            .filter(Game.user_id == user_id)
+                            .order_by(Game.timestamp.desc(), Game.id.desc())
+                            .offset(offset - 1)
+                            .limit(1)
+                        )
+                    ).one()
+                    before = (row.timestamp, row.id)
+
+                offset_query = (
+                    select(Game.id, Game.timestamp, Game.won, Game.ships_sank, Game.ships_destroyed, Game.abandoned)
+                    .filter(Game.user_id == user_id)
+                    .order_by(Game.timestamp.desc(), Game.id.desc())
+                    .offset(offset)
+                    .limit(args.page_size)
+                )
+
+                keyset = await time_page(
+                    lambda before=before: get_game_history(session, user_id, args.page_size, before)
+                )
+                print_summary(f'keyset page={depth}', summarize(keyset, sum(keyset)))
+
+                paged = await time_page(lambda query=offset_query: session.execute(query))
+                print_summary(f'offset page={depth}', summarize(paged, sum(paged)))
+    finally:
+        if not args.keep:
+            async with async_session() as session:
+                await session.execute(delete(Game).filter(Game.user_id == user_id))
+                await session.commit()
+
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
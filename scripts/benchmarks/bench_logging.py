@@ -0,0 +1,81 @@
+"""Game request throughput with debug logging on, handlers writing on the event loop versus from the log queue.
+
+Runs the real ASGI app against the configured Postgres and Redis. Every game creates random ships
+for both players, so each one logs at least 20 debug lines. Redirect stderr to where logs go in
+production, e.g. `2>/var/tmp/bench.log`, summaries are printed to stdout.
+"""
+import random
+import asyncio
+import logging
+import argparse
+from time import perf_counter
+from typing import List
+
+from httpx import AsyncClient
+
+from scripts.benchmarks.common import print_summary, summarize
+
+from webapp.logger import logger
+from webapp.main import create_app
+from webapp.on_startup.logger import setup_logger, stop_logger
+from webapp.on_startup.redis import start_redis
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument('--games', type=int, default=200)
+parser.add_argument('--concurrency', type=int, default=20)
+
+args = parser.parse_args()
+
+
+async def play(client: AsyncClient, token: str, latencies: List[float]) -> None:
+    headers = {'Authorization': f'Bearer {token}'}
+    requests = [
+        ('/game/create_game', 'post'),
+        ('/game/create_random_ships', 'post'),
+        ('/game/player_board', 'get'),
+        ('/game/opponent_board', 'get'),
+    ]
+
+    for url, method in requests:
+        start = perf_counter()
+        response = await client.request(method, url, headers=headers)
+        response.raise_for_status()
+        latencies.append(perf_counter() - start)
+
+
+async def run(client: AsyncClient, tokens: List[str], use_queue: bool) -> None:
+    setup_logger(use_queue=use_queue)
+    logger.setLevel(logging.DEBUG)
+
+    latencies: List[float] = []
+    start = perf_counter()
+
+    for offset in range(0, args.games, args.concurrency):
+        batch = tokens[: min(args.concurrency, args.games - offset)]
+        await asyncio.gather(*(play(client, token, latencies) for token in batch))
+
+    elapsed = perf_counter() - start
+    stop_logger()
+
+    print_summary(f'game requests queue={"on" if use_queue else "off"}', summarize(latencies, elapsed))
+
+
+async def main() -> None:
+    await start_redis()
+    app = create_app()
+
+    async with AsyncClient(app=app, base_url='http://bench') as client:
+        base_username = random.randint(10**9, 10**10)
+        tokens = []
+        for i in range(args.concurrency):
+            response = await client.post('/auth/login', json={'username': base_username + i})
+            response.raise_for_status()
+            tokens.append(response.json()['access_token'])
+
+        await run(client, tokens, use_queue=False)
+        await run(client, tokens, use_queue=True)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+"""Login throughput under concurrent bursts.
+
+Runs the real ASGI app against the configured Postgres. Every burst logs in
+`--concurrency` users at once, half of them with the same username to exercise
+the upsert conflict path.
+"""
+import random
+import asyncio
+import argparse
+from time import perf_counter
+from typing import List
+
+from httpx import AsyncClient
+
+from scripts.benchmarks.common import print_summary, summarize
+
+from webapp.api.login.login import user_id_cache
+from webapp.main import create_app
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument('--bursts', type=int, default=50)
+parser.add_argument('--concurrency', type=int, default=50)
+parser.add_argument('--usernames', type=int, default=1000, help='Size of the pool new usernames are drawn from')
+
+args = parser.parse_args()
+
+
+async def run(client: AsyncClient, use_cache: bool) -> None:
+    latencies: List[float] = []
+    base_username = random.randint(10**9, 10**10)
+
+    async def login(username: int) -> None:
+        start = perf_counter()
+        response = await client.post('/auth/login', json={'username': username})
+        response.raise_for_status()
+        latencies.append(perf_counter() - start)
+
+    start = perf_counter()
+    for _ in range(args.bursts):
+        if not use_cache:
+            user_id_cache.clear()
+
+        shared = base_username + random.randrange(args.usernames)
+        usernames = [
+            shared if i % 2 else base_username + random.randrange(args.usernames) for i in range(args.concurrency)
+        ]
+        await asyncio.gather(*(login(username) for username in usernames))
+
+    print_summary(f'login cache={"on" if use_cache else "off"}', summarize(latencies, perf_counter() - start))
+
+
+async def main() -> None:
+    app = create_app()
+
+    async with AsyncClient(app=app, base_url='http://bench') as client:
+        await run(client, use_cache=False)
+        await run(client, use_cache=True)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
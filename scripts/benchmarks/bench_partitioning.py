@@ -0,0 +1,138 @@
+"""Stats latency and insert throughput of the monthly partitioned game table versus a plain one.
+
+Creates sirius.game_bench_plain and sirius.game_bench_partitioned shaped like sirius.game,
+seeds both with `--rows` games over `--months` months and runs get_statistics shaped
+queries for random users. Use --rows 100000000 for the full size comparison.
+"""
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+from random import randrange
+from time import perf_counter
+from typing import List
+
+from sqlalchemy import text
+
+from scripts.benchmarks.common import print_summary, seed_games, summarize
+
+from webapp.db.partitions import add_months, iter_months
+from webapp.db.postgres import engine
+from webapp.models.meta import DEFAULT_SCHEMA
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument('--rows', type=int, default=10_000_000)
+parser.add_argument('--users', type=int, default=100_000)
+parser.add_argument('--months', type=int, default=24)
+parser.add_argument('--queries', type=int, default=500)
+parser.add_argument('--inserts', type=int, default=5000)
+parser.add_argument('--keep', action='store_true', help="Don't drop benchmark tables")
+
+args = parser.parse_args()
+
+PLAIN = 'game_bench_plain'
+PARTITIONED = 'game_bench_partitioned'
+
+COLUMNS = (
+    'id SERIAL, user_id INTEGER NOT NULL, won BOOLEAN NOT NULL, ships_sank INTEGER NOT NULL, '
+    'ships_destroyed INTEGER NOT NULL, abandoned BOOLEAN NOT NULL DEFAULT false, moves BYTEA, '
+    'timestamp TIMESTAMP NOT NULL, PRIMARY KEY (id, timestamp)'
+)
+
+STATS_QUERY = (
+    'SELECT count(nullif(won = true, false)), count(nullif(won = false, false)), '
+    'coalesce(sum(ships_sank), 0), coalesce(sum(ships_destroyed), 0) FROM {table} '
+    'WHERE timestamp >= :start_date AND timestamp <= :end_date AND user_id = :user_id AND abandoned = false'
+)
+
+
+async def create_tables(start: datetime) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(f'CREATE TABLE {DEFAULT_SCHEMA}.{PLAIN} ({COLUMNS})'))
+        await conn.execute(
+            text(f'CREATE TABLE {DEFAULT_SCHEMA}.{PARTITIONED} ({COLUMNS}) PARTITION BY RANGE (timestamp)')
+        )
+        for month in iter_months(start.date(), add_months(start.date(), args.months)):
+            await conn.execute(
+                text(
+                    f'CREATE TABLE {DEFAULT_SCHEMA}.{PARTITIONED}_y{month:%Y}m{month:%m} '
+                    f"PARTITION OF {DEFAULT_SCHEMA}.{PARTITIONED} FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+                )
+            )
+        for table in (PLAIN, PARTITIONED):
+            await conn.execute(
+                text(
+                    f'CREATE INDEX ON {DEFAULT_SCHEMA}.{table} (user_id, timestamp, id) '
+                    'INCLUDE (won, ships_sank, ships_destroyed, abandoned)'
+                )
+            )
+
+
+async def drop_tables() -> None:
+    async with engine.begin() as conn:
+        for table in (PLAIN, PARTITIONED):
+            await conn.execute(text(f'DROP TABLE IF EXISTS {DEFAULT_SCHEMA}.{table}'))
+
+
+async def bench_inserts(table: str, end: datetime) -> None:
+    latencies: List[float] = []
+    query = text(
+        f'INSERT INTO {DEFAULT_SCHEMA}.{table} (user_id, won, ships_sank, ships_destroyed, timestamp) '
+        'VALUES (:user_id, true, 1, 10, :timestamp)'
+    )
+
+    async with engine.connect() as conn:
+        start = perf_counter()
+        for i in range(args.inserts):
+            query_start = perf_counter()
+            await conn.execute(query, {'user_id': randrange(args.users), 'timestamp': end - timedelta(seconds=i)})
+            await conn.commit()
+            latencies.append(perf_counter() - query_start)
+
+    print_summary(f'insert {table}', summarize(latencies, perf_counter() - start))
+
+
+async def bench_stats(table: str, end: datetime, period: int) -> None:
+    latencies: List[float] = []
+    query = text(STATS_QUERY.format(table=f'{DEFAULT_SCHEMA}.{table}'))
+
+    async with engine.connect() as conn:
+        start = perf_counter()
+        for _ in range(args.queries):
+            query_start = perf_counter()
+            await conn.execute(
+                query, {'start_date': end - timedelta(days=period), 'end_date': end, 'user_id': randrange(args.users)}
+            )
+            latencies.append(perf_counter() - query_start)
+
+    print_summary(f'stats period={period} {table}', summarize(latencies, perf_counter() - start))
+
+
+async def main() -> None:
+    end = datetime.utcnow().replace(microsecond=0)
+    start = end - timedelta(days=30 * args.months)
+
+    await drop_tables()
+    await create_tables(start)
+
+    try:
+        for table in (PLAIN, PARTITIONED):
+            copy_start = perf_counter()
+            await seed_games(engine, range(args.users), args.rows, start, end - start, table=table)
+            print(f'copy {table}: {args.rows / (perf_counter() - copy_start):.0f} rows/s')
+
+        for period in (1, 7, 30):
+            for table in (PLAIN, PARTITIONED):
+                await bench_stats(table, end, period)
+
+        for table in (PLAIN, PARTITIONED):
+            await bench_inserts(table, end)
+    finally:
+        if not args.keep:
+            await drop_tables()
+
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""Latency of hot queries with each prepared statement cache mode.
+
+Runs against the configured Postgres; load some games first (scripts/load_data.py)
+so get_statistics has rows to aggregate.
+"""
+import asyncio
+import argparse
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from scripts.benchmarks.common import print_summary, summarize
+
+from webapp.crud.stats import get_statistics
+from webapp.crud.user import get_or_create_user, get_user_by_id
+from webapp.db.postgres import create_engine, create_session
+from webapp.schema.user import UserInfo
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument('--iterations', type=int, default=2000)
+parser.add_argument('--concurrency', type=int, default=5)
+parser.add_argument('--user-id', type=int, default=1)
+parser.add_argument('--modes', nargs='+', default=['disabled', 'direct', 'pooler'])
+
+args = parser.parse_args()
+
+QueryT = Callable[[AsyncSession], Awaitable[Any]]
+
+
+def hot_queries() -> List[Tuple[str, QueryT]]:
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=30)
+
+    return [
+        ('get_statistics', lambda session: get_statistics(session, start_date, end_date, args.user_id)),
+        ('get_user_by_id', lambda session: get_user_by_id(session, args.user_id)),
+        ('get_or_create_user', lambda session: get_or_create_user(session, UserInfo(username=args.user_id))),
+    ]
+
+
+async def worker(
+    async_session: async_sessionmaker[AsyncSession],
+    query: QueryT,
+    iterations: int,
+    latencies: List[float],
+) -> None:
+    async with async_session() as session:
+        for _ in range(iterations):
+            start = perf_counter()
+            await query(session)
+            await session.commit()
+            latencies.append(perf_counter() - start)
+
+
+async def run(mode: str) -> None:
+    engine = create_engine(mode)
+    async_session = create_session(engine)
+
+    for name, query in hot_queries():
+        # warm up connections and caches
+        await worker(async_session, query, 10, [])
+
+        latencies: List[float] = []
+        iterations = args.iterations // args.concurrency
+
+        start = perf_counter()
+        await asyncio.gather(*(worker(async_session, query, iterations, latencies) for _ in range(args.concurrency)))
+        print_summary(f'{name} mode={mode}', summarize(latencies, perf_counter() - start))
+
+    await engine.dispose()
+
+
+async def main() -> None:
+    for mode in args.modes:
+        await run(mode)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta
+from random import choice, random, randrange
+from statistics import quantiles
+from typing import Dict, List, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from webapp.models.meta import DEFAULT_SCHEMA
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """Returns throughput and latency percentiles (in milliseconds) of a benchmark run."""
+    if len(latencies) < 2:
+        latencies = latencies * 2 or [0.0, 0.0]
+
+    percentiles = quantiles(latencies, n=100, method='inclusive')
+
+    return {
+        'count': len(latencies),
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentiles[49] * 1000,
+        'p95_ms': percentiles[94] * 1000,
+        'p99_ms': percentiles[98] * 1000,
+    }
+
+
+def print_summary(name: str, summary: Dict[str, float]) -> None:
+    print(
+        f'{name:<32} n={summary["count"]:<8.0f} rps={summary["rps"]:<10.1f} '
+        f'p50={summary["p50_ms"]:.2f}ms p95={summary["p95_ms"]:.2f}ms p99={summary["p99_ms"]:.2f}ms'
+    )
+
+
+async def seed_games(
+    engine: AsyncEngine,
+    user_ids: Sequence[int],
+    count: int,
+    start: datetime,
+    span: timedelta,
+    table: str = 'game',
+    chunk_size: int = 100_000,
+) -> None:
+    """Copies `count` random games of the users into sirius.<table>, spread evenly over `span` from `start`."""
+    step = span / count
+    columns = ['user_id', 'won', 'ships_sank', 'ships_destroyed', 'abandoned', 'timestamp']
+
+    async with engine.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        for offset in range(0, count, chunk_size):
+            records = [
+                (choice(user_ids), random() < 0.5, randrange(11), randrange(11), False, start + step * i)
+                for i in range(offset, min(offset + chunk_size, count))
+            ]
+            await driver_connection.copy_records_to_table(
+                table, records=records, columns=columns, schema_name=DEFAULT_SCHEMA
+            )
+
+        await driver_connection.execute(f'ANALYZE {DEFAULT_SCHEMA}.{table}')
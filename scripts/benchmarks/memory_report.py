@@ -0,0 +1,56 @@
+"""Heap bytes per live game and per saved copy of it, for every rule set, measured with tracemalloc.
+
+Live games are restored from their JSON state like a loaded game. `--top` lists the source
+lines holding most of the live games' memory.
+"""
+import argparse
+import tracemalloc
+
+import orjson
+
+from webapp.game.core import BattleShipGame
+from webapp.game.rules import RULES
+from webapp.utils.memory import build_game, measure_game
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument('--rules', nargs='+', choices=list(RULES), default=list(RULES))
+parser.add_argument('--struck-share', type=float, default=0.3, help='Share of the squares of both boards struck')
+parser.add_argument('--count', type=int, default=100, help='Games measured at once')
+parser.add_argument('--top', type=int, default=0, help='Print the source lines holding most of the live games')
+
+args = parser.parse_args()
+
+
+def print_top(game: BattleShipGame) -> None:
+    state = orjson.dumps(game.model_dump())
+    BattleShipGame.restore(orjson.loads(state))
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    games = [BattleShipGame.restore(orjson.loads(state)) for _ in range(args.count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    for stat in after.compare_to(before, 'lineno')[: args.top]:
+        frame = stat.traceback[0]
+        print(f'    {stat.size_diff / len(games):>10.0f} B  {frame.filename}:{frame.lineno}')
+
+
+def main() -> None:
+    print(f'{"rules":<10} {"live":>10} {"dumped":>10} {"serialized":>11} {"state":>10}')
+
+    for rules in args.rules:
+        game = build_game(rules, args.struck_share)
+        memory = measure_game(game, args.count)
+        print(
+            f'{rules:<10} {memory.live:>10.0f} {memory.dumped:>10.0f} '
+            f'{memory.serialized:>11.0f} {memory.state_size:>10}'
+        )
+
+        if args.top:
+            print_top(game)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import sys
+import asyncio
+import argparse
+from datetime import datetime
+
+from conf.config import settings
+from webapp.crud.stats import iter_games
+from webapp.db.postgres import async_session
+from webapp.utils.export import ENCODERS, GAME_COLUMNS
+
+parser = argparse.ArgumentParser(description='Streams sirius.game rows as CSV or NDJSON')
+
+parser.add_argument('--format', choices=ENCODERS.keys(), default='csv')
+parser.add_argument('--start-date', type=datetime.fromisoformat, default=None)
+parser.add_argument('--end-date', type=datetime.fromisoformat, default=None)
+parser.add_argument('--user-id', type=int, default=None)
+parser.add_argument('--fetch-size', type=int, default=settings.EXPORT_FETCH_SIZE)
+parser.add_argument('--output', default='-', help='Output file, stdout by default')
+
+args = parser.parse_args()
+
+
+async def main() -> None:
+    encoder, _ = ENCODERS[args.format]
+    output = sys.stdout.buffer if args.output == '-' else open(args.output, 'wb')
+
+    try:
+        async with async_session() as session:
+            rows = iter_games(session, args.fetch_size, args.start_date, args.end_date, args.user_id)
+            async for chunk in encoder(GAME_COLUMNS, rows):
+                output.write(chunk)
+    finally:
+        if output is not sys.stdout.buffer:
+            output.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+import gzip
+import asyncio
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import text
+
+from conf.config import settings
+from webapp.db.partitions import add_months, detach_game_partition, ensure_game_partitions, get_game_partitions
+from webapp.db.postgres import engine
+from webapp.models.meta import DEFAULT_SCHEMA
+
+parser = argparse.ArgumentParser(
+    description='Creates upcoming sirius.game partitions, archives and drops partitions older than retention'
+)
+
+parser.add_argument('--keep-months', type=int, default=settings.GAME_RETENTION_MONTHS)
+parser.add_argument('--archive-dir', type=Path, default=Path('archive'))
+parser.add_argument('--dry-run', action='store_true', help='Only print partitions which would be archived')
+
+args = parser.parse_args()
+
+
+async def archive_partition(name: str) -> Path:
+    """Exports the partition to a gzipped CSV file, then detaches and drops it.
+
+    Everything runs in one transaction, a failed export leaves the partition attached for the next run.
+    """
+    path = args.archive_dir / f'{name}.csv.gz'
+    # a partly written archive isn't mistaken for a complete one
+    partial_path = path.with_name(f'{path.name}.part')
+
+    async with engine.begin() as conn:
+        # no games are added to the partition after they are exported
+        await conn.execute(text(f'LOCK TABLE {DEFAULT_SCHEMA}.{name} IN SHARE MODE'))
+
+        raw_connection = await conn.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        with gzip.open(partial_path, 'wb') as file:
+
+            async def write(chunk: bytes) -> None:
+                file.write(chunk)
+
+            await driver_connection.copy_from_table(
+                name, schema_name=DEFAULT_SCHEMA, output=write, format='csv', header=True
+            )
+
+        partial_path.replace(path)
+
+        await detach_game_partition(conn, name)
+        await conn.execute(text(f'DROP TABLE {DEFAULT_SCHEMA}.{name}'))
+
+    return path
+
+
+async def main() -> None:
+    today = datetime.utcnow().date()
+    cutoff = add_months(today.replace(day=1), -args.keep_months)
+
+    async with engine.begin() as conn:
+        await ensure_game_partitions(conn, today)
+        partitions = await get_game_partitions(conn)
+
+    args.archive_dir.mkdir(parents=True, exist_ok=True)
+
+    for name, month in partitions:
+        if month >= cutoff:
+            break
+
+        if args.dry_run:
+            print(f'{name} would be archived')
+            continue
+
+        print(f'{name} archived to {await archive_partition(name)}')
+
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
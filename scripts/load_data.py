@@ -1,38 +1,215 @@
+import re
 import json
 import asyncio
 import argparse
-from datetime import datetime
+from datetime import date, datetime
+from itertools import islice
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List, TextIO, Tuple
 
-from sqlalchemy import insert
+from sqlalchemy import Column, Date, DateTime, Table
 
-from webapp.db.postgres import async_session
+from webapp.db.postgres import engine
 from webapp.models.meta import metadata
 
 parser = argparse.ArgumentParser()
 
 parser.add_argument('fixtures', nargs='+', help='<Required> Set flag')
+parser.add_argument('--chunk-size', type=int, default=10000, help='Rows sent per COPY')
+parser.add_argument('--parallel', action='store_true', help='Load independent tables concurrently')
 
 args = parser.parse_args()
 
+SEPARATORS = re.compile(r'[\s,]*')
+DELIMITERS = (' ', '\t', '\n', '\r', ',', ']')
 
-async def main(fixtures: List[str]) -> None:
-    for fixture in fixtures:
-        fixture_path = Path(fixture)
-        model = metadata.tables[fixture_path.stem]
 
-        with open(fixture_path, 'r') as file:
-            values = json.load(file)
+def iter_json_array(file: TextIO, read_size: int = 1 << 16) -> Iterator[Any]:
+    """Yields items of a top level JSON array without reading the whole file."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    eof = False
+
+    while not eof and not buffer.strip():
+        chunk = file.read(read_size)
+        eof = not chunk
+        buffer += chunk
+
+    buffer = buffer.lstrip()
+    if not buffer.startswith('['):
+        raise ValueError(f'{file.name} should contain a JSON array')
+
+    pos = 1
+
+    while True:
+        if not eof and len(buffer) - pos < read_size:
+            chunk = file.read(read_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+        pos = SEPARATORS.match(buffer, pos).end()  # type: ignore[union-attr]
+        if buffer.startswith(']', pos):
+            return
+
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            complete = False
+        else:
+            # a number cut by the end of the buffer may go on in the next chunk, so the value
+            # is complete once the delimiter after it is read
+            complete = eof or buffer[end : end + 1] in DELIMITERS
+
+        if not complete:
+            # the value is longer than the buffer
+            chunk = file.read(read_size)
+            eof = not chunk
+            buffer += chunk
+            continue
+
+        pos = end
+        yield value
+
+
+def get_columns(table: Table, row: Dict[str, Any]) -> List[Column[Any]]:
+    """Columns of the row plus columns filled by python side defaults, since COPY only applies server defaults."""
+    unknown = row.keys() - table.columns.keys()
+    if unknown:
+        raise ValueError(f'{table.fullname} has no columns {sorted(unknown)}')
+
+    return [column for column in table.columns if column.name in row or _has_python_default(column)]
+
+
+def _has_python_default(column: Column[Any]) -> bool:
+    return column.default is not None and (column.default.is_scalar or column.default.is_callable)
+
+
+def convert_row(columns: List[Column[Any]], row: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Values of the columns in the row, the columns are taken from the first row of the fixture.
+
+    Missing values are filled by python side defaults or are NULL as on insert, nullable columns
+    without a default only.
+    """
+    extra = row.keys() - {column.name for column in columns}
+    if extra:
+        raise ValueError(f'columns {sorted(extra)} are not in the first row')
+
+    values = []
+
+    for column in columns:
+        if column.name not in row:
+            default = column.default
+            if _has_python_default(column):
+                values.append(default.arg(None) if default.is_callable else default.arg)  # type: ignore[union-attr]
+            elif column.nullable and column.server_default is None:
+                values.append(None)
+            else:
+                raise ValueError(f'column {column.name} has no value nor default')
+            continue
+
+        value = row[column.name]
+        # Convert timestamp and date strings to datetime and date objects
+        if isinstance(value, str):
+            if isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column.type, Date):
+                value = date.fromisoformat(value)
+        values.append(value)
+
+    return tuple(values)
+
+
+def _convert_row(fixture_path: Path, columns: List[Column[Any]], index: int, row: Dict[str, Any]) -> Tuple[Any, ...]:
+    try:
+        return convert_row(columns, row)
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f'{fixture_path}: row {index}: {exc}') from exc
+
+
+async def load_fixture(fixture_path: Path) -> int:
+    table = metadata.tables[fixture_path.stem]
+    loaded = 0
+
+    with open(fixture_path, 'r') as file:
+        rows = iter_json_array(file)
+        first_row = next(rows, None)
+
+        if first_row is None:
+            return 0
+
+        columns = get_columns(table, first_row)
+        column_names = [column.name for column in columns]
+        records = (_convert_row(fixture_path, columns, index, row) for index, row in enumerate(rows, start=2))
+
+        async with engine.connect() as conn:
+            raw_connection = await conn.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+
+            async with driver_connection.transaction():
+                chunk = [_convert_row(fixture_path, columns, 1, first_row)]
+
+                while True:
+                    chunk.extend(islice(records, args.chunk_size - len(chunk)))
+                    if not chunk:
+                        break
+
+                    await driver_connection.copy_records_to_table(
+                        table.name,
+                        records=chunk,
+                        columns=column_names,
+                        schema_name=table.schema,
+                    )
+                    loaded += len(chunk)
+                    chunk = []
+
+                # ids were copied as is, move the sequence past them
+                if 'id' in column_names and table.c.id.autoincrement:
+                    table_name = f'{table.schema}."{table.name}"'
+                    await driver_connection.execute(
+                        f"SELECT setval(pg_get_serial_sequence($1, 'id'), coalesce(max(id), 1)) FROM {table_name}",
+                        table_name,
+                    )
+
+    return loaded
+
+
+def group_by_dependencies(fixtures: List[Path]) -> List[List[Path]]:
+    """Splits fixtures into consecutive groups, tables within a group don't reference each other."""
+    tables = {fixture: metadata.tables[fixture.stem] for fixture in fixtures}
+    loaded_tables = set(tables.values())
+    levels: Dict[Table, int] = {}
+
+    for table in metadata.sorted_tables:
+        levels[table] = max(
+            (
+                levels[fk.column.table] + 1
+                for fk in table.foreign_keys
+                if fk.column.table in loaded_tables and fk.column.table is not table
+            ),
+            default=0,
+        )
+
+    groups: List[List[Path]] = [[] for _ in range(max(levels[table] for table in tables.values()) + 1)]
+    for fixture, table in tables.items():
+        groups[levels[table]].append(fixture)
+
+    return [group for group in groups if group]
+
+
+async def main(fixtures: List[str]) -> None:
+    for group in group_by_dependencies([Path(fixture) for fixture in fixtures]):
+        if args.parallel:
+            counts = await asyncio.gather(*(load_fixture(fixture) for fixture in group))
+        else:
+            counts = [await load_fixture(fixture) for fixture in group]
 
-        # Convert timestamp strings datetime objects
-        for value in values:
-            if 'timestamp' in value:
-                value['timestamp'] = datetime.strptime(value['timestamp'], '%Y-%m-%d %H:%M:%S.%f')
+        for fixture, count in zip(group, counts):
+            print(f'{fixture}: {count} rows loaded')
 
-        async with async_session() as session:
-            await session.execute(insert(model).values(values))
-            await session.commit()
+    await engine.dispose()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,32 @@
+from collections import defaultdict
+from time import perf_counter
+from typing import Any, Dict, List
+
+from httpx import AsyncClient, HTTPError
+
+
+class LoadClient:
+    """Records latency and errors of every request per endpoint."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def request(self, method: str, url: str, token: str | None = None, **kwargs: Any) -> Any:
+        """Returns the response JSON, None if the request failed."""
+        headers = {'Authorization': f'Bearer {token}'} if token else None
+
+        start = perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+        except HTTPError:
+            self.errors[url] += 1
+            return None
+        self.latencies[url].append(perf_counter() - start)
+
+        if response.is_error:
+            self.errors[url] += 1
+            return None
+
+        return response.json()
@@ -0,0 +1,41 @@
+"""Compares two load test reports written by scripts/loadtest/run.py."""
+import argparse
+
+import orjson
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument('baseline')
+parser.add_argument('candidate')
+
+args = parser.parse_args()
+
+METRICS = ('rps', 'p50_ms', 'p95_ms', 'p99_ms', 'error_rate')
+
+
+def format_change(before: float, after: float) -> str:
+    if not before:
+        return f'{before:.2f} -> {after:.2f}'
+    return f'{before:.2f} -> {after:.2f} ({(after - before) / before:+.1%})'
+
+
+def main() -> None:
+    with open(args.baseline, 'rb') as file:
+        baseline = orjson.loads(file.read())
+    with open(args.candidate, 'rb') as file:
+        candidate = orjson.loads(file.read())
+
+    print(f'{baseline["revision"]} -> {candidate["revision"]}')
+    print(f'{"total":<28} rps {format_change(baseline["rps"], candidate["rps"])}')
+
+    for url, after in candidate['endpoints'].items():
+        before = baseline['endpoints'].get(url)
+        if before is None:
+            continue
+
+        changes = '  '.join(f'{metric} {format_change(before[metric], after[metric])}' for metric in METRICS)
+        print(f'{url:<28} {changes}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Plays full games of many concurrent users against the real ASGI app.
+
+Every user logs in and plays `--games` games: create_game, create_random_ships,
+alternating strikes and save_data. Postgres is the configured one, migrated
+by scripts/migrate.py beforehand. Redis is an in-process fakeredis unless
+--redis real is given.
+
+Prints per endpoint latency percentiles, request and error rates, and writes
+them to --output as JSON to compare runs with scripts/loadtest/compare.py.
+"""
+import asyncio
+import argparse
+import subprocess
+from random import Random
+from time import perf_counter
+from typing import Any, Dict
+
+import orjson
+from fakeredis.aioredis import FakeRedis
+from httpx import ASGITransport, AsyncClient
+
+from scripts.benchmarks.common import print_summary, summarize
+from scripts.loadtest.client import LoadClient
+from scripts.loadtest.scenarios import login, play_game
+
+from webapp.db import redis
+from webapp.db.postgres import engine
+from webapp.main import create_app
+from webapp.on_startup.redis import start_redis
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument('--users', type=int, default=50, help='Concurrent users')
+parser.add_argument('--games', type=int, default=5, help='Games played by every user')
+parser.add_argument('--redis', choices=('fake', 'real'), default='fake')
+parser.add_argument('--seed', type=int, default=0)
+parser.add_argument('--output', default='loadtest.json')
+
+args = parser.parse_args()
+
+
+async def run_user(client: LoadClient, username: int, rng: Random) -> int:
+    """Returns the number of games the user couldn't finish."""
+    token = await login(client, username)
+    if token is None:
+        return args.games
+
+    return sum([not await play_game(client, token, rng) for _ in range(args.games)])
+
+
+def get_revision() -> str | None:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(client: LoadClient, elapsed: float, failed_games: int) -> Dict[str, Any]:
+    endpoints = {}
+
+    for url, latencies in sorted(client.latencies.items()):
+        summary = summarize(latencies, elapsed)
+        summary['errors'] = client.errors[url]
+        summary['error_rate'] = client.errors[url] / len(latencies)
+        endpoints[url] = summary
+
+    requests = sum(len(latencies) for latencies in client.latencies.values())
+    errors = sum(client.errors.values())
+
+    return {
+        'revision': get_revision(),
+        'users': args.users,
+        'games': args.users * args.games,
+        'failed_games': failed_games,
+        'redis': args.redis,
+        'elapsed_s': elapsed,
+        'rps': requests / elapsed,
+        'error_rate': errors / requests if requests else 0.0,
+        'endpoints': endpoints,
+    }
+
+
+async def main() -> None:
+    if args.redis == 'fake':
+        redis.redis = FakeRedis()
+    else:
+        await start_redis()
+
+    app = create_app()
+    base_username = Random(args.seed).randint(10**9, 10**10)
+
+    # unhandled exceptions of the app are counted as 500 errors instead of stopping the run
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+
+    async with AsyncClient(transport=transport, base_url='http://loadtest') as http_client:
+        client = LoadClient(http_client)
+
+        start = perf_counter()
+        failed = await asyncio.gather(
+            *(run_user(client, base_username + i, Random(args.seed + i)) for i in range(args.users))
+        )
+        elapsed = perf_counter() - start
+
+    await engine.dispose()
+
+    report = build_report(client, elapsed, sum(failed))
+
+    for url, summary in report['endpoints'].items():
+        print_summary(url, summary)
+    print(f'total rps={report["rps"]:.1f} error_rate={report["error_rate"]:.2%} failed_games={report["failed_games"]}')
+
+    with open(args.output, 'wb') as file:
+        file.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,43 @@
+from random import Random
+
+from scripts.loadtest.client import LoadClient
+
+BOARD_SIZE = 10
+
+
+async def login(client: LoadClient, username: int) -> str | None:
+    data = await client.request('POST', '/auth/login', json={'username': username})
+    return data['access_token'] if data else None
+
+
+async def play_game(client: LoadClient, token: str, rng: Random) -> bool:
+    """Plays a whole game with random strikes and saves it, returns False if it had to be abandoned."""
+    if await client.request('POST', '/game/create_game', token) is None:
+        return False
+    if await client.request('POST', '/game/create_random_ships', token) is None:
+        return False
+
+    targets = [(x, y) for x in range(BOARD_SIZE) for y in range(BOARD_SIZE)]
+    rng.shuffle(targets)
+
+    finished = False
+    while not finished and targets:
+        data = await client.request('POST', '/game/player_strike', token, json={'coord': targets.pop()})
+        if data is None:
+            return False
+
+        finished = data['data']['finished']
+        if finished or data['data']['status'] != 'miss':
+            continue
+
+        # the AI strikes until it misses
+        while not finished:
+            data = await client.request('POST', '/game/ai_strike', token)
+            if data is None:
+                return False
+
+            finished = data['data']['finished']
+            if data['data']['status'] == 'miss':
+                break
+
+    return await client.request('POST', '/stats/save_data', token) is not None
@@ -1,5 +1,7 @@
 import asyncio
+from datetime import datetime
 
+from webapp.db.partitions import ensure_game_partitions
 from webapp.db.postgres import engine
 from webapp.models.meta import metadata
 
@@ -7,6 +9,7 @@ from webapp.models.meta import metadata
 async def main() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(metadata.create_all)
+        await ensure_game_partitions(conn, datetime.utcnow().date())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,34 @@
+import asyncio
+import argparse
+from datetime import datetime
+
+from webapp.cache.leaderboard import PERIODS, get_period_key, get_period_start, rebuild_leaderboard
+from webapp.crud.stats import iter_leaderboard_totals
+from webapp.db.postgres import async_session
+from webapp.on_startup.redis import start_redis
+
+parser = argparse.ArgumentParser(description='Rebuilds current leaderboards from sirius.game_daily_stats')
+
+parser.add_argument('--periods', nargs='+', choices=PERIODS, default=list(PERIODS))
+
+args = parser.parse_args()
+
+
+async def main() -> None:
+    await start_redis()
+    today = datetime.utcnow().date()
+
+    for period in args.periods:
+        period_key = get_period_key(period, today)
+
+        async with async_session() as session:
+            users = await rebuild_leaderboard(
+                period_key,
+                iter_leaderboard_totals(session, get_period_start(period, today)),
+            )
+
+        print(f'{period_key}: {users} users')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,21 @@
+import asyncio
+import argparse
+from datetime import date
+
+from webapp.crud.stats import rebuild_daily_stats
+from webapp.db.postgres import async_session
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument('--since', type=date.fromisoformat, default=None, help='Rebuild days starting from YYYY-MM-DD')
+
+args = parser.parse_args()
+
+
+async def main(since: date | None) -> None:
+    async with async_session() as session:
+        await rebuild_daily_stats(session, since)
+
+
+if __name__ == '__main__':
+    asyncio.run(main(args.since))
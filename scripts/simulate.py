@@ -0,0 +1,85 @@
+"""Plays AI-vs-AI games in memory on all cores and prints win rates, game lengths and move timings.
+
+Results only depend on --seed, not on --workers or --chunk-size.
+"""
+import os
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from statistics import quantiles
+from time import perf_counter
+from typing import Any, Dict
+
+import orjson
+
+from webapp.game.rules import DEFAULT_RULES, RULES
+from webapp.game.simulation import SimulationStats, run_games
+from webapp.game.strategies import STRATEGIES
+
+parser = argparse.ArgumentParser()
+
+parser.add_argument('--games', type=int, default=10000)
+parser.add_argument('--strategies', nargs=2, choices=list(STRATEGIES), default=['weighted', 'random'])
+parser.add_argument('--seed', type=int, default=0)
+parser.add_argument('--rules', choices=list(RULES), default=DEFAULT_RULES)
+parser.add_argument('--workers', type=int, default=os.cpu_count())
+parser.add_argument('--chunk-size', type=int, default=500, help='Games played by a worker per task')
+parser.add_argument('--output', help='Write the results as JSON')
+
+args = parser.parse_args()
+
+
+def build_report(stats: SimulationStats, elapsed: float) -> Dict[str, Any]:
+    lengths = sorted(stats.lengths.elements())
+    percentiles = quantiles(lengths, n=100, method='inclusive') if len(lengths) > 1 else lengths * 99
+
+    return {
+        'games': stats.games,
+        'seed': args.seed,
+        'rules': args.rules,
+        'games_per_second': stats.games / elapsed,
+        'win_rate': {name: stats.wins[name] / stats.games for name in args.strategies},
+        'length': {
+            'min': lengths[0],
+            'p50': percentiles[49],
+            'p95': percentiles[94],
+            'max': lengths[-1],
+            'histogram': dict(sorted(stats.lengths.items())),
+        },
+        'move_us': {
+            name: stats.move_time[name] / stats.move_count[name] * 1_000_000
+            for name in args.strategies
+            if stats.move_count[name]
+        },
+    }
+
+
+def main() -> None:
+    stats = SimulationStats()
+    strategies = (args.strategies[0], args.strategies[1])
+    start = perf_counter()
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [
+            executor.submit(
+                run_games, first, min(args.chunk_size, args.games - first), strategies, args.seed, args.rules
+            )
+            for first in range(0, args.games, args.chunk_size)
+        ]
+        for future in futures:
+            stats.merge(future.result())
+
+    report = build_report(stats, perf_counter() - start)
+
+    print(f'{report["games"]} games, {report["games_per_second"]:.0f} games/s')
+    for name in args.strategies:
+        print(f'{name:<10} win rate={report["win_rate"][name]:.2%} move={report["move_us"].get(name, 0):.1f}us')
+    length = report['length']
+    print(f'game length min={length["min"]} p50={length["p50"]:.0f} p95={length["p95"]:.0f} max={length["max"]}')
+
+    if args.output:
+        with open(args.output, 'wb') as file:
+            file.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+
+if __name__ == '__main__':
+    main()
@@ -8,5 +8,8 @@ python scripts/migrate.py
 # load fixtures
 python scripts/load_data.py fixture/sirius/sirius.user.json fixture/sirius/sirius.game.json
 
+# build stats rollups of loaded games
+python scripts/rebuild_rollups.py
+
 
 exec uvicorn webapp.main:create_app --host=$BIND_IP --port=$BIND_PORT
@@ -0,0 +1,134 @@
+import csv
+from pathlib import Path
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+
+from conf.config import settings
+from webapp.utils.export import GAME_COLUMNS
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+ADMIN_USER_ID = 1
+
+
+@pytest.fixture(autouse=True)
+def _admin_user(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'ADMIN_USER_IDS', [ADMIN_USER_ID])
+
+
+def _parse(export_format: str, content: bytes) -> List[Dict[str, Any]]:
+    if export_format == 'csv':
+        reader = csv.DictReader(content.decode().splitlines())
+        assert tuple(reader.fieldnames or ()) == GAME_COLUMNS
+        return list(reader)
+
+    return [orjson.loads(line) for line in content.splitlines()]
+
+
+@pytest.mark.parametrize(
+    ('username', 'params', 'expected_timestamps', 'fixtures'),
+    [
+        (
+            1234567,
+            {'format': 'csv'},
+            ['2024-03-20T13:16:24.599959', '2024-04-12T13:16:24.599959', '2024-04-16T13:16:24.599959'],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.game.json',
+            ],
+        ),
+        (
+            1234567,
+            {'format': 'ndjson', 'user_id': 1},
+            ['2024-03-20T13:16:24.599959', '2024-04-12T13:16:24.599959'],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.game.json',
+            ],
+        ),
+        (
+            1234567,
+            # both dates are inclusive
+            {'format': 'ndjson', 'start_date': '2024-04-12T13:16:24.599959', 'end_date': '2024-04-16T13:16:24.599959'},
+            ['2024-04-12T13:16:24.599959', '2024-04-16T13:16:24.599959'],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.game.json',
+            ],
+        ),
+        (
+            1234567,
+            {'format': 'csv', 'start_date': '2024-04-13T00:00:00', 'end_date': '2024-04-16T00:00:00'},
+            [],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.game.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_export_games(
+    client: AsyncClient,
+    username: int,
+    params: Dict[str, Any],
+    expected_timestamps: List[str],
+    access_token: str,
+) -> None:
+    response = await client.get(
+        URLS['admin']['export_games'],
+        params=params,
+        headers={'Authorization': f'Bearer {access_token}'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-disposition'] == f'attachment; filename="games.{params["format"]}"'
+
+    games = _parse(params['format'], response.content)
+    assert sorted(game['timestamp'] for game in games) == expected_timestamps
+
+
+@pytest.mark.parametrize(
+    ('username', 'headers', 'expected_status', 'fixtures'),
+    [
+        (
+            2345678,
+            None,
+            status.HTTP_403_FORBIDDEN,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            2345678,
+            {'Authorization': 'Bearer invalid'},
+            status.HTTP_403_FORBIDDEN,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_export_games_not_admin(
+    client: AsyncClient,
+    username: int,
+    headers: Dict[str, str] | None,
+    expected_status: int,
+    access_token: str,
+) -> None:
+    response = await client.get(
+        URLS['admin']['export_games'],
+        headers=headers or {'Authorization': f'Bearer {access_token}'},
+    )
+
+    assert response.status_code == expected_status
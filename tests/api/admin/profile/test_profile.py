@@ -0,0 +1,151 @@
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+
+from conf.config import settings
+from webapp.api.admin.profile import profiler_lock
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+ADMIN_USER_ID = 1
+# short enough to keep the tests fast, the sampler still takes a few samples
+SECONDS = 0.05
+INTERVAL = 0.005
+
+
+@pytest.fixture(autouse=True)
+def _admin_user(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'ADMIN_USER_IDS', [ADMIN_USER_ID])
+
+
+@pytest.mark.parametrize(
+    ('username', 'profile_format', 'fixtures'),
+    [
+        (
+            1234567,
+            'collapsed',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            'speedscope',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_profile(
+    client: AsyncClient,
+    username: int,
+    profile_format: str,
+    access_token: str,
+) -> None:
+    response = await client.get(
+        URLS['admin']['profile'],
+        params={'seconds': SECONDS, 'interval': INTERVAL, 'format': profile_format},
+        headers={'Authorization': f'Bearer {access_token}'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['x-worker-pid'] == str(os.getpid())
+    assert not profiler_lock.locked()
+
+    if profile_format == 'collapsed':
+        stacks = [line.rsplit(' ', 1) for line in response.text.splitlines()]
+        assert stacks
+        assert all(int(count) > 0 for _, count in stacks)
+        return
+
+    assert response.headers['content-disposition'] == f'attachment; filename="profile-{os.getpid()}.speedscope.json"'
+    profile = response.json()['profiles'][0]
+    assert profile['type'] == 'sampled'
+    assert len(profile['samples']) == len(profile['weights']) > 0
+    assert max(index for stack in profile['samples'] for index in stack) < len(response.json()['shared']['frames'])
+
+
+@pytest.mark.parametrize(
+    ('username', 'fixtures'),
+    [
+        (
+            1234567,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_profile_already_running(
+    client: AsyncClient,
+    username: int,
+    access_token: str,
+) -> None:
+    async with profiler_lock:
+        response = await client.get(
+            URLS['admin']['profile'],
+            params={'seconds': SECONDS},
+            headers={'Authorization': f'Bearer {access_token}'},
+        )
+
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.parametrize(
+    ('username', 'params', 'expected_status', 'fixtures'),
+    [
+        (
+            2345678,
+            {'seconds': SECONDS},
+            status.HTTP_403_FORBIDDEN,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            {'seconds': settings.PROFILER_MAX_SECONDS + 1},
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            {'seconds': SECONDS, 'interval': 0},
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_profile_rejected(
+    client: AsyncClient,
+    username: int,
+    params: Dict[str, Any],
+    expected_status: int,
+    access_token: str,
+) -> None:
+    response = await client.get(
+        URLS['admin']['profile'],
+        params=params,
+        headers={'Authorization': f'Bearer {access_token}'},
+    )
+
+    assert response.status_code == expected_status
+    assert not profiler_lock.locked()
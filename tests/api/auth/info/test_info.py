@@ -33,3 +33,4 @@ async def test_info(
     response = await client.post(URLS['auth']['info'], headers={'Authorization': f'Bearer {access_token}'})
 
     assert response.status_code == expected_status
+    assert 'auth;dur=' in response.headers['Server-Timing']
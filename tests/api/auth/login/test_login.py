@@ -9,6 +9,7 @@ from starlette import status
 from tests.const import URLS
 
 from conf.config import settings
+from webapp.api.login.login import user_id_cache
 
 BASE_DIR = Path(__file__).parent
 FIXTURES_PATH = BASE_DIR / 'fixtures'
@@ -53,3 +54,37 @@ async def test_login(
         assert expected_access_token
     except (JWTError, KeyError):
         assert not expected_access_token
+
+
+@pytest.mark.parametrize(
+    ('username', 'fixtures'),
+    [
+        (
+            1234567,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1853,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_login_same_user(
+    client: AsyncClient,
+    username: int,
+    db_session: None,
+) -> None:
+    user_ids = []
+
+    for _ in range(2):
+        user_id_cache.clear()
+        response = await client.post(URLS['auth']['login'], json={'username': username})
+        user_ids.append(jwt.decode(response.json()['access_token'], settings.JWT_SECRET_SALT)['user_id'])
+
+    assert user_ids[0] == user_ids[1]
@@ -1,17 +1,20 @@
 import json
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import AsyncGenerator, List
 
 import pytest
+from fakeredis.aioredis import FakeRedis
 from fastapi import FastAPI
 from httpx import AsyncClient
-from sqlalchemy import insert
+from sqlalchemy import Date, insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from tests.const import URLS
 from tests.mocking.redis import TestRedisClient
 
+from webapp.api.login.login import user_id_cache
+from webapp.db import redis as redis_module
 from webapp.db.postgres import engine, get_session
 from webapp.db.redis import get_redis
 from webapp.models.meta import metadata
@@ -39,6 +42,12 @@ async def db_session(app: FastAPI) -> AsyncGenerator[AsyncSession, None]:
         await connection.rollback()
 
 
+@pytest.fixture(autouse=True)
+def _clear_user_id_cache() -> None:
+    # users are rolled back after each test, so their ids must not outlive it
+    user_id_cache.clear()
+
+
 @pytest.fixture()
 async def _load_fixtures(db_session: AsyncSession, fixtures: List[Path]) -> None:
     for fixture in fixtures:
@@ -51,6 +60,8 @@ async def _load_fixtures(db_session: AsyncSession, fixtures: List[Path]) -> None
             for key, val in model_obj.items():
                 if 'timestamp' in key:
                     model_obj[key] = datetime.strptime(val, '%Y-%m-%d %H:%M:%S.%f')
+                elif isinstance(model.c[key].type, Date):
+                    model_obj[key] = date.fromisoformat(val)
 
         await db_session.execute(insert(model).values(values))
         await db_session.commit()
@@ -60,10 +71,28 @@ async def _load_fixtures(db_session: AsyncSession, fixtures: List[Path]) -> None
 
 @pytest.fixture()
 def _mock_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    # storages are class attributes, so every test starts with its own
+    monkeypatch.setattr(TestRedisClient, 'redis_storage', {})
+    monkeypatch.setattr(TestRedisClient, 'redis_sorted_sets', {})
+    monkeypatch.setattr(TestRedisClient, 'redis_streams', {})
+
     redis = get_redis()
     monkeypatch.setattr(redis, 'set', TestRedisClient.set)
     monkeypatch.setattr(redis, 'get', TestRedisClient.get)
+    monkeypatch.setattr(redis, 'getdel', TestRedisClient.getdel)
     monkeypatch.setattr(redis, 'delete', TestRedisClient.delete)
+    monkeypatch.setattr(redis, 'zadd', TestRedisClient.zadd)
+    monkeypatch.setattr(redis, 'zrem', TestRedisClient.zrem)
+    monkeypatch.setattr(redis, 'xadd', TestRedisClient.xadd)
+    monkeypatch.setattr(redis, 'xrange', TestRedisClient.xrange)
+    monkeypatch.setattr(redis, 'expire', TestRedisClient.expire)
+    monkeypatch.setattr(redis, 'pipeline', TestRedisClient.pipeline)
+
+
+@pytest.fixture()
+def _fake_redis(monkeypatch: pytest.MonkeyPatch) -> None:
+    # for endpoints relying on Lua scripts, which TestRedisClient can't run
+    monkeypatch.setattr(redis_module, 'redis', FakeRedis())
 
 
 @pytest.fixture()
@@ -0,0 +1,117 @@
+from pathlib import Path
+from typing import Any, Dict
+
+import orjson
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+from tests.mocking.redis import TestRedisClient
+
+from webapp.cache.key_builder import get_cache_key
+from webapp.game.core import BattleShipGame
+from webapp.game.rules import RULES
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+USER_ID = 1
+
+
+@pytest.mark.parametrize(
+    ('username', 'body', 'expected_rules', 'expected_strategy', 'fixtures'),
+    [
+        (
+            1234567,
+            None,
+            'classic',
+            'weighted',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            {'rules': 'large', 'ai_strategy': 'density'},
+            'large',
+            'density',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            {'rules': 'huge'},
+            'huge',
+            'weighted',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture')
+async def test_create_game(
+    client: AsyncClient,
+    username: int,
+    body: Dict[str, Any] | None,
+    expected_rules: str,
+    expected_strategy: str,
+    access_token: str,
+) -> None:
+    response = await client.post(
+        URLS['game']['create_game'],
+        json=body,
+        headers={'Authorization': f'Bearer {access_token}'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+
+    game = BattleShipGame.restore(
+        orjson.loads(TestRedisClient.redis_storage[get_cache_key(BattleShipGame.__name__, USER_ID)])
+    )
+    rules = RULES[expected_rules]
+    assert game.rules == expected_rules
+    assert game.ai_strategy == expected_strategy
+    assert game.player.board.lines_cnt == game.player.board.rows_cnt == rules.size
+    assert sorted(ship.length for ship in game.ai.board.ships) == sorted(rules.ship_types)
+    assert not game.player.board.ships
+
+
+@pytest.mark.parametrize(
+    ('username', 'body', 'fixtures'),
+    [
+        (
+            1234567,
+            {'rules': 'tiny'},
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            {'ai_strategy': 'cheating'},
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture')
+async def test_create_game_invalid(
+    client: AsyncClient,
+    username: int,
+    body: Dict[str, Any],
+    access_token: str,
+) -> None:
+    response = await client.post(
+        URLS['game']['create_game'],
+        json=body,
+        headers={'Authorization': f'Bearer {access_token}'},
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert not TestRedisClient.redis_storage
@@ -0,0 +1,174 @@
+from pathlib import Path
+from typing import Dict, Tuple
+
+import orjson
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from starlette import status
+
+from tests.const import URLS
+from tests.mocking.redis import TestRedisClient
+
+from conf.config import settings
+from webapp.cache.ai_move import AI_MOVE
+from webapp.cache.cache import redis_set
+from webapp.cache.key_builder import get_ai_move_key, get_cache_key
+from webapp.game import operations
+from webapp.game.core import BattleShipGame
+from webapp.game.rng import MASK
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+USER_ID = 1
+SEED = 42
+
+
+@pytest.fixture()
+def _precompute(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'AI_MOVE_PRECOMPUTE', True)
+    monkeypatch.setattr(settings, 'ENGINE_EXECUTOR', 'inline')
+
+
+def _create_game() -> BattleShipGame:
+    game = BattleShipGame.new(USER_ID, seed=SEED)
+    game.setup_random_ships(game.ai)
+    game.setup_random_ships(game.player)
+    return game
+
+
+def _saved_game() -> BattleShipGame:
+    return BattleShipGame.restore(
+        orjson.loads(TestRedisClient.redis_storage[get_cache_key(BattleShipGame.__name__, USER_ID)])
+    )
+
+
+def _empty_square(game: BattleShipGame) -> Tuple[int, int]:
+    """A square without the AI's ship, so striking it is a miss."""
+    return next(coord for coord in game.ai.board.coords if game.ai.board.get_ship(coord) is None)
+
+
+def _precomputed_count(outcome: str) -> float:
+    return REGISTRY.get_sample_value('engine_ai_move_precomputed_total', {'outcome': outcome}) or 0
+
+
+async def _player_miss(client: AsyncClient, headers: Dict[str, str]) -> BattleShipGame:
+    game = _create_game()
+    await redis_set(BattleShipGame.__name__, USER_ID, game.model_dump())
+
+    response = await client.post(URLS['game']['player_strike'], json={'coord': _empty_square(game)}, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['data']['status'] == 'miss'
+
+    return _saved_game()
+
+
+@pytest.mark.parametrize(
+    ('username', 'fixtures'),
+    [
+        (
+            1234567,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture', '_precompute')
+async def test_precomputed_move_used(
+    client: AsyncClient,
+    username: int,
+    access_token: str,
+) -> None:
+    headers = {'Authorization': f'Bearer {access_token}'}
+    game = await _player_miss(client, headers)
+
+    # the move saved after the miss is the one the AI would choose
+    coord, rng_after = operations.choose_ai_target(game.model_copy(deep=True))
+    stored = AI_MOVE.unpack(TestRedisClient.redis_storage[get_ai_move_key(USER_ID)])
+    assert stored == (game.moves_count, game.rng.state, rng_after, *coord)
+
+    # another target, so the strike shows the stored move was applied instead of a new one
+    planted = next(square for square in game.player.board.coords if square != coord)
+    planted_rng = (rng_after + 1) & MASK
+    TestRedisClient.redis_storage[get_ai_move_key(USER_ID)] = AI_MOVE.pack(
+        game.moves_count, game.rng.state, planted_rng, *planted
+    )
+    used = _precomputed_count('used')
+
+    response = await client.post(URLS['game']['ai_strike'], headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    saved = _saved_game()
+    assert saved.player.board.get_state(planted) != game.player.board.get_state(planted)
+    assert saved.player.board.get_state(coord) == game.player.board.get_state(coord)
+    assert saved.rng.state == planted_rng
+    assert _precomputed_count('used') == used + 1
+
+
+@pytest.mark.parametrize(
+    ('username', 'stale_field', 'fixtures'),
+    [
+        (
+            1234567,
+            'moves_count',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            'rng_state',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            None,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture', '_precompute')
+async def test_precomputed_move_ignored(
+    client: AsyncClient,
+    username: int,
+    stale_field: str | None,
+    access_token: str,
+) -> None:
+    headers = {'Authorization': f'Bearer {access_token}'}
+    game = await _player_miss(client, headers)
+    key = get_ai_move_key(USER_ID)
+
+    expected = game.model_copy(deep=True)
+    coord, _, _, _ = operations.ai_strike(expected)
+    planted = next(square for square in game.player.board.coords if square != coord)
+
+    if stale_field is None:
+        del TestRedisClient.redis_storage[key]
+        outcome = 'missing'
+    else:
+        moves_count, rng_state = game.moves_count, game.rng.state
+        if stale_field == 'moves_count':
+            moves_count -= 1
+        else:
+            rng_state = (rng_state + 1) & MASK
+        TestRedisClient.redis_storage[key] = AI_MOVE.pack(moves_count, rng_state, 1, *planted)
+        outcome = 'stale'
+    count = _precomputed_count(outcome)
+
+    response = await client.post(URLS['game']['ai_strike'], headers=headers)
+
+    # the target is chosen inline, as on a game without a stored move
+    assert response.status_code == status.HTTP_200_OK
+    saved = _saved_game()
+    assert saved.player.board.get_state(coord) == expected.player.board.get_state(coord)
+    assert saved.player.board.get_state(planted) == game.player.board.get_state(planted)
+    assert saved.rng.state == expected.rng.state
+    assert _precomputed_count(outcome) == count + 1
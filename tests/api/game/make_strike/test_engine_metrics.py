@@ -0,0 +1,138 @@
+from pathlib import Path
+from typing import Dict, Tuple
+
+import orjson
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from starlette import status
+
+from tests.const import URLS
+from tests.mocking.redis import TestRedisClient
+
+from conf.config import settings
+from webapp.cache.cache import redis_set
+from webapp.cache.key_builder import get_cache_key
+from webapp.game.core import BattleShipGame
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+USER_ID = 1
+SEED = 42
+
+
+@pytest.fixture()
+def _inline_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'ENGINE_EXECUTOR', 'inline')
+    # the AI's target is chosen by ai_strike
+    monkeypatch.setattr(settings, 'AI_MOVE_PRECOMPUTE', False)
+
+
+def _value(name: str, labels: Dict[str, str] | None = None) -> float:
+    return REGISTRY.get_sample_value(name, labels or {}) or 0
+
+
+def _saved_game() -> BattleShipGame:
+    return BattleShipGame.restore(
+        orjson.loads(TestRedisClient.redis_storage[get_cache_key(BattleShipGame.__name__, USER_ID)])
+    )
+
+
+def _empty_square(game: BattleShipGame) -> Tuple[int, int]:
+    """A square without the AI's ship, so striking it is a miss."""
+    return next(coord for coord in game.ai.board.coords if game.ai.board.get_ship(coord) is None)
+
+
+@pytest.mark.parametrize(
+    ('username', 'fixtures'),
+    [
+        (
+            1234567,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture', '_inline_engine')
+async def test_engine_metrics(
+    client: AsyncClient,
+    username: int,
+    access_token: str,
+) -> None:
+    headers = {'Authorization': f'Bearer {access_token}'}
+    player_hits = {'actor': 'player', 'result': 'hit'}
+    # the player's board is empty, so the AI misses
+    ai_misses = {'actor': 'ai', 'result': 'miss'}
+    before = {
+        'retries': _value('engine_placement_retries_count'),
+        'target': _value('engine_ai_target_latency_seconds_count'),
+        'player_hits': _value('engine_strikes_total', player_hits),
+        'ai_misses': _value('engine_strikes_total', ai_misses),
+        'state_size': _value('engine_game_state_bytes_count'),
+    }
+
+    response = await client.post(URLS['game']['create_game'], headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    # the AI's ships are placed by create_game
+    assert _value('engine_placement_retries_count') == before['retries'] + 1
+
+    coord = _saved_game().ai.board.ships[0].coords[0]
+    response = await client.post(URLS['game']['player_strike'], json={'coord': coord}, headers=headers)
+    assert response.json()['data']['status'] == 'hit'
+    assert _value('engine_strikes_total', player_hits) == before['player_hits'] + 1
+    # a hit keeps the turn, no target is chosen for the AI
+    assert _value('engine_ai_target_latency_seconds_count') == before['target']
+
+    response = await client.post(
+        URLS['game']['player_strike'], json={'coord': _empty_square(_saved_game())}, headers=headers
+    )
+    assert response.json()['data']['status'] == 'miss'
+
+    response = await client.post(URLS['game']['ai_strike'], headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert _value('engine_strikes_total', ai_misses) == before['ai_misses'] + 1
+    assert _value('engine_ai_target_latency_seconds_count') == before['target'] + 1
+    assert _value('engine_ai_target_latency_seconds_sum') > 0
+
+    # every request saved the game
+    assert _value('engine_game_state_bytes_count') == before['state_size'] + 4
+
+
+@pytest.mark.parametrize(
+    ('username', 'fixtures'),
+    [
+        (
+            1234567,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture', '_inline_engine')
+async def test_game_moves_metric(
+    client: AsyncClient,
+    username: int,
+    access_token: str,
+) -> None:
+    headers = {'Authorization': f'Bearer {access_token}'}
+    game = BattleShipGame.new(USER_ID, seed=SEED)
+    game.max_ship_count = game.ai.board.max_ship_count = 1
+    game.ai.board.create_ship([(0, 0)])
+    game.moves_count = 41
+    await redis_set(BattleShipGame.__name__, USER_ID, game.model_dump())
+    destroyed = {'actor': 'player', 'result': 'destroyed'}
+    strikes = _value('engine_strikes_total', destroyed)
+    games = _value('engine_game_moves_count', {'winner': 'player'})
+    in_bucket = _value('engine_game_moves_bucket', {'winner': 'player', 'le': '50.0'})
+
+    response = await client.post(URLS['game']['player_strike'], json={'coord': (0, 0)}, headers=headers)
+
+    assert response.json()['data']['finished'] is True
+    assert _value('engine_strikes_total', destroyed) == strikes + 1
+    assert _value('engine_game_moves_count', {'winner': 'player'}) == games + 1
+    assert _value('engine_game_moves_bucket', {'winner': 'player', 'le': '50.0'}) == in_bucket + 1
@@ -0,0 +1,150 @@
+from pathlib import Path
+from typing import Any, Generator, Tuple
+
+import orjson
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+
+from conf.config import settings
+from webapp.cache.cache import redis_set
+from webapp.game import operations
+from webapp.game.core import BattleShipGame
+from webapp.game.exceptions import SquareStrikedError
+from webapp.utils.executor import shutdown_executors
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+USER_ID = 1
+SEED = 42
+
+
+@pytest.fixture()
+def executor(monkeypatch: pytest.MonkeyPatch, engine_executor: str) -> Generator[str, None, None]:
+    monkeypatch.setattr(settings, 'ENGINE_EXECUTOR', engine_executor)
+    # every board is offloaded
+    monkeypatch.setattr(settings, 'ENGINE_OFFLOAD_MIN_CELLS', 0)
+    yield engine_executor
+    shutdown_executors()
+
+
+def _create_game() -> BattleShipGame:
+    game = BattleShipGame.new(USER_ID, seed=SEED)
+    game.setup_random_ships(game.ai)
+    game.setup_random_ships(game.player)
+    return game
+
+
+def _to_json(value: Any) -> Any:
+    return orjson.loads(orjson.dumps(value))
+
+
+def _ship_square(game: BattleShipGame) -> Tuple[int, int]:
+    """A square of the AI's longest ship, so striking it keeps the turn."""
+    return max(game.ai.board.ships, key=lambda ship: ship.length).coords[0]
+
+
+@pytest.mark.parametrize(
+    ('username', 'engine_executor', 'fixtures'),
+    [
+        (
+            1234567,
+            'inline',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            'thread',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            'process',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture', 'executor')
+async def test_make_strike(
+    client: AsyncClient,
+    username: int,
+    access_token: str,
+) -> None:
+    headers = {'Authorization': f'Bearer {access_token}'}
+    game = _create_game()
+    await redis_set(BattleShipGame.__name__, USER_ID, game.model_dump())
+    coord = _ship_square(game)
+
+    # the same strikes made inline on a copy of the game
+    result, ai_board = operations.player_strike(game, coord)
+    response = await client.post(URLS['game']['player_strike'], json={'coord': coord}, headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['data'] == {'status': result.value, 'ai_board': _to_json(ai_board), 'finished': False}
+
+    _, result, player_board, _ = operations.ai_strike(game)
+    response = await client.post(URLS['game']['ai_strike'], headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['data'] == {
+        'status': result.value,
+        'player_board': _to_json(player_board),
+        'finished': False,
+    }
+
+
+@pytest.mark.parametrize(
+    ('username', 'engine_executor', 'fixtures'),
+    [
+        (
+            1234567,
+            'inline',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            'thread',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            'process',
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture', 'executor')
+async def test_strike_struck_square(
+    client: AsyncClient,
+    username: int,
+    access_token: str,
+) -> None:
+    headers = {'Authorization': f'Bearer {access_token}'}
+    game = _create_game()
+    await redis_set(BattleShipGame.__name__, USER_ID, game.model_dump())
+    coord = _ship_square(game)
+
+    response = await client.post(URLS['game']['player_strike'], json={'coord': coord}, headers=headers)
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await client.post(URLS['game']['player_strike'], json={'coord': coord}, headers=headers)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()['detail'] == str(SquareStrikedError())
@@ -0,0 +1,129 @@
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import orjson
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+
+from webapp.cache.cache import redis_set
+from webapp.game import operations
+from webapp.game.core import BattleShipGame
+from webapp.game.square import SquareStatus
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+USER_ID = 1
+SEED = 42
+
+
+def _create_game() -> BattleShipGame:
+    game = BattleShipGame.new(USER_ID, seed=SEED)
+    game.setup_random_ships(game.ai)
+    game.setup_random_ships(game.player)
+    return game
+
+
+def _player_target(game: BattleShipGame, target: str) -> Tuple[int, int]:
+    """The first square of the AI's longest ship not struck yet, or the first free square."""
+    board = game.ai.board
+
+    if target == 'ship':
+        ship = max(board.ships, key=lambda ship: ship.length)
+        return next(coord for coord in ship.coords if board.get_state(coord) == SquareStatus.SHIP)
+
+    return next(coord for coord in board.coords if board.get_state(coord) == SquareStatus.EMPTY)
+
+
+@pytest.mark.parametrize(
+    ('username', 'strikes', 'fixtures'),
+    [
+        (
+            1234567,
+            [],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            ['empty', 'ai'],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            ['ship', 'ship', 'empty', 'ai'],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture')
+async def test_replay(
+    client: AsyncClient,
+    username: int,
+    strikes: List[str],
+    access_token: str,
+) -> None:
+    headers = {'Authorization': f'Bearer {access_token}'}
+    game = _create_game()
+    await redis_set(BattleShipGame.__name__, USER_ID, game.model_dump())
+
+    # the same strikes are made on a copy of the game to know the moves to be replayed
+    expected: List[Dict[str, Any]] = []
+    for strike in strikes:
+        if strike == 'ai':
+            coord, result, _, _ = operations.ai_strike(game)
+            response = await client.post(URLS['game']['ai_strike'], headers=headers)
+        else:
+            coord = _player_target(game, strike)
+            result, _ = operations.player_strike(game, coord)
+            response = await client.post(URLS['game']['player_strike'], json={'coord': coord}, headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['data']['status'] == result.value
+        expected.append({'actor': 'ai' if strike == 'ai' else 'player', 'coord': list(coord), 'result': result.value})
+
+    response = await client.get(URLS['game']['replay'], headers=headers)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    assert [orjson.loads(line) for line in response.content.splitlines()] == expected
+
+
+@pytest.mark.parametrize(
+    ('username', 'game_id', 'expected_status', 'fixtures'),
+    [
+        (
+            1234567,
+            1,
+            status.HTTP_404_NOT_FOUND,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture')
+async def test_replay_archived_not_found(
+    client: AsyncClient,
+    username: int,
+    game_id: int,
+    expected_status: int,
+    access_token: str,
+) -> None:
+    response = await client.get(
+        URLS['game']['replay'],
+        params={'game_id': game_id},
+        headers={'Authorization': f'Bearer {access_token}'},
+    )
+
+    assert response.status_code == expected_status
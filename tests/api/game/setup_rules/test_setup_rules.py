@@ -0,0 +1,83 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+
+from webapp.cache.cache import redis_set
+from webapp.game.core import BattleShipGame
+from webapp.game.rules import RulesName
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+USER_ID = 1
+
+
+@pytest.mark.parametrize(
+    ('username', 'rules', 'expected_size', 'expected_ship_types', 'fixtures'),
+    [
+        (
+            1234567,
+            'classic',
+            10,
+            [1, 1, 1, 1, 2, 2, 2, 3, 3, 4],
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            'large',
+            50,
+            [1] * 16 + [2] * 12 + [3] * 8 + [4] * 4,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture')
+async def test_setup_rules(
+    client: AsyncClient,
+    username: int,
+    rules: RulesName,
+    expected_size: int,
+    expected_ship_types: List[int],
+    access_token: str,
+) -> None:
+    await redis_set(BattleShipGame.__name__, USER_ID, BattleShipGame.new(USER_ID, rules).model_dump())
+
+    response = await client.get(URLS['game']['setup_rules'], headers={'Authorization': f'Bearer {access_token}'})
+
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()['data']
+    assert response_data['size'] == expected_size
+    assert sorted(response_data['ship_types']) == expected_ship_types
+
+
+@pytest.mark.parametrize(
+    ('username', 'fixtures'),
+    [
+        (
+            1234567,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_with_redis_fixture')
+async def test_setup_rules_no_game(
+    client: AsyncClient,
+    username: int,
+    access_token: str,
+) -> None:
+    response = await client.get(URLS['game']['setup_rules'], headers={'Authorization': f'Bearer {access_token}'})
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
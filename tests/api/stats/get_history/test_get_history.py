@@ -0,0 +1,116 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+
+@pytest.mark.parametrize(
+    ('username', 'limit', 'expected_pages', 'expected_status', 'fixtures'),
+    [
+        (
+            1234567,
+            10,
+            [
+                [
+                    '2024-04-16T13:16:24.599959',
+                    '2024-04-16T13:16:24.599959',
+                    '2024-04-12T13:16:24.599959',
+                    '2024-03-20T13:16:24.599959',
+                ],
+            ],
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.game.json',
+            ],
+        ),
+        (
+            1234567,
+            1,
+            [
+                ['2024-04-16T13:16:24.599959'],
+                ['2024-04-16T13:16:24.599959'],
+                ['2024-04-12T13:16:24.599959'],
+                ['2024-03-20T13:16:24.599959'],
+                [],
+            ],
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.game.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_history(
+    client: AsyncClient,
+    username: int,
+    limit: int,
+    expected_pages: List[List[str]],
+    expected_status: int,
+    access_token: str,
+    db_session: None,
+) -> None:
+    cursor = None
+    seen_ids = set()
+
+    for expected_page in expected_pages:
+        params = {'limit': limit} if cursor is None else {'limit': limit, 'cursor': cursor}
+        response = await client.get(
+            URLS['stats']['history'],
+            params=params,
+            headers={'Authorization': f'Bearer {access_token}'},
+        )
+
+        assert response.status_code == expected_status
+
+        response_data = response.json().get('data')
+        games = response_data.get('games')
+        assert [game['timestamp'] for game in games] == expected_page
+
+        seen_ids.update(game['id'] for game in games)
+        cursor = response_data.get('next_cursor')
+
+    assert cursor is None
+    assert len(seen_ids) == sum(len(page) for page in expected_pages)
+
+
+@pytest.mark.parametrize(
+    ('username', 'cursor', 'expected_status', 'fixtures'),
+    [
+        (
+            1234567,
+            'not-a-cursor',
+            status.HTTP_400_BAD_REQUEST,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_history_invalid_cursor(
+    client: AsyncClient,
+    username: int,
+    cursor: str,
+    expected_status: int,
+    access_token: str,
+    db_session: None,
+) -> None:
+    response = await client.get(
+        URLS['stats']['history'],
+        params={'cursor': cursor},
+        headers={'Authorization': f'Bearer {access_token}'},
+    )
+
+    assert response.status_code == expected_status
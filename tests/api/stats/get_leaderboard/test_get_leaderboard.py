@@ -0,0 +1,112 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from freezegun import freeze_time
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+
+from webapp.cache.leaderboard import record_game_result
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+NOW = datetime(2024, 4, 16, 15, 0, 0)
+
+# user_id, won, ships_destroyed, timestamp
+RESULTS = [
+    (1, True, 10, NOW),
+    (1, False, 6, NOW),
+    (2, True, 10, NOW),
+    (2, True, 10, datetime(2024, 3, 20, 13, 0, 0)),
+    (3, False, 3, NOW),
+]
+
+
+@pytest.mark.parametrize(
+    ('username', 'params', 'expected_top', 'expected_me', 'expected_status', 'fixtures'),
+    [
+        (
+            1234567,
+            {'metric': 'wins', 'period': 'all', 'limit': 2},
+            [{'rank': 1, 'user_id': 2, 'score': 2}, {'rank': 2, 'user_id': 1, 'score': 1}],
+            {'rank': 2, 'score': 1},
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            {'metric': 'ships_destroyed', 'period': 'month', 'limit': 1},
+            [{'rank': 1, 'user_id': 1, 'score': 16}],
+            {'rank': 1, 'score': 16},
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            3456789,
+            {'metric': 'wins', 'period': 'week', 'offset': 1},
+            [{'rank': 2, 'user_id': 1, 'score': 1}, {'rank': 3, 'user_id': 3, 'score': 0}],
+            {'rank': 3, 'score': 0},
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            {'metric': 'win_rate', 'period': 'all'},
+            [],
+            None,
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            {'metric': 'losses'},
+            None,
+            None,
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture', '_fake_redis')
+async def test_get_leaderboard(
+    client: AsyncClient,
+    username: int,
+    params: Dict[str, Any],
+    expected_top: List[Dict[str, Any]] | None,
+    expected_me: Dict[str, Any] | None,
+    expected_status: int,
+    access_token: str,
+) -> None:
+    for result in RESULTS:
+        await record_game_result(*result)
+
+    with freeze_time(NOW):
+        response = await client.get(
+            URLS['stats']['leaderboard'],
+            params=params,
+            headers={'Authorization': f'Bearer {access_token}'},
+        )
+
+    assert response.status_code == expected_status
+
+    if expected_status != status.HTTP_200_OK:
+        return
+
+    response_data = response.json()['data']
+    assert response_data['top'] == expected_top
+    assert response_data['me'] == expected_me
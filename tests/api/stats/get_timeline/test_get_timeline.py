@@ -0,0 +1,100 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from freezegun import freeze_time
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+
+@pytest.mark.parametrize(
+    ('username', 'params', 'expected_points', 'expected_next_cursor', 'expected_status', 'fixtures'),
+    [
+        (
+            1234567,
+            {'bucket': 'hour', 'period': 1},
+            [
+                {'bucket': '2024-04-16T13:00:00', 'wins': 1, 'losses': 1, 'ships_sank': 12, 'ships_destroyed': 17},
+            ],
+            None,
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.game.json',
+            ],
+        ),
+        (
+            1234567,
+            {'bucket': 'day', 'period': 7},
+            [
+                {'bucket': '2024-04-12T00:00:00', 'wins': 1, 'losses': 0, 'ships_sank': 2, 'ships_destroyed': 10},
+                {'bucket': '2024-04-16T00:00:00', 'wins': 1, 'losses': 1, 'ships_sank': 12, 'ships_destroyed': 17},
+            ],
+            None,
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.game.json',
+                FIXTURES_PATH / 'sirius.game_daily_stats.json',
+            ],
+        ),
+        (
+            1234567,
+            {'bucket': 'day', 'period': 30, 'limit': 1},
+            [
+                {'bucket': '2024-03-20T00:00:00', 'wins': 1, 'losses': 0, 'ships_sank': 4, 'ships_destroyed': 10},
+            ],
+            '2024-03-21T00:00:00',
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.game.json',
+                FIXTURES_PATH / 'sirius.game_daily_stats.json',
+            ],
+        ),
+        (
+            1234567,
+            {'bucket': 'day', 'cursor': '2024-03-21T00:00:00', 'limit': 1},
+            [
+                {'bucket': '2024-04-12T00:00:00', 'wins': 1, 'losses': 0, 'ships_sank': 2, 'ships_destroyed': 10},
+            ],
+            '2024-04-13T00:00:00',
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+                FIXTURES_PATH / 'sirius.game.json',
+                FIXTURES_PATH / 'sirius.game_daily_stats.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture')
+async def test_get_timeline(
+    client: AsyncClient,
+    username: int,
+    params: Dict[str, Any],
+    expected_points: List[Dict[str, Any]],
+    expected_next_cursor: str | None,
+    expected_status: int,
+    access_token: str,
+    db_session: None,
+) -> None:
+    with freeze_time(datetime(2024, 4, 16, 15, 0, 0)):
+        response = await client.get(
+            URLS['stats']['timeline'],
+            params=params,
+            headers={'Authorization': f'Bearer {access_token}'},
+        )
+
+    assert response.status_code == expected_status
+
+    response_data = response.json().get('data')
+    assert response_data.get('points') == expected_points
+    assert response_data.get('next_cursor') == expected_next_cursor
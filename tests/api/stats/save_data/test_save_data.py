@@ -0,0 +1,113 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+
+from tests.const import URLS
+
+from webapp.cache.cache import redis_set
+from webapp.cache.key_builder import get_leaderboard_key
+from webapp.cache.leaderboard import get_period_key
+from webapp.crud import stats as stats_crud
+from webapp.db.redis import get_redis
+from webapp.game.core import BattleShipGame
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+USER_ID = 1
+# the last moment of a week and a month, a clock read apart from the row's one would be in the next ones
+SAVED_AT = datetime(2024, 3, 31, 23, 59, 59, 999999)
+
+
+def _create_game(finished: bool) -> BattleShipGame:
+    game = BattleShipGame.new(USER_ID, seed=USER_ID)
+    game.setup_random_ships(game.ai)
+    game.setup_random_ships(game.player)
+
+    if finished:
+        for ship in game.ai.board.ships:
+            for coord in ship.coords:
+                game.make_strike(coord, game.ai.board)
+
+    return game
+
+
+@pytest.mark.parametrize(
+    ('username', 'finished', 'expected_status', 'fixtures'),
+    [
+        (
+            1234567,
+            True,
+            status.HTTP_200_OK,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+        (
+            1234567,
+            False,
+            status.HTTP_400_BAD_REQUEST,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture', '_fake_redis')
+async def test_save_data(
+    client: AsyncClient,
+    username: int,
+    finished: bool,
+    expected_status: int,
+    access_token: str,
+) -> None:
+    await redis_set(BattleShipGame.__name__, USER_ID, _create_game(finished).model_dump())
+
+    response = await client.post(URLS['stats']['save_data'], headers={'Authorization': f'Bearer {access_token}'})
+
+    assert response.status_code == expected_status
+
+    # the result is recorded on the leaderboards only once the game is saved
+    wins = await get_redis().zscore(get_leaderboard_key('wins', 'all'), USER_ID)
+    assert wins == (1 if finished else None)
+
+
+class _SavedAtDatetime(datetime):
+    @classmethod
+    def utcnow(cls) -> datetime:  # type: ignore[override]
+        return SAVED_AT
+
+
+@pytest.mark.parametrize(
+    ('username', 'fixtures'),
+    [
+        (
+            1234567,
+            [
+                FIXTURES_PATH / 'sirius.user.json',
+            ],
+        ),
+    ],
+)
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures('_common_api_fixture', '_fake_redis')
+async def test_save_data_period(
+    monkeypatch: pytest.MonkeyPatch,
+    client: AsyncClient,
+    username: int,
+    access_token: str,
+) -> None:
+    monkeypatch.setattr(stats_crud, 'datetime', _SavedAtDatetime)
+    await redis_set(BattleShipGame.__name__, USER_ID, _create_game(True).model_dump())
+
+    response = await client.post(URLS['stats']['save_data'], headers={'Authorization': f'Bearer {access_token}'})
+
+    assert response.status_code == status.HTTP_200_OK
+    # the game is counted in the week and the month of its saved row
+    for period in ('week', 'month'):
+        key = get_leaderboard_key('wins', get_period_key(period, SAVED_AT.date()))
+        assert await get_redis().zscore(key, USER_ID) == 1
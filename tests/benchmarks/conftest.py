@@ -0,0 +1,74 @@
+"""Micro-benchmarks of webapp.game hot paths.
+
+The suite runs them once without timing as plain tests. To measure, save a baseline
+and fail on regressions against it (the threshold, min:20%, is set in pyproject.toml addopts):
+
+    pytest tests/benchmarks --benchmark-enable --benchmark-autosave
+    pytest tests/benchmarks --benchmark-enable --benchmark-compare
+"""
+import sys
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable, Tuple
+
+import pytest
+
+import webapp
+from webapp.game.core import BattleShipGame
+from webapp.game.rules import RULES, RulesName
+
+# 10x10, 50x50 and 100x100 boards
+RULE_SETS: Tuple[RulesName, ...] = ('classic', 'large', 'huge')
+# share of the opponent's squares struck in a mid-game state
+STRUCK_SHARE = 0.3
+SEED = 42
+WEBAPP_DIR = str(Path(webapp.__file__).parent)
+
+
+def create_game(rules: RulesName) -> BattleShipGame:
+    """A game with random ships on both boards and a share of the player's squares struck by the AI."""
+    size = RULES[rules].size
+    game = BattleShipGame.new(1, rules, seed=SEED)
+    game.setup_random_ships(game.ai)
+    game.setup_random_ships(game.player)
+
+    coords = game.player.board.coords
+    game.rng.shuffle(coords)
+
+    for coord in coords[: int(size * size * STRUCK_SHARE)]:
+        if game.finished:
+            break
+        game.make_strike(coord, game.player.board)
+
+    return game
+
+
+def count_lines(func: Callable[..., Any], *args: Any) -> int:
+    """Lines of webapp code executed by func(*args).
+
+    Unlike timings it doesn't depend on the load of the machine, so it can be compared between board sizes exactly.
+    """
+    lines = 0
+
+    def trace_lines(frame: FrameType, event: str, arg: Any) -> Any:
+        nonlocal lines
+        if event == 'line':
+            lines += 1
+        return trace_lines
+
+    def trace_calls(frame: FrameType, event: str, arg: Any) -> Any:
+        return trace_lines if frame.f_code.co_filename.startswith(WEBAPP_DIR) else None
+
+    previous = sys.gettrace()
+    sys.settrace(trace_calls)
+    try:
+        func(*args)
+    finally:
+        sys.settrace(previous)
+
+    return lines
+
+
+@pytest.fixture(params=RULE_SETS, ids=lambda rules: f'{RULES[rules].size}x{RULES[rules].size}')
+def game(request: pytest.FixtureRequest) -> BattleShipGame:
+    return create_game(request.param)
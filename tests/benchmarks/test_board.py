@@ -0,0 +1,55 @@
+from typing import Any, List, Tuple
+
+from tests.benchmarks.conftest import RULE_SETS, count_lines
+
+from webapp.game.board import Board
+from webapp.game.core import BattleShipGame
+from webapp.game.rules import RULES
+
+
+def _ship_coords(size: int) -> List[Tuple[int, int]]:
+    return [(size // 2, size // 2 + i) for i in range(4)]
+
+
+def test_create_ship(benchmark: Any, game: BattleShipGame) -> None:
+    size = game.player.board.lines_cnt
+
+    def setup() -> Tuple[Tuple[Board, List[Tuple[int, int]]], dict[str, Any]]:
+        return (Board.create(size, size), _ship_coords(size)), {}
+
+    benchmark.pedantic(Board.create_ship, setup=setup, rounds=200)
+
+
+def test_create_ship_size_independent() -> None:
+    lines = set()
+
+    for rules in RULE_SETS:
+        size = RULES[rules].size
+        lines.add(count_lines(Board.create(size, size).create_ship, _ship_coords(size)))
+
+    # the same code runs on every board size
+    assert len(lines) == 1
+
+
+def test_validate_empty_surrounding(benchmark: Any, game: BattleShipGame) -> None:
+    size = game.player.board.lines_cnt
+    board = Board.create(size, size)
+
+    # a free spot is the worst case, all the surrounding squares are checked
+    benchmark(board._validate_empty_surrounding, _ship_coords(size))
+
+
+def test_recalculate_weight_map(benchmark: Any, game: BattleShipGame) -> None:
+    opponent_map = game.opponent_map(game.ai.user_id)
+
+    benchmark(game.ai.board.recalculate_weight_map, opponent_map)
+
+
+def test_get_max_weight_coords(benchmark: Any, game: BattleShipGame) -> None:
+    game.ai.board.recalculate_weight_map(game.opponent_map(game.ai.user_id))
+
+    benchmark(game.ai.board.get_max_weight_coords)
+
+
+def test_is_finished(benchmark: Any, game: BattleShipGame) -> None:
+    assert not benchmark(game.player.board.is_finished)
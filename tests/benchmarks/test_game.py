@@ -0,0 +1,59 @@
+from typing import Any, List, Tuple
+
+from tests.benchmarks.conftest import RULE_SETS, count_lines, create_game
+
+from webapp.game.board import Board
+from webapp.game.core import BattleShipGame
+from webapp.game.square import SquareStatus
+
+MISSES = 50
+
+
+def test_make_strike(benchmark: Any, game: BattleShipGame) -> None:
+    board = game.player.board
+    coord = next(coord for ship in board.ships for coord in ship.coords if board.get_state(coord) == SquareStatus.SHIP)
+
+    def setup() -> Tuple[Tuple[BattleShipGame, Tuple[int, int], Board], dict[str, Any]]:
+        game_copy = game.model_copy(deep=True)
+        return (game_copy, coord, game_copy.player.board), {}
+
+    benchmark.pedantic(BattleShipGame.make_strike, setup=setup, rounds=200)
+
+
+def _strike_all(game: BattleShipGame, coords: List[Tuple[int, int]]) -> None:
+    for coord in coords:
+        game.make_strike(coord, game.player.board)
+
+
+def test_miss_size_independent() -> None:
+    lines = set()
+
+    for rules in RULE_SETS:
+        game = create_game(rules)
+        board = game.player.board
+        coords = [coord for coord in board.coords if board.get_state(coord) == SquareStatus.EMPTY][:MISSES]
+
+        lines.add(count_lines(_strike_all, game, coords))
+
+    # the same code runs on every board size
+    assert len(lines) == 1
+
+
+def test_opponent_map(benchmark: Any, game: BattleShipGame) -> None:
+    benchmark(game.opponent_map, game.player.user_id)
+
+
+def test_player_map(benchmark: Any, game: BattleShipGame) -> None:
+    benchmark(game.player_map)
+
+
+def test_model_dump(benchmark: Any, game: BattleShipGame) -> None:
+    benchmark(game.model_dump)
+
+
+def test_restore(benchmark: Any, game: BattleShipGame) -> None:
+    game_data = game.model_dump(mode='json')
+
+    loaded = benchmark(BattleShipGame.restore, game_data)
+
+    assert loaded.model_dump() == game.model_dump()
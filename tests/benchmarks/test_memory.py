@@ -0,0 +1,11 @@
+from webapp.game.core import BattleShipGame
+from webapp.utils.memory import measure_game
+
+# heap bytes a mid-game game restored from its state may hold, by the board size
+LIVE_GAME_TARGETS = {10: 16 * 1024, 50: 64 * 1024, 100: 256 * 1024}
+
+
+def test_live_game_size(game: BattleShipGame) -> None:
+    memory = measure_game(game, count=20)
+
+    assert memory.live <= LIVE_GAME_TARGETS[game.player.board.lines_cnt]
@@ -0,0 +1,66 @@
+from typing import Any, Counter, Iterator, List
+
+import pytest
+
+from tests.benchmarks.conftest import RULE_SETS, SEED, create_game
+
+from webapp.game.core import BattleShipGame
+from webapp.game.rules import RULES, RulesName
+from webapp.game.square import SquareStatus
+from webapp.game.strategies import STRATEGIES
+
+
+class CountingLine(List[SquareStatus]):
+    """A line of the opponent map counting reads of its squares."""
+
+    def __init__(self, line: List[SquareStatus], visits: Counter[str]):
+        super().__init__(line)
+        self.visits = visits
+
+    def __getitem__(self, index: Any) -> Any:
+        self.visits['squares'] += 1
+        return super().__getitem__(index)
+
+    def __iter__(self) -> Iterator[SquareStatus]:
+        for state in super().__iter__():
+            self.visits['squares'] += 1
+            yield state
+
+
+def _count_visits(game: BattleShipGame, strategy: str) -> int:
+    """Squares of the opponent map read by a move of the AI."""
+    visits: Counter[str] = Counter()
+    opponent_map = [CountingLine(line, visits) for line in game.opponent_map(game.ai.user_id)]
+    ship_lengths = [ship.length for ship in game.player.board.ships if not ship.is_destroyed()]
+
+    STRATEGIES[strategy].choose(game.ai.board, opponent_map, ship_lengths, game.rng)
+
+    return visits['squares']
+
+
+@pytest.mark.parametrize('strategy', list(STRATEGIES))
+def test_choose_target(benchmark: Any, game: BattleShipGame, strategy: str) -> None:
+    board = game.player.board
+    benchmark.extra_info['cost'] = STRATEGIES[strategy].cost(board.lines_cnt, board.rows_cnt, game.ship_types)
+
+    coord = benchmark(game.choose_target, game.ai, strategy)
+
+    assert board.get_state(coord) in (SquareStatus.EMPTY, SquareStatus.SHIP)
+
+
+@pytest.mark.parametrize('struck', [False, True], ids=['empty', 'mid-game'])
+@pytest.mark.parametrize('strategy', list(STRATEGIES))
+@pytest.mark.parametrize('rules', RULE_SETS)
+def test_declared_cost(rules: RulesName, strategy: str, struck: bool) -> None:
+    """A move reads no more squares than the declared worst-case square visits.
+
+    Nothing is struck on the empty board, so every square is a candidate and every ship position fits.
+    """
+    if struck:
+        game = create_game(rules)
+    else:
+        game = BattleShipGame.new(1, rules, seed=SEED)
+        game.setup_random_ships(game.player)
+    size = RULES[rules].size
+
+    assert 0 < _count_visits(game, strategy) <= STRATEGIES[strategy].cost(size, size, game.ship_types)
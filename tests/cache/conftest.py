@@ -0,0 +1,11 @@
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from webapp.db import redis as redis_module
+
+
+@pytest.fixture()
+def redis(monkeypatch: pytest.MonkeyPatch) -> FakeRedis:
+    fake = FakeRedis()
+    monkeypatch.setattr(redis_module, 'redis', fake, raising=False)
+    return fake
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from conf.config import settings
+from webapp.cache.key_builder import get_leaderboard_key
+from webapp.cache.leaderboard import get_leaderboard, record_game_result
+
+PLAYED_AT = datetime(2024, 4, 16, 15, 0, 0)
+
+
+@pytest.mark.parametrize(
+    ('period_key', 'ttl'),
+    [
+        ('all', -1),
+        ('week:2024-W16', settings.LEADERBOARD_WEEK_TTL),
+        ('month:2024-04', settings.LEADERBOARD_MONTH_TTL),
+    ],
+)
+async def test_record_game_result(redis: FakeRedis, period_key: str, ttl: int) -> None:
+    await record_game_result(1, True, 10, PLAYED_AT)
+    await record_game_result(1, False, 4, PLAYED_AT)
+    await record_game_result(2, True, 10, PLAYED_AT)
+
+    assert await redis.zscore(get_leaderboard_key('wins', period_key), 1) == 1
+    assert await redis.zscore(get_leaderboard_key('games', period_key), 1) == 2
+    assert await redis.zscore(get_leaderboard_key('ships_destroyed', period_key), 1) == 14
+    assert await redis.zscore(get_leaderboard_key('wins', period_key), 2) == 1
+    assert await redis.ttl(get_leaderboard_key('wins', period_key)) == ttl
+
+
+async def test_win_rate_min_games(redis: FakeRedis, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'LEADERBOARD_WIN_RATE_MIN_GAMES', 3)
+    key = get_leaderboard_key('win_rate', 'all')
+
+    for won in (True, False):
+        await record_game_result(1, won, 10, PLAYED_AT)
+    assert await redis.zscore(key, 1) is None
+
+    await record_game_result(1, True, 10, PLAYED_AT)
+    assert await redis.zscore(key, 1) == pytest.approx(2 / 3)
+
+
+async def test_get_leaderboard(redis: FakeRedis) -> None:
+    for user_id, wins in ((1, 2), (2, 3), (3, 1)):
+        for _ in range(wins):
+            await record_game_result(user_id, True, 10, PLAYED_AT)
+
+    top, me = await get_leaderboard('wins', 'all', 1, offset=1, limit=2)
+
+    assert top == [(2, 1, 2), (3, 3, 1)]
+    assert me == (2, 2)
+    assert (await get_leaderboard('wins', 'all', 4, offset=0, limit=1))[1] is None
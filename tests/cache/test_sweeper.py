@@ -0,0 +1,140 @@
+import asyncio
+from time import time
+from typing import Any, Dict, List
+
+import orjson
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from conf.config import settings
+from webapp.cache import sweeper
+from webapp.cache.key_builder import get_activity_key, get_ai_move_key, get_cache_key, get_moves_key
+from webapp.game.core import BattleShipGame
+
+MODEL = BattleShipGame.__name__
+IDLE_USERS = (1, 2, 3)
+
+
+async def _skip_memory_usage(activity_key: str) -> None:
+    return
+
+
+@pytest.fixture(autouse=True)
+def _sweeper_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, 'GAME_SWEEPER_RECORD_ABANDONED', True)
+    # fakeredis has no MEMORY USAGE
+    monkeypatch.setattr(sweeper, '_observe_memory_usage', _skip_memory_usage)
+
+
+@pytest.fixture()
+def recorded(monkeypatch: pytest.MonkeyPatch) -> List[Dict[str, Any]]:
+    games: List[Dict[str, Any]] = []
+
+    async def save_abandoned_games(session: Any, batch: List[Dict[str, Any]]) -> None:
+        games.extend(batch)
+
+    monkeypatch.setattr(sweeper, 'save_abandoned_games', save_abandoned_games)
+    return games
+
+
+async def _store_idle_games(redis: FakeRedis) -> None:
+    idle_since = time() - settings.GAME_SWEEPER_IDLE_TIMEOUT - 60
+
+    for user_id in IDLE_USERS:
+        game = BattleShipGame.new(user_id, seed=user_id)
+        game.setup_random_ships(game.ai)
+        game.setup_random_ships(game.player)
+        await redis.set(get_cache_key(MODEL, user_id), orjson.dumps(game.model_dump()))
+        await redis.zadd(get_activity_key(MODEL), {str(user_id): idle_since})
+        await redis.xadd(get_moves_key(user_id), {'m': b'move'})
+        await redis.set(get_ai_move_key(user_id), b'ai move')
+
+
+def _game_keys(user_id: int) -> List[str]:
+    return [get_cache_key(MODEL, user_id), get_moves_key(user_id), get_ai_move_key(user_id)]
+
+
+async def test_sweep_idle_games(redis: FakeRedis, recorded: List[Dict[str, Any]]) -> None:
+    await _store_idle_games(redis)
+
+    assert await sweeper.sweep_idle_games() == len(IDLE_USERS)
+
+    assert sorted(game['user_id'] for game in recorded) == list(IDLE_USERS)
+    assert await redis.zcard(get_activity_key(MODEL)) == 0
+    assert not await redis.exists(*(key for user_id in IDLE_USERS for key in _game_keys(user_id)))
+
+
+async def test_sweep_without_recording(monkeypatch: pytest.MonkeyPatch, redis: FakeRedis) -> None:
+    monkeypatch.setattr(settings, 'GAME_SWEEPER_RECORD_ABANDONED', False)
+    await _store_idle_games(redis)
+
+    assert await sweeper.sweep_idle_games() == len(IDLE_USERS)
+
+    # the moves logs and AI moves go with the games
+    assert not await redis.exists(*(key for user_id in IDLE_USERS for key in _game_keys(user_id)))
+
+
+async def test_games_restored_if_recording_fails(monkeypatch: pytest.MonkeyPatch, redis: FakeRedis) -> None:
+    await _store_idle_games(redis)
+    states = {user_id: await redis.get(get_cache_key(MODEL, user_id)) for user_id in IDLE_USERS}
+    # a game created after the eviction is kept as is
+    new_user = IDLE_USERS[0]
+    evict = redis.evalsha
+
+    async def evict_then_create(*args: Any, **kwargs: Any) -> Any:
+        evicted = await evict(*args, **kwargs)
+        await redis.set(get_cache_key(MODEL, new_user), b'new game')
+        return evicted
+
+    async def save_abandoned_games(session: Any, batch: List[Dict[str, Any]]) -> None:
+        raise ConnectionError('Postgres is down')
+
+    monkeypatch.setattr(redis, 'evalsha', evict_then_create)
+    monkeypatch.setattr(sweeper, 'save_abandoned_games', save_abandoned_games)
+
+    with pytest.raises(ConnectionError):
+        await sweeper.sweep_idle_games()
+
+    assert await redis.get(get_cache_key(MODEL, new_user)) == b'new game'
+    for user_id in IDLE_USERS[1:]:
+        assert await redis.get(get_cache_key(MODEL, user_id)) == states[user_id]
+        assert await redis.ttl(get_cache_key(MODEL, user_id)) > 0
+        # the moves log is kept for the next sweep
+        assert await redis.xlen(get_moves_key(user_id)) == 1
+    # retried once idle again
+    assert await redis.zcard(get_activity_key(MODEL)) == len(IDLE_USERS)
+    assert await redis.zrangebyscore(get_activity_key(MODEL), '-inf', time() - settings.GAME_SWEEPER_IDLE_TIMEOUT) == []
+
+
+async def test_game_touched_after_selection_is_kept(
+    monkeypatch: pytest.MonkeyPatch,
+    redis: FakeRedis,
+    recorded: List[Dict[str, Any]],
+) -> None:
+    await _store_idle_games(redis)
+    touched = IDLE_USERS[0]
+    select = redis.zrangebyscore
+
+    async def select_then_touch(*args: Any, **kwargs: Any) -> Any:
+        members = await select(*args, **kwargs)
+        # the player moves between the selection and the eviction
+        await redis.zadd(get_activity_key(MODEL), {str(touched): time()})
+        return members
+
+    monkeypatch.setattr(redis, 'zrangebyscore', select_then_touch)
+
+    assert await sweeper.sweep_idle_games() == len(IDLE_USERS) - 1
+
+    assert touched not in {game['user_id'] for game in recorded}
+    assert len(recorded) == len(IDLE_USERS) - 1
+    assert await redis.exists(get_cache_key(MODEL, touched))
+    assert await redis.zscore(get_activity_key(MODEL), str(touched)) is not None
+
+
+async def test_concurrent_sweepers_record_once(redis: FakeRedis, recorded: List[Dict[str, Any]]) -> None:
+    await _store_idle_games(redis)
+
+    evicted = await asyncio.gather(sweeper.sweep_idle_games(), sweeper.sweep_idle_games())
+
+    assert sum(evicted) == len(IDLE_USERS)
+    assert sorted(game['user_id'] for game in recorded) == list(IDLE_USERS)
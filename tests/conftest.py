@@ -1,14 +1,19 @@
 import asyncio
 from asyncio import AbstractEventLoop
+from datetime import date, datetime
 
 import pytest
 from fastapi import FastAPI
 
+from webapp.db.partitions import create_game_partitions, ensure_game_partitions
 from webapp.db.postgres import engine
 from webapp.main import create_app
 from webapp.models import meta
 from webapp.on_startup.redis import start_redis
 
+# months of the games in tests/api fixtures, their rows must not land in the default partition
+FIXTURES_MONTHS = (date(2024, 3, 1), date(2024, 4, 1))
+
 
 @pytest.fixture(scope='session')
 async def app(_migrate_db: None) -> FastAPI:
@@ -26,5 +31,7 @@ def event_loop() -> AbstractEventLoop:
 async def _migrate_db() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(meta.metadata.create_all)
+        await ensure_game_partitions(conn, datetime.utcnow().date())
+        await create_game_partitions(conn, *FIXTURES_MONTHS)
 
     return
@@ -1,4 +1,8 @@
 URLS = {
+    "admin": {
+        "export_games": "/admin/export_games",
+        "profile": "/admin/profile",
+    },
     "auth": {
         "login": "/auth/login",
         "info": "/auth/info",
@@ -6,6 +10,9 @@ URLS = {
     "stats": {
         "get_stats": "/stats/get_stats",
         "save_data": "/stats/save_data",
+        "timeline": "/stats/timeline",
+        "leaderboard": "/stats/leaderboard",
+        "history": "/stats/history",
     },
     "game": {
         "create_game": "/game/create_game",
@@ -16,5 +23,6 @@ URLS = {
         "setup_rules": "/game/setup_rules",
         "create_random_ships": "/game/create_random_ships",
         "create_ship": "/game/create_ship",
+        "replay": "/game/replay",
     },
 }
@@ -0,0 +1,122 @@
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import AsyncGenerator, List
+
+import pytest
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from webapp.db.partitions import (
+    DEFAULT_PARTITION,
+    GAME_TABLE,
+    add_months,
+    create_game_partitions,
+    get_game_partitions,
+    get_partition_name,
+    iter_months,
+)
+from webapp.db.postgres import engine
+from webapp.models.meta import DEFAULT_SCHEMA
+from webapp.models.sirius.game import Game
+from webapp.models.sirius.user import User
+
+API_TESTS_PATH = Path(__file__).parent.parent / 'api'
+
+
+@pytest.fixture()
+async def conn(_migrate_db: None) -> AsyncGenerator[AsyncConnection, None]:
+    async with engine.connect() as conn:
+        await conn.execute(insert(User).values([{'id': 1, 'username': 1234567}, {'id': 2, 'username': 2345678}]))
+        yield conn
+        await conn.rollback()
+
+
+@pytest.mark.parametrize(
+    ('month', 'months', 'expected'),
+    [
+        (date(2024, 4, 1), 1, date(2024, 5, 1)),
+        (date(2024, 12, 1), 1, date(2025, 1, 1)),
+        (date(2024, 1, 1), -1, date(2023, 12, 1)),
+        (date(2024, 4, 1), -28, date(2021, 12, 1)),
+        (date(2024, 4, 1), 0, date(2024, 4, 1)),
+    ],
+)
+def test_add_months(month: date, months: int, expected: date) -> None:
+    assert add_months(month, months) == expected
+
+
+@pytest.mark.parametrize(
+    ('start', 'end', 'expected'),
+    [
+        (date(2024, 11, 15), date(2025, 1, 1), [date(2024, 11, 1), date(2024, 12, 1), date(2025, 1, 1)]),
+        (date(2024, 4, 16), date(2024, 4, 30), [date(2024, 4, 1)]),
+        (date(2024, 4, 16), date(2024, 3, 31), []),
+    ],
+)
+def test_iter_months(start: date, end: date, expected: List[date]) -> None:
+    assert list(iter_months(start, end)) == expected
+
+
+def test_get_partition_name() -> None:
+    assert get_partition_name(date(2024, 3, 1)) == 'game_y2024m03'
+
+
+@pytest.mark.parametrize(
+    ('timestamp', 'expected_partition'),
+    [
+        (datetime(2024, 3, 1, 0, 0, 0), 'game_y2024m03'),
+        (datetime(2024, 3, 31, 23, 59, 59, 999999), 'game_y2024m03'),
+        (datetime(2024, 4, 16, 13, 16, 24), 'game_y2024m04'),
+        (datetime(1990, 1, 1), DEFAULT_PARTITION),
+    ],
+)
+async def test_game_partition(conn: AsyncConnection, timestamp: datetime, expected_partition: str) -> None:
+    await conn.execute(insert(Game).values(user_id=1, won=True, ships_sank=1, ships_destroyed=10, timestamp=timestamp))
+
+    partition = await conn.scalar(text(f'SELECT tableoid::regclass::text FROM {GAME_TABLE}'))
+
+    assert partition.split('.')[-1] == expected_partition
+
+
+async def test_partition_moves_default_rows(conn: AsyncConnection) -> None:
+    """Games of a month written before its partition was created are moved to the partition."""
+    month = date(1991, 2, 1)
+    timestamps = [datetime(1991, 1, 31, 23, 59), datetime(1991, 2, 1), datetime(1991, 2, 28, 12), datetime(1991, 3, 1)]
+    for timestamp in timestamps:
+        await conn.execute(
+            insert(Game).values(user_id=1, won=True, ships_sank=1, ships_destroyed=10, timestamp=timestamp)
+        )
+
+    await create_game_partitions(conn, month, month)
+    # the partition exists now, so creating it again changes nothing
+    await create_game_partitions(conn, month, month)
+
+    result = await conn.execute(
+        text(f'SELECT tableoid::regclass::text, timestamp FROM {GAME_TABLE} ORDER BY timestamp')
+    )
+
+    assert [(partition.split('.')[-1], timestamp) for partition, timestamp in result] == [
+        (DEFAULT_PARTITION, timestamps[0]),
+        (get_partition_name(month), timestamps[1]),
+        (get_partition_name(month), timestamps[2]),
+        (DEFAULT_PARTITION, timestamps[3]),
+    ]
+    assert (get_partition_name(month), month) in await get_game_partitions(conn)
+
+
+async def test_fixtures_partitioned(conn: AsyncConnection) -> None:
+    """Games of the api test fixtures land in monthly partitions, the default one stays empty."""
+    for fixture in API_TESTS_PATH.glob('**/fixtures/sirius.game.json'):
+        with open(fixture, 'r') as file:
+            for game in json.load(file):
+                game['timestamp'] = datetime.strptime(game['timestamp'], '%Y-%m-%d %H:%M:%S.%f')
+                await conn.execute(insert(Game).values(**game))
+
+    partitions = [name for name, _ in await get_game_partitions(conn)]
+    default_rows = await conn.scalar(text(f'SELECT count(*) FROM {DEFAULT_SCHEMA}.{DEFAULT_PARTITION}'))
+
+    assert 'game_y2024m03' in partitions
+    assert 'game_y2024m04' in partitions
+    assert default_rows == 0
+    assert await conn.scalar(select(func.count()).select_from(Game)) > 0
@@ -0,0 +1,141 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from webapp.game.board import Board
+from webapp.game.core import BattleShipGame, HitStatus
+from webapp.game.square import SquareStatus
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+STRUCK_STATES = (SquareStatus.MISSED, SquareStatus.HIT, SquareStatus.DESTROYED)
+
+
+def _load_board(name: str, player: str) -> Dict[str, Any]:
+    with open(FIXTURES_PATH / name, 'r') as file:
+        return json.load(file)['state'][player]['board']
+
+
+def _expected_ship_index(data: Dict[str, Any]) -> Dict[int, int]:
+    rows_cnt = data['rows_cnt']
+    return {x * rows_cnt + y: index for index, ship in enumerate(data['ships']) for x, y in ship['coords']}
+
+
+def _assert_counters(board: Board, data: Dict[str, Any]) -> None:
+    destroyed = sum(ship['hp'] == 0 for ship in data['ships'])
+    assert board.ships_destroyed == destroyed
+    assert board.ships_remaining == len(data['ships']) - destroyed
+
+
+@pytest.mark.parametrize('player', ['player', 'ai'])
+def test_convert_dense_board(player: str) -> None:
+    data = _load_board('dense_game.json', player)
+    rows_cnt = data['rows_cnt']
+
+    board = Board.model_validate(data)
+
+    assert board.struck.tolist() == [
+        square['x_coord'] * rows_cnt + square['y_coord']
+        for line in data['board']
+        for square in line
+        if SquareStatus(square['state']) in STRUCK_STATES
+    ]
+    assert board.ship_index == _expected_ship_index(data)
+    _assert_counters(board, data)
+    assert [[board.get_state((x, y)) for y in range(rows_cnt)] for x in range(board.lines_cnt)] == [
+        [SquareStatus(square['state']) for square in line] for line in data['board']
+    ]
+    assert 'board' not in board.model_dump()
+    assert 'weight' not in board.model_dump()
+
+
+@pytest.mark.parametrize('player', ['player', 'ai'])
+def test_convert_struck_coordinates(player: str) -> None:
+    data = _load_board('sparse_game.json', player)
+    rows_cnt = data['rows_cnt']
+
+    board = Board.model_validate(data)
+
+    assert board.struck.tolist() == [x * rows_cnt + y for x, y in data['struck']]
+    assert board.ship_index == _expected_ship_index(data)
+    _assert_counters(board, data)
+    for x, y in data['struck']:
+        assert board.get_state((x, y)) in STRUCK_STATES
+
+
+def test_convert_struck_coordinates_with_ship_index() -> None:
+    board = Board.model_validate(
+        {
+            'lines_cnt': 3,
+            'rows_cnt': 4,
+            'ships': [{'coords': [[0, 0]], 'hp': 1}],
+            'struck': [[2, 3], [1, 2]],
+            'ship_index': {'0': 0},
+            'ships_remaining': 1,
+        }
+    )
+
+    assert board.struck.tolist() == [11, 6]
+    assert board.ship_index == {0: 0}
+    assert board.ships_remaining == 1
+
+
+def test_remove_ship_reindexes() -> None:
+    board = Board.create(10, 10)
+    coords: List[List[Tuple[int, int]]] = [[(0, 0), (0, 1)], [(2, 0), (2, 1), (2, 2)], [(4, 4)], [(6, 6), (7, 6)]]
+    ships = [board.create_ship(ship_coords) for ship_coords in coords]
+
+    board.remove_ship(ships[1])
+
+    assert board.ships == [ships[0], ships[2], ships[3]]
+    assert board.ship_index == {0: 0, 1: 0, 44: 1, 66: 2, 76: 2}
+    assert board.ships_remaining == 3
+    for coord in coords[1]:
+        assert board.get_ship(coord) is None
+    for ship in board.ships:
+        assert all(board.get_ship(coord) is ship for coord in ship.coords)
+
+    # the squares of the removed ship are free again
+    board.create_ship([(2, 0), (2, 1), (2, 2)])
+    assert board.ship_index[20] == board.ship_index[22] == 3
+
+
+@pytest.fixture()
+def game() -> BattleShipGame:
+    game = BattleShipGame.new(1, 'classic', seed=0)
+    game.max_ship_count = game.ai.board.max_ship_count = 2
+    game.ai.board.create_ship([(0, 0), (0, 1)])
+    game.ai.board.create_ship([(5, 5)])
+    return game
+
+
+def test_counters_after_destroy(game: BattleShipGame) -> None:
+    board = game.ai.board
+
+    assert game.player_strike((0, 0)) == HitStatus.HIT
+    assert (board.ships_remaining, board.ships_destroyed) == (2, 0)
+
+    assert game.player_strike((0, 1)) == HitStatus.DESTROYED
+    assert (board.ships_remaining, board.ships_destroyed) == (1, 1)
+    assert board.destroyed_ships_count() == 1
+    assert not board.is_finished()
+    assert not game.finished
+    assert game.winner is None
+
+
+def test_counters_after_win(game: BattleShipGame) -> None:
+    board = game.ai.board
+    for coord in ((0, 0), (0, 1), (5, 5)):
+        game.player_strike(coord)
+
+    assert (board.ships_remaining, board.ships_destroyed) == (0, 2)
+    assert board.is_finished()
+    assert game.finished
+    assert game.winner_id == game.player.user_id
+
+    reloaded = BattleShipGame.restore(game.model_dump(mode='json'))
+    assert (reloaded.ai.board.ships_remaining, reloaded.ai.board.ships_destroyed) == (0, 2)
+    assert reloaded.winner_id == game.player.user_id
@@ -0,0 +1,95 @@
+from typing import List
+
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from webapp.game.core import BattleShipGame
+from webapp.game.rng import MASK, GameRandom, derive_seed
+
+SEED = 1234567
+DRAWS = 20
+
+
+@pytest.mark.parametrize(
+    ('seed', 'expected'),
+    [
+        # reference SplitMix64 outputs
+        (0, [0xE220A8397B1DCDAF, 0x6E789E6AA1B965F4, 0x06C45D188009454F]),
+        (SEED, [6457827717110365317, 3203168211198807973, 9817491932198370423]),
+    ],
+)
+def test_next(seed: int, expected: List[int]) -> None:
+    rng = GameRandom(seed)
+
+    assert [rng.next() for _ in expected] == expected
+
+
+@pytest.mark.parametrize('n', [1, 2, 3, 10, 100, (1 << 63) + 1, 1 << 64])
+def test_randbelow_bounds(n: int) -> None:
+    rng = GameRandom(SEED)
+
+    assert all(0 <= rng.randbelow(n) < n for _ in range(1000))
+
+
+def test_randbelow_covers_range() -> None:
+    rng = GameRandom(SEED)
+
+    assert {rng.randbelow(10) for _ in range(1000)} == set(range(10))
+
+
+def test_choice_empty() -> None:
+    with pytest.raises(IndexError):
+        GameRandom(SEED).choice([])
+
+
+def test_shuffle_permutes() -> None:
+    items = list(range(100))
+    GameRandom(SEED).shuffle(items)
+
+    assert items != list(range(100))
+    assert sorted(items) == list(range(100))
+
+
+def test_state_round_trip() -> None:
+    game = BattleShipGame.new(1, seed=SEED)
+    game.setup_random_ships(game.ai)
+    game.rng.next()
+
+    state = game.model_dump(mode='json')
+    restored = BattleShipGame.restore(orjson.loads(orjson.dumps(state)))
+
+    assert state['rng'] == game.rng.state
+    assert restored.rng == game.rng
+    assert restored.rng is not game.rng
+
+
+def test_continuation_after_round_trip() -> None:
+    game = BattleShipGame.new(1, seed=SEED)
+    game.setup_random_ships(game.ai)
+    game.setup_random_ships(game.player)
+    restored = BattleShipGame.restore(orjson.loads(orjson.dumps(game.model_dump(mode='json'))))
+
+    assert [game.rng.randbelow(100) for _ in range(DRAWS)] == [restored.rng.randbelow(100) for _ in range(DRAWS)]
+
+    # the AI picks the same targets on the restored game
+    for _ in range(DRAWS):
+        coord = game.choose_ai_target()
+        assert restored.choose_ai_target() == coord
+        game.ai_strike(coord)
+        restored.ai_strike(coord)
+
+
+@pytest.mark.parametrize('state', [-1, MASK + 1])
+def test_state_out_of_range(state: int) -> None:
+    data = BattleShipGame.new(1, seed=SEED).model_dump(mode='json')
+    data['rng'] = state
+
+    with pytest.raises(ValidationError):
+        BattleShipGame.restore(data)
+
+
+def test_derive_seed() -> None:
+    assert derive_seed(SEED, 0) == derive_seed(SEED, 0)
+    assert derive_seed(SEED, 0) != derive_seed(SEED, 1)
+    assert 0 <= derive_seed(SEED, 0) <= MASK
@@ -0,0 +1,47 @@
+from typing import Tuple
+
+import pytest
+
+from webapp.game.simulation import SimulationStats, run_games
+
+GAMES = 6
+SEED = 7
+
+
+@pytest.mark.parametrize('strategies', [('weighted', 'random'), ('density', 'parity')])
+def test_run_games_deterministic(strategies: Tuple[str, str]) -> None:
+    first = run_games(0, GAMES, strategies, SEED, 'classic')
+    second = run_games(0, GAMES, strategies, SEED, 'classic')
+
+    assert first.games == GAMES
+    assert sum(first.wins.values()) == GAMES
+    assert first.wins == second.wins
+    assert first.lengths == second.lengths
+    assert first.move_count == second.move_count
+
+
+@pytest.mark.parametrize('chunks', [(1, 5), (2, 2, 2), (3, 3)])
+def test_run_games_chunking(chunks: Tuple[int, ...]) -> None:
+    """Results don't depend on how games are split between workers."""
+    strategies = ('weighted', 'random')
+    expected = run_games(0, GAMES, strategies, SEED, 'classic')
+
+    stats = SimulationStats()
+    first = 0
+    for count in chunks:
+        stats.merge(run_games(first, count, strategies, SEED, 'classic'))
+        first += count
+
+    assert stats.games == expected.games
+    assert stats.wins == expected.wins
+    assert stats.lengths == expected.lengths
+    assert stats.move_count == expected.move_count
+
+
+def test_run_games_seed() -> None:
+    strategies = ('random', 'random')
+
+    assert (
+        run_games(0, GAMES, strategies, SEED, 'classic').lengths
+        != run_games(0, GAMES, strategies, SEED + 1, 'classic').lengths
+    )
@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import orjson
+import pytest
+
+from webapp.game.core import BattleShipGame, HitStatus
+
+BASE_DIR = Path(__file__).parent
+FIXTURES_PATH = BASE_DIR / 'fixtures'
+
+
+def _load_fixture(name: str) -> Dict[str, Any]:
+    """A state saved by an older version of the game and the maps, turn and counters it had then."""
+    with open(FIXTURES_PATH / name, 'r') as file:
+        return json.load(file)
+
+
+def _to_json(value: Any) -> Any:
+    return orjson.loads(orjson.dumps(value))
+
+
+@pytest.mark.parametrize('fixture', ['dense_game.json', 'sparse_game.json'])
+def test_load_state(fixture: str) -> None:
+    data = _load_fixture(fixture)
+    expected = data['expected']
+
+    game = BattleShipGame.restore(data['state'])
+
+    assert game.turn.user_id == expected['turn_id']
+    assert game.moves_count == expected['moves_count']
+    assert _to_json(game.player_map()) == expected['player_map']
+    assert _to_json(game.opponent_map(game.player.user_id)) == expected['opponent_map']
+    assert _to_json(game.opponent_map(game.ai.user_id)) == expected['ai_opponent_map']
+    assert [board.destroyed_ships_count() for board in (game.player.board, game.ai.board)] == expected[
+        'ships_destroyed'
+    ]
+
+
+@pytest.mark.parametrize('fixture', ['dense_game.json', 'sparse_game.json'])
+def test_loaded_state_saved_sparse(fixture: str) -> None:
+    data = _load_fixture(fixture)
+    game = BattleShipGame.restore(data['state'])
+
+    state = game.model_dump(mode='json')
+    reloaded = BattleShipGame.restore(orjson.loads(orjson.dumps(state)))
+
+    assert 'board' not in state['player']['board']
+    assert 'turn' not in state
+    assert reloaded.model_dump() == game.model_dump()
+    assert _to_json(reloaded.player_map()) == data['expected']['player_map']
+
+
+@pytest.mark.parametrize('fixture', ['dense_game.json', 'sparse_game.json'])
+def test_loaded_game_continues(fixture: str) -> None:
+    game = BattleShipGame.restore(_load_fixture(fixture)['state'])
+    moves_count = game.moves_count
+
+    # the AI moves next in the saved game
+    assert game.ai_strike() in (HitStatus.MISS, HitStatus.HIT, HitStatus.DESTROYED)
+    assert game.moves_count == moves_count + 1
@@ -1,11 +1,13 @@
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
 
 class TestRedisClient:
     redis_storage: Dict[str, Dict[str, Any]] = {}
+    redis_sorted_sets: Dict[str, Dict[str, float]] = {}
+    redis_streams: Dict[str, List[Dict[str, Any]]] = {}
 
     @classmethod
-    async def set(cls, name: str, value: Dict[str, Any]) -> None:
+    async def set(cls, name: str, value: Dict[str, Any], ex: int | None = None) -> None:
         cls.redis_storage[name] = value
 
     @classmethod
@@ -13,5 +15,73 @@ class TestRedisClient:
         return cls.redis_storage.get(name)
 
     @classmethod
-    async def delete(cls, name: str) -> None:
-        cls.redis_storage.pop(name, None)
+    async def getdel(cls, name: str) -> Dict[str, Any] | None:
+        return cls.redis_storage.pop(name, None)
+
+    @classmethod
+    async def delete(cls, *names: str) -> int:
+        return sum(
+            cls.redis_storage.pop(name, None) is not None or cls.redis_streams.pop(name, None) is not None
+            for name in names
+        )
+
+    @classmethod
+    async def zadd(cls, name: str, mapping: Dict[str, float]) -> int:
+        sorted_set = cls.redis_sorted_sets.setdefault(name, {})
+        added = len(mapping.keys() - sorted_set.keys())
+        sorted_set.update(mapping)
+        return added
+
+    @classmethod
+    async def zrem(cls, name: str, *members: str) -> int:
+        sorted_set = cls.redis_sorted_sets.get(name, {})
+        return sum(sorted_set.pop(member, None) is not None for member in members)
+
+    @classmethod
+    async def xadd(cls, name: str, fields: Dict[str, Any]) -> str:
+        stream = cls.redis_streams.setdefault(name, [])
+        stream.append(fields)
+        return f'0-{len(stream)}'
+
+    @classmethod
+    async def xrange(
+        cls, name: str, min: bytes | str = '-', max: str = '+', count: int | None = None
+    ) -> List[Tuple[bytes, Dict[bytes, Any]]]:
+        # ids are 0-<position>, so an exclusive min of b'(0-N' starts after the N-th entry
+        start = int(min.split(b'-')[1]) if isinstance(min, bytes) else 0
+        entries = cls.redis_streams.get(name, [])[start:]
+        if count is not None:
+            entries = entries[:count]
+        return [
+            (f'0-{start + i + 1}'.encode(), {key.encode(): value for key, value in fields.items()})
+            for i, fields in enumerate(entries)
+        ]
+
+    @classmethod
+    async def expire(cls, name: str, time: int) -> bool:
+        return name in cls.redis_storage or name in cls.redis_sorted_sets or name in cls.redis_streams
+
+    @classmethod
+    def pipeline(cls, transaction: bool = True) -> 'TestRedisPipeline':
+        return TestRedisPipeline()
+
+
+class TestRedisPipeline:
+    def __init__(self) -> None:
+        self.commands: List[Tuple[str, Tuple[Any, ...], Dict[str, Any]]] = []
+
+    async def __aenter__(self) -> 'TestRedisPipeline':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.commands.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        def command(*args: Any, **kwargs: Any) -> 'TestRedisPipeline':
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return command
+
+    async def execute(self) -> List[Any]:
+        return [await getattr(TestRedisClient, name)(*args, **kwargs) for name, args, kwargs in self.commands]
@@ -0,0 +1,118 @@
+import csv
+import sys
+import gzip
+import importlib
+from datetime import date, datetime
+from pathlib import Path
+from types import ModuleType
+from typing import Any, AsyncGenerator
+
+import pytest
+from sqlalchemy import delete, insert, text
+
+from webapp.db.partitions import create_game_partitions, get_game_partitions, get_partition_name
+from webapp.db.postgres import engine
+from webapp.models.meta import DEFAULT_SCHEMA
+from webapp.models.sirius.game import Game
+from webapp.models.sirius.user import User
+
+# far enough in the past to be the only partition older than the retention of the test
+ARCHIVED_MONTH = date(1990, 1, 1)
+USER_ID = 990001
+
+
+@pytest.fixture()
+async def archived_partition(_migrate_db: None) -> AsyncGenerator[str, None]:
+    """A committed partition of ARCHIVED_MONTH with a game, as the script uses connections of its own."""
+    name = get_partition_name(ARCHIVED_MONTH)
+
+    async with engine.begin() as conn:
+        await create_game_partitions(conn, ARCHIVED_MONTH, ARCHIVED_MONTH)
+        await conn.execute(insert(User).values(id=USER_ID, username=USER_ID))
+        await conn.execute(
+            insert(Game).values(
+                user_id=USER_ID, won=True, ships_sank=3, ships_destroyed=10, timestamp=datetime(1990, 1, 15)
+            )
+        )
+
+    yield name
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f'DROP TABLE IF EXISTS {DEFAULT_SCHEMA}.{name}'))
+        await conn.execute(delete(User).where(User.id == USER_ID))
+
+
+def _load_script(monkeypatch: pytest.MonkeyPatch, *argv: str) -> ModuleType:
+    # arguments are parsed on import
+    monkeypatch.setattr(sys, 'argv', ['game_retention'])
+    script = importlib.import_module('scripts.game_retention')
+    monkeypatch.setattr(script, 'args', script.parser.parse_args(argv))
+    return script
+
+
+def _keep_months() -> int:
+    """Retention putting the cutoff right after ARCHIVED_MONTH."""
+    today = datetime.utcnow().date()
+    return (today.year - ARCHIVED_MONTH.year) * 12 + today.month - ARCHIVED_MONTH.month - 1
+
+
+async def test_archive(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, archived_partition: str) -> None:
+    script = _load_script(monkeypatch, '--keep-months', str(_keep_months()), '--archive-dir', str(tmp_path))
+
+    await script.main()
+
+    async with engine.connect() as conn:
+        partitions = [name for name, _ in await get_game_partitions(conn)]
+        table = await conn.scalar(text(f"SELECT to_regclass('{DEFAULT_SCHEMA}.{archived_partition}')"))
+
+    assert archived_partition not in partitions
+    assert table is None
+
+    with gzip.open(tmp_path / f'{archived_partition}.csv.gz', 'rt') as file:
+        rows = list(csv.DictReader(file))
+
+    assert len(rows) == 1
+    assert int(rows[0]['user_id']) == USER_ID
+    # nothing newer than the cutoff is archived
+    assert [path.name for path in tmp_path.iterdir()] == [f'{archived_partition}.csv.gz']
+
+
+async def test_archive_export_failed(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, archived_partition: str) -> None:
+    script = _load_script(monkeypatch, '--keep-months', str(_keep_months()), '--archive-dir', str(tmp_path))
+
+    def failing_open(*args: Any, **kwargs: Any) -> None:
+        raise OSError('No space left on device')
+
+    monkeypatch.setattr(gzip, 'open', failing_open)
+
+    with pytest.raises(OSError):
+        await script.main()
+
+    # the partition stays attached with its games, so the next run archives it
+    async with engine.connect() as conn:
+        partitions = [name for name, _ in await get_game_partitions(conn)]
+        games = await conn.scalar(text(f'SELECT count(*) FROM {DEFAULT_SCHEMA}.{archived_partition}'))
+
+    assert archived_partition in partitions
+    assert games == 1
+    assert not list(tmp_path.iterdir())
+
+
+async def test_dry_run(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    tmp_path: Path,
+    archived_partition: str,
+) -> None:
+    script = _load_script(
+        monkeypatch, '--keep-months', str(_keep_months()), '--archive-dir', str(tmp_path), '--dry-run'
+    )
+
+    await script.main()
+
+    async with engine.connect() as conn:
+        partitions = [name for name, _ in await get_game_partitions(conn)]
+
+    assert archived_partition in partitions
+    assert capsys.readouterr().out == f'{archived_partition} would be archived\n'
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,173 @@
+import sys
+import json
+import importlib
+from datetime import date, datetime
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from webapp.models.sirius.game import Game
+from webapp.models.sirius.game_daily_stats import GameDailyStats
+
+ITEMS = [
+    1,
+    -23.5e-2,
+    12345678901234567890,
+    'a string, with [brackets] and "quotes" \\ ünïcode',
+    '',
+    True,
+    False,
+    None,
+    [],
+    {},
+    {'id': 1, 'nested': [1, {'deep': [True, None, 'x']}], 'value': 0.125},
+    [[1, 2], [3, [4, 5]]],
+    1000,
+]
+
+
+@pytest.fixture()
+def script(monkeypatch: pytest.MonkeyPatch) -> ModuleType:
+    # arguments are parsed on import
+    monkeypatch.setattr(sys, 'argv', ['load_data', 'fixture.json'])
+    return importlib.import_module('scripts.load_data')
+
+
+def _write(tmp_path: Path, text: str) -> Path:
+    path = tmp_path / 'fixture.json'
+    path.write_text(text, encoding='utf-8')
+    return path
+
+
+def _parse(script: ModuleType, path: Path, read_size: int) -> List[Any]:
+    with open(path, 'r', encoding='utf-8') as file:
+        return list(script.iter_json_array(file, read_size))
+
+
+@pytest.mark.parametrize('read_size', [1, 2, 3, 5, 8, 64, 1 << 16])
+@pytest.mark.parametrize(
+    'text',
+    [
+        json.dumps(ITEMS),
+        json.dumps(ITEMS, indent=4),
+        '  \n\t  ' + json.dumps(ITEMS, separators=(',', ':')) + '\n',
+        '[]',
+        ' [ ] ',
+        '[12345]',
+        '[1,22,333,4444]',
+    ],
+)
+def test_iter_json_array(script: ModuleType, tmp_path: Path, text: str, read_size: int) -> None:
+    path = _write(tmp_path, text)
+
+    assert _parse(script, path, read_size) == json.loads(text)
+
+
+@pytest.mark.parametrize('read_size', [1, 4, 1 << 16])
+@pytest.mark.parametrize(
+    ('text', 'error'),
+    [
+        ('{"id": 1}', ValueError),
+        ('', ValueError),
+        ('[1, 2, 3', json.JSONDecodeError),
+        ('[1, {"id": 2', json.JSONDecodeError),
+        ('[1, nul]', json.JSONDecodeError),
+    ],
+)
+def test_iter_json_array_invalid(
+    script: ModuleType, tmp_path: Path, text: str, error: type[Exception], read_size: int
+) -> None:
+    path = _write(tmp_path, text)
+
+    with pytest.raises(error):
+        _parse(script, path, read_size)
+
+
+@pytest.mark.parametrize(
+    ('row', 'expected'),
+    [
+        (
+            {'user_id': 1, 'won': True, 'ships_sank': 3, 'ships_destroyed': 10},
+            ['user_id', 'won', 'ships_sank', 'ships_destroyed', 'abandoned', 'timestamp'],
+        ),
+        (
+            {'id': 7, 'user_id': 1, 'won': False, 'ships_sank': 3, 'ships_destroyed': 10, 'moves': None},
+            ['id', 'user_id', 'won', 'ships_sank', 'ships_destroyed', 'abandoned', 'moves', 'timestamp'],
+        ),
+    ],
+)
+def test_get_columns(script: ModuleType, row: Dict[str, Any], expected: List[str]) -> None:
+    columns = script.get_columns(Game.__table__, row)
+
+    assert [column.name for column in columns] == expected
+
+
+def test_get_columns_unknown(script: ModuleType) -> None:
+    with pytest.raises(ValueError, match='has no columns'):
+        script.get_columns(Game.__table__, {'user_id': 1, 'score': 10})
+
+
+@pytest.mark.parametrize(
+    ('table', 'first_row', 'row', 'expected'),
+    [
+        (
+            Game.__table__,
+            {'user_id': 1, 'won': True, 'ships_sank': 3, 'ships_destroyed': 10, 'timestamp': '2024-04-16 13:16:24'},
+            {'user_id': 2, 'won': False, 'ships_sank': 1, 'ships_destroyed': 4, 'timestamp': '2024-03-01T00:00:00.5'},
+            (2, False, 1, 4, False, datetime(2024, 3, 1, 0, 0, 0, 500000)),
+        ),
+        (
+            Game.__table__,
+            {'user_id': 1, 'won': True, 'ships_sank': 3, 'ships_destroyed': 10, 'moves': None},
+            # moves is nullable without a default
+            {'user_id': 2, 'won': True, 'ships_sank': 3, 'ships_destroyed': 10, 'abandoned': True},
+            (2, True, 3, 10, True, None),
+        ),
+        (
+            GameDailyStats.__table__,
+            {'user_id': 1, 'day': '2024-04-16', 'wins': 1},
+            {'user_id': 1, 'day': '2024-04-17'},
+            (1, date(2024, 4, 17), 0, 0, 0, 0),
+        ),
+    ],
+)
+def test_convert_row(
+    script: ModuleType, table: Any, first_row: Dict[str, Any], row: Dict[str, Any], expected: Tuple[Any, ...]
+) -> None:
+    columns = script.get_columns(table, first_row)
+
+    assert script.convert_row(columns, row)[: len(expected)] == expected
+
+
+def test_convert_row_default(script: ModuleType) -> None:
+    columns = script.get_columns(Game.__table__, {'user_id': 1, 'won': True, 'ships_sank': 3, 'ships_destroyed': 10})
+    before = datetime.utcnow()
+
+    *_, abandoned, timestamp = script.convert_row(
+        columns, {'user_id': 1, 'won': True, 'ships_sank': 3, 'ships_destroyed': 10}
+    )
+
+    assert abandoned is False
+    assert before <= timestamp <= datetime.utcnow()
+
+
+@pytest.mark.parametrize(
+    ('row', 'match'),
+    [
+        # won has neither a default nor is nullable
+        ({'user_id': 1, 'ships_sank': 3, 'ships_destroyed': 10}, 'column won has no value nor default'),
+        # the first row has no moves, so they can't be loaded
+        (
+            {'user_id': 1, 'won': True, 'ships_sank': 3, 'ships_destroyed': 10, 'moves': None},
+            r"columns \['moves'\] are not in the first row",
+        ),
+        ({'user_id': 1, 'won': True, 'ships_sank': 3, 'ships_destroyed': 10, 'score': 1}, r"\['score'\]"),
+    ],
+)
+def test_convert_row_invalid(script: ModuleType, row: Dict[str, Any], match: str) -> None:
+    columns = script.get_columns(Game.__table__, {'user_id': 1, 'won': True, 'ships_sank': 3, 'ships_destroyed': 10})
+
+    with pytest.raises(ValueError, match=match):
+        script.convert_row(columns, row)
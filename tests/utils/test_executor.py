@@ -0,0 +1,66 @@
+from typing import Any, AsyncGenerator, Callable, Tuple
+
+import pytest
+
+from conf.config import settings
+from webapp.game import operations
+from webapp.game.core import BattleShipGame
+from webapp.game.exceptions import SquareStrikedError
+from webapp.utils.executor import run_engine, shutdown_executors
+
+SEED = 42
+TARGET = (3, 4)
+
+
+@pytest.fixture(params=['thread', 'process'])
+async def executor(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[str, None]:
+    monkeypatch.setattr(settings, 'ENGINE_EXECUTOR', request.param)
+    # every board is offloaded
+    monkeypatch.setattr(settings, 'ENGINE_OFFLOAD_MIN_CELLS', 0)
+    yield request.param
+    shutdown_executors()
+
+
+def _create_game() -> BattleShipGame:
+    game = BattleShipGame.new(1, seed=SEED)
+    game.setup_random_ships(game.ai)
+    game.setup_random_ships(game.player)
+    return game
+
+
+def _copy(game: BattleShipGame) -> BattleShipGame:
+    return BattleShipGame.restore(game.model_dump())
+
+
+def _strip_timing(result: Any) -> Any:
+    # seconds spent on choosing the AI's target differ between runs
+    return result[:3] if isinstance(result, tuple) and len(result) == 4 else result
+
+
+@pytest.mark.parametrize(
+    ('func', 'args'),
+    [
+        (operations.player_strike, (TARGET,)),
+        (operations.ai_strike, ()),
+        (operations.choose_ai_target, ()),
+    ],
+)
+async def test_run_engine_matches_inline(executor: str, func: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+    game = _create_game()
+    inline_game = _copy(game)
+    expected = func(inline_game, *args)
+
+    offloaded_game, result = await run_engine(_copy(game), func, *args)
+
+    assert _strip_timing(result) == _strip_timing(expected)
+    assert offloaded_game.model_dump() == inline_game.model_dump()
+
+
+async def test_run_engine_error(executor: str) -> None:
+    game = _create_game()
+    game, _ = await run_engine(game, operations.player_strike, TARGET)
+    # the player strikes the same square again even if it was a miss
+    game.turn_id = game.player.user_id
+
+    with pytest.raises(SquareStrikedError):
+        await run_engine(game, operations.player_strike, TARGET)
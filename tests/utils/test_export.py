@@ -0,0 +1,76 @@
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Sequence
+
+import orjson
+import pytest
+
+from webapp.utils import export
+from webapp.utils.export import GAME_COLUMNS, encode_csv, encode_ndjson
+
+ROWS = [
+    (1, 1, True, 4, 10, False, datetime(2024, 3, 20, 13, 16, 24, 599959)),
+    (2, 1, False, 10, 7, True, datetime(2024, 4, 16, 13, 16, 24)),
+]
+
+
+async def _iter_rows(rows: List[Sequence[Any]]) -> AsyncIterator[Sequence[Any]]:
+    for row in rows:
+        yield row
+
+
+async def _encode(encoder: Any, rows: List[Sequence[Any]]) -> List[bytes]:
+    return [chunk async for chunk in encoder(GAME_COLUMNS, _iter_rows(rows))]
+
+
+async def test_encode_csv() -> None:
+    chunks = await _encode(encode_csv, ROWS)
+
+    assert b''.join(chunks).decode().splitlines() == [
+        'id,user_id,won,ships_sank,ships_destroyed,abandoned,timestamp',
+        '1,1,True,4,10,False,2024-03-20T13:16:24.599959',
+        '2,1,False,10,7,True,2024-04-16T13:16:24',
+    ]
+
+
+async def test_encode_ndjson() -> None:
+    chunks = await _encode(encode_ndjson, ROWS)
+
+    assert [orjson.loads(line) for line in b''.join(chunks).splitlines()] == [
+        {
+            'id': 1,
+            'user_id': 1,
+            'won': True,
+            'ships_sank': 4,
+            'ships_destroyed': 10,
+            'abandoned': False,
+            'timestamp': '2024-03-20T13:16:24.599959',
+        },
+        {
+            'id': 2,
+            'user_id': 1,
+            'won': False,
+            'ships_sank': 10,
+            'ships_destroyed': 7,
+            'abandoned': True,
+            'timestamp': '2024-04-16T13:16:24',
+        },
+    ]
+
+
+@pytest.mark.parametrize('encoder', [encode_csv, encode_ndjson])
+async def test_no_rows(encoder: Any) -> None:
+    expected = b'id,user_id,won,ships_sank,ships_destroyed,abandoned,timestamp\r\n' if encoder is encode_csv else b''
+
+    assert b''.join(await _encode(encoder, [])) == expected
+
+
+@pytest.mark.parametrize('encoder', [encode_csv, encode_ndjson])
+async def test_flush(monkeypatch: pytest.MonkeyPatch, encoder: Any) -> None:
+    encoded = b''.join(await _encode(encoder, ROWS * 3))
+    monkeypatch.setattr(export, 'FLUSH_SIZE', 1)
+
+    chunks = await _encode(encoder, ROWS * 3)
+
+    # every row is flushed on its own, the header goes with the first one
+    assert len([chunk for chunk in chunks if chunk]) == len(ROWS) * 3
+    assert b''.join(chunks) == encoded
@@ -0,0 +1,142 @@
+import sys
+import json
+import logging
+from typing import Any, Dict, Generator, List
+
+import pytest
+
+from conf.config import settings
+from webapp.logger import ContextFilter, DebugSamplingFilter, JsonFormatter, correlation_id_ctx, logger
+from webapp.middleware.timing import phase_timings_ctx
+from webapp.on_startup.logger import setup_logger, stop_logger
+
+
+@pytest.fixture()
+def _restore_logging() -> Generator[None, None, None]:
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    levels = {name: logging.getLogger(name).level for name in (logger.name, 'webapp.game')}
+
+    yield
+
+    stop_logger()
+    root.handlers, root.level = handlers, level
+    for name, logger_level in levels.items():
+        logging.getLogger(name).setLevel(logger_level)
+
+
+def _record(level: int = logging.INFO, **kwargs: Any) -> logging.LogRecord:
+    return logging.LogRecord(logger.name, level, __file__, 1, 'moves: %d', (3,), None, **kwargs)
+
+
+def _read_records(capsys: pytest.CaptureFixture[str]) -> List[Dict[str, Any]]:
+    return [json.loads(line) for line in capsys.readouterr().err.splitlines()]
+
+
+def test_json_formatter() -> None:
+    data = json.loads(JsonFormatter().format(_record(logging.WARNING)))
+
+    assert data.pop('time').endswith('+00:00')
+    assert data == {'level': 'WARNING', 'logger': logger.name, 'message': 'moves: 3'}
+
+
+def test_json_formatter_context() -> None:
+    record = _record()
+    record.correlation_id = 'abc'
+    record.phases = {'engine': 1.5}
+
+    data = json.loads(JsonFormatter().format(record))
+
+    assert data['correlation_id'] == 'abc'
+    assert data['phases'] == {'engine': 1.5}
+
+
+def test_json_formatter_exc_info() -> None:
+    try:
+        raise ValueError('bad square')
+    except ValueError:
+        record = _record(logging.ERROR)
+        record.exc_info = sys.exc_info()
+
+    data = json.loads(JsonFormatter().format(record))
+
+    assert data['exc'].startswith('Traceback (most recent call last):')
+    assert data['exc'].endswith('ValueError: bad square')
+
+
+@pytest.mark.parametrize(
+    ('correlation_id', 'timings', 'expected_phases'),
+    [
+        ('abc', {'engine': 0.0012345, 'redis_get': 0.002}, {'engine': 1.234, 'redis_get': 2.0}),
+        ('abc', None, None),
+        (None, {}, None),
+    ],
+)
+def test_context_filter(
+    correlation_id: str | None, timings: Dict[str, float] | None, expected_phases: Dict[str, float] | None
+) -> None:
+    id_token = correlation_id_ctx.set(correlation_id)  # type: ignore[arg-type]
+    timings_token = phase_timings_ctx.set(timings)
+    try:
+        record = _record()
+        assert ContextFilter().filter(record)
+    finally:
+        correlation_id_ctx.reset(id_token)
+        phase_timings_ctx.reset(timings_token)
+
+    assert record.correlation_id == correlation_id
+    assert record.phases == expected_phases
+
+
+@pytest.mark.parametrize(('rate', 'expected_debug'), [(0, 0), (1, 100)])
+def test_debug_sampling_filter(rate: float, expected_debug: int) -> None:
+    sampling_filter = DebugSamplingFilter(rate)
+
+    assert sum(sampling_filter.filter(_record(logging.DEBUG)) for _ in range(100)) == expected_debug
+    # other levels are never sampled out
+    assert all(sampling_filter.filter(_record(level)) for level in (logging.INFO, logging.WARNING, logging.ERROR))
+
+
+@pytest.mark.parametrize('use_queue', [True, False])
+@pytest.mark.usefixtures('_restore_logging')
+def test_setup_logger(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], use_queue: bool) -> None:
+    monkeypatch.setattr(settings, 'LOG_FORMAT', 'json')
+    monkeypatch.setattr(settings, 'LOG_LEVEL', 'debug')
+    monkeypatch.setattr(settings, 'LOG_DEBUG_SAMPLE_RATE', 0)
+    setup_logger(use_queue)
+
+    token = correlation_id_ctx.set('request-1')
+    try:
+        logger.debug('sampled out')
+        logger.info('game %d saved', 7)
+        try:
+            raise KeyError('game')
+        except KeyError:
+            logger.exception('save failed')
+    finally:
+        correlation_id_ctx.reset(token)
+    logger.info('outside of requests')
+
+    # queued records are written by the listener thread until it is stopped
+    stop_logger()
+    records = _read_records(capsys)
+
+    assert [(record['level'], record['message']) for record in records] == [
+        ('INFO', 'game 7 saved'),
+        ('ERROR', 'save failed'),
+        ('INFO', 'outside of requests'),
+    ]
+    assert [record.get('correlation_id') for record in records] == ['request-1', 'request-1', None]
+    assert records[1]['exc'].endswith("KeyError: 'game'")
+
+
+@pytest.mark.usefixtures('_restore_logging')
+def test_stop_logger_flushes(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setattr(settings, 'LOG_FORMAT', 'json')
+    setup_logger()
+
+    for number in range(1000):
+        logger.info('record %d', number)
+    stop_logger()
+
+    assert [record['message'] for record in _read_records(capsys)] == [f'record {number}' for number in range(1000)]
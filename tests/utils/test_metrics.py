@@ -0,0 +1,122 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from prometheus_client import REGISTRY
+
+from conf.config import settings
+from webapp.logger import correlation_id_ctx
+from webapp.middleware.metrics import integration_latency, observe_payload
+
+
+def _value(name: str, labels: Dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def _in_flight(integration: str) -> float:
+    return _value('integrations_in_flight', {'integration': integration})
+
+
+def _latency_count(integration: str) -> float:
+    return _value('integrations_latency_seconds_count', {'integration': integration})
+
+
+@integration_latency
+async def metrics_test_call(in_flight: List[float], error: Exception | None = None) -> str:
+    in_flight.append(_in_flight('metrics_test_call'))
+    await asyncio.sleep(0)
+    if error is not None:
+        raise error
+    return 'result'
+
+
+async def test_integration_latency() -> None:
+    in_flight: List[float] = []
+    before = _in_flight('metrics_test_call')
+    count = _latency_count('metrics_test_call')
+
+    assert await metrics_test_call(in_flight) == 'result'
+
+    assert in_flight == [before + 1]
+    assert _in_flight('metrics_test_call') == before
+    assert _latency_count('metrics_test_call') == count + 1
+
+
+async def test_integration_latency_concurrent() -> None:
+    in_flight: List[float] = []
+    before = _in_flight('metrics_test_call')
+
+    await asyncio.gather(*(metrics_test_call(in_flight) for _ in range(3)))
+
+    # every call is counted before any of them finishes
+    assert in_flight == [before + 1, before + 2, before + 3]
+    assert _in_flight('metrics_test_call') == before
+
+
+@pytest.mark.parametrize('error', [KeyError('game'), ConnectionError('refused'), asyncio.TimeoutError()])
+async def test_integration_latency_error(error: Exception) -> None:
+    in_flight: List[float] = []
+    labels = {'integration': 'metrics_test_call', 'error': type(error).__name__}
+    before = _in_flight('metrics_test_call')
+    errors = _value('integrations_errors_total', labels)
+    count = _latency_count('metrics_test_call')
+
+    with pytest.raises(type(error)):
+        await metrics_test_call(in_flight, error)
+
+    assert in_flight == [before + 1]
+    assert _in_flight('metrics_test_call') == before
+    assert _value('integrations_errors_total', labels) == errors + 1
+    # failed calls are timed too
+    assert _latency_count('metrics_test_call') == count + 1
+
+
+@pytest.mark.parametrize(
+    ('direction', 'size', 'bucket'),
+    [
+        ('read', 100, '256.0'),
+        ('written', 5000, '16384.0'),
+        ('written', 10_000_000, '+Inf'),
+    ],
+)
+def test_observe_payload(direction: str, size: int, bucket: str) -> None:
+    labels = {'integration': 'metrics_test_call', 'direction': direction}
+    count = _value('integrations_payload_bytes_count', labels)
+    total = _value('integrations_payload_bytes_sum', labels)
+    in_bucket = _value('integrations_payload_bytes_bucket', {**labels, 'le': bucket})
+    other_direction = {**labels, 'direction': 'written' if direction == 'read' else 'read'}
+    other_count = _value('integrations_payload_bytes_count', other_direction)
+
+    observe_payload('metrics_test_call', direction, size)  # type: ignore[arg-type]
+
+    assert _value('integrations_payload_bytes_count', labels) == count + 1
+    assert _value('integrations_payload_bytes_sum', labels) == total + size
+    assert _value('integrations_payload_bytes_bucket', {**labels, 'le': bucket}) == in_bucket + 1
+    assert _value('integrations_payload_bytes_count', other_direction) == other_count
+
+
+def _exemplar(labels: Dict[str, str]) -> Any:
+    for metric in REGISTRY.collect():
+        for sample in metric.samples:
+            if sample.name == 'integrations_payload_bytes_bucket' and sample.labels == labels:
+                return sample.exemplar
+    return None
+
+
+@pytest.mark.parametrize('enabled', [True, False])
+def test_observe_payload_exemplar(monkeypatch: pytest.MonkeyPatch, enabled: bool) -> None:
+    monkeypatch.setattr(settings, 'METRICS_EXEMPLARS', enabled)
+    correlation_id = f'metrics-test-{enabled}'
+    token = correlation_id_ctx.set(correlation_id)
+    try:
+        observe_payload('metrics_test_exemplar', 'read', 3 if enabled else 30)
+    finally:
+        correlation_id_ctx.reset(token)
+
+    exemplar = _exemplar({'integration': 'metrics_test_exemplar', 'direction': 'read', 'le': '64.0'})
+
+    if enabled:
+        assert exemplar.labels == {'correlation_id': correlation_id}
+        assert exemplar.value == 3
+    else:
+        assert exemplar is None or exemplar.labels['correlation_id'] != correlation_id
@@ -0,0 +1,73 @@
+from pathlib import Path
+from typing import AsyncGenerator, Dict, Set
+
+import pytest
+from httpx import AsyncClient
+from starlette import status
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from conf.config import settings
+from webapp.middleware.profiler import ProfilerMiddleware
+from webapp.utils.auth.jwt import jwt_auth
+
+ADMIN_ID = 1
+USER_ID = 2
+
+
+async def endpoint(request: Request) -> PlainTextResponse:
+    return PlainTextResponse('ok')
+
+
+@pytest.fixture()
+async def client(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> AsyncGenerator[AsyncClient, None]:
+    monkeypatch.setattr(settings, 'REQUEST_PROFILE_DIR', str(tmp_path))
+    monkeypatch.setattr(settings, 'REQUEST_PROFILE_MAX_FILES', 3)
+    monkeypatch.setattr(settings, 'ADMIN_USER_IDS', [ADMIN_ID])
+
+    app = Starlette(routes=[Route('/', endpoint)])
+    app.add_middleware(ProfilerMiddleware)
+
+    async with AsyncClient(app=app, base_url='http://test.com') as client:
+        yield client
+
+
+def _profiles(path: Path) -> Set[str]:
+    return {profile.name for profile in path.glob('*.prof')}
+
+
+@pytest.mark.parametrize(
+    ('headers', 'profiled'),
+    [
+        ({'X-Profile': '1', 'Authorization': f'Bearer {jwt_auth.create_token(ADMIN_ID)}'}, True),
+        ({'X-Profile': '1', 'Authorization': f'Bearer {jwt_auth.create_token(USER_ID)}'}, False),
+        ({'X-Profile': '1', 'Authorization': 'Bearer invalid'}, False),
+        ({'X-Profile': '1', 'Authorization': 'invalid'}, False),
+        ({'X-Profile': '1'}, False),
+        ({'Authorization': f'Bearer {jwt_auth.create_token(ADMIN_ID)}'}, False),
+    ],
+)
+async def test_profile_admin_only(client: AsyncClient, tmp_path: Path, headers: Dict[str, str], profiled: bool) -> None:
+    response = await client.get('/', headers=headers)
+
+    # the request is served either way
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text == 'ok'
+    assert len(_profiles(tmp_path)) == int(profiled)
+
+
+async def test_profiles_rotated(client: AsyncClient, tmp_path: Path) -> None:
+    headers = {'X-Profile': '1', 'Authorization': f'Bearer {jwt_auth.create_token(ADMIN_ID)}'}
+
+    for _ in range(5):
+        before = _profiles(tmp_path)
+        await client.get('/', headers=headers)
+        latest = _profiles(tmp_path) - before
+
+        assert len(latest) == 1
+        assert len(_profiles(tmp_path)) <= settings.REQUEST_PROFILE_MAX_FILES
+
+    assert len(_profiles(tmp_path)) == settings.REQUEST_PROFILE_MAX_FILES
+    assert latest <= _profiles(tmp_path)
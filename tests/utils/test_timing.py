@@ -0,0 +1,110 @@
+import time
+import asyncio
+from typing import AsyncGenerator, Dict
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from starlette import status
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from conf.config import settings
+from webapp.middleware.timing import TimingMiddleware, format_server_timing, phase, phase_timings_ctx
+
+SLEEP = 0.01
+
+
+def _blocking_load() -> None:
+    with phase('load'):
+        time.sleep(SLEEP)
+
+
+async def endpoint(request: Request) -> PlainTextResponse:
+    with phase('redis_get'):
+        await asyncio.sleep(SLEEP)
+    # phases of dependencies run in threads are added to the request too
+    await asyncio.to_thread(_blocking_load)
+    with phase('redis_get'):
+        await asyncio.sleep(SLEEP)
+    return PlainTextResponse('ok')
+
+
+@pytest.fixture()
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    app = Starlette(routes=[Route('/timing-test', endpoint)])
+    app.add_middleware(TimingMiddleware)
+
+    async with AsyncClient(app=app, base_url='http://test.com') as client:
+        yield client
+
+
+def _parse_server_timing(header: str) -> Dict[str, float]:
+    entries = {}
+    for entry in header.split(', '):
+        name, duration = entry.split(';dur=')
+        entries[name] = float(duration)
+    return entries
+
+
+def _phase_count(name: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            'http_request_phase_latency_seconds_count', {'endpoint': '/timing-test', 'phase': name}
+        )
+        or 0
+    )
+
+
+def _phase_sum(name: str) -> float:
+    return (
+        REGISTRY.get_sample_value('http_request_phase_latency_seconds_sum', {'endpoint': '/timing-test', 'phase': name})
+        or 0
+    )
+
+
+def test_format_server_timing() -> None:
+    assert format_server_timing({'auth': 0.0001234, 'engine': 0.5}, 0.75) == (
+        'auth;dur=0.123, engine;dur=500.000, total;dur=750.000'
+    )
+
+
+def test_phase_outside_of_request() -> None:
+    with phase('engine'):
+        pass
+
+    assert phase_timings_ctx.get() is None
+
+
+async def test_server_timing(monkeypatch: pytest.MonkeyPatch, client: AsyncClient) -> None:
+    monkeypatch.setattr(settings, 'SERVER_TIMING_HEADER', True)
+
+    response = await client.get('/timing-test')
+
+    assert response.status_code == status.HTTP_200_OK
+    timings = _parse_server_timing(response.headers['Server-Timing'])
+    # phases in the order they started, repeated ones summed up, in milliseconds
+    assert list(timings) == ['redis_get', 'load', 'total']
+    assert timings['redis_get'] >= 2 * SLEEP * 1000
+    assert timings['load'] >= SLEEP * 1000
+    assert timings['total'] >= timings['redis_get'] + timings['load']
+
+
+@pytest.mark.parametrize('header', [True, False])
+async def test_phase_histogram(monkeypatch: pytest.MonkeyPatch, client: AsyncClient, header: bool) -> None:
+    monkeypatch.setattr(settings, 'SERVER_TIMING_HEADER', header)
+    counts = {name: _phase_count(name) for name in ('redis_get', 'load')}
+    sums = {name: _phase_sum(name) for name in ('redis_get', 'load')}
+
+    response = await client.get('/timing-test')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert ('Server-Timing' in response.headers) is header
+    # a phase is observed once per request
+    assert _phase_count('redis_get') == counts['redis_get'] + 1
+    assert _phase_count('load') == counts['load'] + 1
+    assert _phase_sum('redis_get') - sums['redis_get'] >= 2 * SLEEP
+    assert _phase_sum('load') - sums['load'] >= SLEEP
+    assert phase_timings_ctx.get() is None
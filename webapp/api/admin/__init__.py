@@ -0,0 +1 @@
+from . import export_games, profile
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Literal
+
+from fastapi import Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from conf.config import settings
+from webapp.api.admin.router import admin_router
+from webapp.crud.stats import iter_games
+from webapp.db.postgres import get_session
+from webapp.utils.auth.admin import validate_admin_token
+from webapp.utils.auth.jwt import JwtTokenT
+from webapp.utils.export import ENCODERS, GAME_COLUMNS
+
+
+@admin_router.get(
+    '/export_games',
+    response_class=StreamingResponse,
+)
+async def export_games(
+    export_format: Literal['csv', 'ndjson'] = Query(default='csv', alias='format'),
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    user_id: int | None = None,
+    session: AsyncSession = Depends(get_session),
+    access_token: JwtTokenT = Depends(validate_admin_token),
+) -> StreamingResponse:
+    encoder, media_type = ENCODERS[export_format]
+    rows = iter_games(session, settings.EXPORT_FETCH_SIZE, start_date, end_date, user_id)
+
+    return StreamingResponse(
+        encoder(GAME_COLUMNS, rows),
+        media_type=media_type,
+        headers={'Content-Disposition': f'attachment; filename="games.{export_format}"'},
+    )
@@ -0,0 +1,48 @@
+import os
+import asyncio
+from typing import Literal
+
+from fastapi import Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
+from starlette import status
+
+from conf.config import settings
+from webapp.api.admin.router import admin_router
+from webapp.utils.auth.admin import validate_admin_token
+from webapp.utils.auth.jwt import JwtTokenT
+from webapp.utils.profiler import SamplingProfiler, to_collapsed, to_speedscope
+
+# one profile per worker at a time, concurrent samplers would skew each other
+profiler_lock = asyncio.Lock()
+
+
+@admin_router.get(
+    '/profile',
+    response_class=Response,
+)
+async def profile(
+    seconds: float = Query(default=10, gt=0, le=settings.PROFILER_MAX_SECONDS),
+    interval: float = Query(default=settings.PROFILER_INTERVAL, ge=0.001, le=1),
+    profile_format: Literal['collapsed', 'speedscope'] = Query(default='collapsed', alias='format'),
+    access_token: JwtTokenT = Depends(validate_admin_token),
+) -> Response:
+    """Samples stacks of the worker serving the request for `seconds`."""
+    if profiler_lock.locked():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail='Profiling is already running')
+
+    async with profiler_lock:
+        profiler = SamplingProfiler(interval)
+        profiler.start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profiler.stop()
+
+    pid = os.getpid()
+    headers = {'X-Worker-Pid': str(pid)}
+
+    if profile_format == 'speedscope':
+        headers['Content-Disposition'] = f'attachment; filename="profile-{pid}.speedscope.json"'
+        return ORJSONResponse(to_speedscope(profiler.samples, interval, f'worker {pid}'), headers=headers)
+
+    return PlainTextResponse(to_collapsed(profiler.samples), headers=headers)
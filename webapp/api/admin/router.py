@@ -0,0 +1,3 @@
+from fastapi import APIRouter
+
+admin_router = APIRouter(prefix='/admin')
@@ -1 +1 @@
-from . import create_game, get_boards, make_strike, setup_ships
+from . import create_game, get_boards, make_strike, replay, setup_ships
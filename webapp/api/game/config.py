@@ -1 +0,0 @@
-CELLS_COUNT = 10
@@ -6,6 +6,7 @@ from fastapi.responses import ORJSONResponse
 from webapp.api.game.router import game_router
 from webapp.cache.get_game import get_game_by_user
 from webapp.game.core import BattleShipGame
+from webapp.middleware.timing import phase
 from webapp.schema.ship import GetAIBoardResponse, GetPlayerBoardResponse
 
 
@@ -18,7 +19,8 @@ async def get_opponent_board(
 ) -> ORJSONResponse:
     player = game.player
 
-    board = game.opponent_map(player.user_id)
+    with phase('engine'):
+        board = game.opponent_map(player.user_id)
 
     return _prepare_response(
         {
@@ -34,7 +36,8 @@ async def get_opponent_board(
 async def get_player_board(
     game: BattleShipGame = Depends(get_game_by_user),
 ) -> ORJSONResponse:
-    board = game.player_map()
+    with phase('engine'):
+        board = game.player_map()
 
     return _prepare_response(
         {
@@ -44,8 +47,9 @@ async def get_player_board(
 
 
 def _prepare_response(data: Dict[str, Any]) -> ORJSONResponse:
-    return ORJSONResponse(
-        {
-            'data': data,
-        }
-    )
+    with phase('encode'):
+        return ORJSONResponse(
+            {
+                'data': data,
+            }
+        )
@@ -1,14 +1,22 @@
 from typing import Any, Dict
 
-from fastapi import Depends, HTTPException
+from fastapi import BackgroundTasks, Depends, HTTPException
 from fastapi.responses import ORJSONResponse
 from starlette import status
 
+from conf.config import settings
 from webapp.api.game.router import game_router
-from webapp.cache.cache import redis_set
+from webapp.cache.ai_move import pop_ai_move, save_ai_move
 from webapp.cache.get_game import get_game_by_user
-from webapp.game.core import BattleShipGame, Player
+from webapp.cache.moves import ACTORS, AI, PLAYER, pack_move
+from webapp.cache.save_game import get_game_ttl, save_game
+from webapp.game import operations
+from webapp.game.core import BattleShipGame, HitStatus
+from webapp.logger import logger
+from webapp.middleware.metrics import ENGINE_AI_TARGET_LATENCY, ENGINE_GAME_MOVES, ENGINE_STRIKES
+from webapp.middleware.timing import phase
 from webapp.schema.strike import AIStrikeResponse, PlayerStrikeResponse, StrikeCoord
+from webapp.utils.executor import run_engine
 
 
 @game_router.post(
@@ -17,18 +25,23 @@ from webapp.schema.strike import AIStrikeResponse, PlayerStrikeResponse, StrikeC
 )
 async def player_strike(
     body: StrikeCoord,
+    background_tasks: BackgroundTasks,
     game: BattleShipGame = Depends(get_game_by_user),
 ) -> ORJSONResponse:
-    player: Player = game.player
     try:
-        result = game.player_strike(body.coord)
-        ai_board = game.opponent_map(player.user_id)
+        with phase('engine'):
+            game, (result, ai_board) = await run_engine(game, operations.player_strike, body.coord)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
     is_finished = game.ai.board.is_finished()
+    _observe_strike(game, PLAYER, result, is_finished)
 
-    await redis_set(BattleShipGame.__name__, player.user_id, game.model_dump())
+    await save_game(game, move=pack_move(PLAYER, body.coord, result))
+
+    # the client asks for the AI's strike next, its target is chosen after the response is sent
+    if settings.AI_MOVE_PRECOMPUTE and result == HitStatus.MISS and not is_finished:
+        background_tasks.add_task(_precompute_ai_move, game)
 
     return _prepare_response(
         {
@@ -44,19 +57,28 @@ async def player_strike(
     response_model=AIStrikeResponse,
 )
 async def ai_strike(
+    background_tasks: BackgroundTasks,
     game: BattleShipGame = Depends(get_game_by_user),
 ) -> ORJSONResponse:
-    player = game.player
+    precomputed = await pop_ai_move(game) if settings.AI_MOVE_PRECOMPUTE else None
 
     try:
-        result = game.ai_strike()
-        player_board = game.player_map()
+        with phase('engine'):
+            game, (coord, result, player_board, target_time) = await run_engine(game, operations.ai_strike, precomputed)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
-    is_finished = player.board.is_finished()
+    if target_time is not None:
+        ENGINE_AI_TARGET_LATENCY.observe(target_time)
+
+    is_finished = game.player.board.is_finished()
+    _observe_strike(game, AI, result, is_finished)
+
+    await save_game(game, move=pack_move(AI, coord, result))
 
-    await redis_set(BattleShipGame.__name__, player.user_id, game.model_dump())
+    # the AI strikes again after a hit
+    if settings.AI_MOVE_PRECOMPUTE and result != HitStatus.MISS and not is_finished:
+        background_tasks.add_task(_precompute_ai_move, game)
 
     return _prepare_response(
         {
@@ -67,9 +89,28 @@ async def ai_strike(
     )
 
 
+async def _precompute_ai_move(game: BattleShipGame) -> None:
+    """Saves the AI's next target, the game object is no longer used by the request and can be changed."""
+    rng_state = game.rng.state
+    try:
+        game, move = await run_engine(game, operations.choose_ai_target)
+        await save_ai_move(game, rng_state, move, get_game_ttl(game))
+    except Exception:
+        # ai_strike chooses the target itself then
+        logger.exception('AI move precomputation failed')
+
+
+def _observe_strike(game: BattleShipGame, actor: int, result: HitStatus, is_finished: bool) -> None:
+    ENGINE_STRIKES.labels(actor=ACTORS[actor], result=result.value).inc()
+
+    if is_finished:
+        ENGINE_GAME_MOVES.labels(winner=ACTORS[actor]).observe(game.moves_count)
+
+
 def _prepare_response(data: Dict[str, Any]) -> ORJSONResponse:
-    return ORJSONResponse(
-        {
-            'data': data,
-        }
-    )
+    with phase('encode'):
+        return ORJSONResponse(
+            {
+                'data': data,
+            }
+        )
@@ -0,0 +1,64 @@
+from typing import AsyncIterator
+
+import orjson
+from fastapi import Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from webapp.api.game.router import game_router
+from webapp.cache.moves import ACTORS, MOVE, RESULTS, iter_moves, unpack_moves
+from webapp.crud.stats import get_game_moves
+from webapp.db.postgres import get_session
+from webapp.utils.auth.jwt import JwtTokenT, jwt_auth
+
+# archived moves are sent in chunks of this many moves
+CHUNK_MOVES = 100
+
+
+@game_router.get(
+    '/replay',
+    response_class=StreamingResponse,
+)
+async def replay(
+    game_id: int | None = None,
+    session: AsyncSession = Depends(get_session),
+    access_token: JwtTokenT = Depends(jwt_auth.validate_token),
+) -> StreamingResponse:
+    """Streams moves as NDJSON: of the current game, or of a saved game if game_id is given."""
+    user_id = access_token['user_id']
+
+    if game_id is None:
+        moves = iter_moves(user_id)
+    else:
+        archived = await get_game_moves(session, user_id, game_id)
+
+        if archived is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail=f'Moves of game with id={game_id} not found'
+            )
+
+        moves = _iter_chunks(archived)
+
+    return StreamingResponse(_encode_moves(moves), media_type='application/x-ndjson')
+
+
+async def _iter_chunks(data: bytes) -> AsyncIterator[bytes]:
+    chunk_size = CHUNK_MOVES * MOVE.size
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
+
+async def _encode_moves(moves: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    async for packed in moves:
+        yield b''.join(
+            orjson.dumps(
+                {
+                    'actor': ACTORS[actor],
+                    'coord': (x_coord, y_coord),
+                    'result': RESULTS[result],
+                }
+            )
+            + b'\n'
+            for actor, x_coord, y_coord, result in unpack_moves(packed)
+        )
@@ -5,11 +5,15 @@ from fastapi.responses import ORJSONResponse
 from starlette import status
 
 from webapp.api.game.router import game_router
-from webapp.cache.cache import redis_set
 from webapp.cache.get_game import get_game_by_user
+from webapp.cache.save_game import save_game
+from webapp.game import operations
 from webapp.game.core import BattleShipGame
+from webapp.middleware.metrics import ENGINE_PLACEMENT_RETRIES
+from webapp.middleware.timing import phase
 from webapp.schema.game import SetupRulesResponse
 from webapp.schema.ship import CreateRandomShipsResponse, CreateShipResponse, PlaceShip
+from webapp.utils.executor import run_engine
 
 
 @game_router.get(
@@ -21,7 +25,8 @@ async def get_setup_rules(
 ) -> ORJSONResponse:
     return _prepare_response(
         {
-            'ship_types': game.SHIP_TYPES,
+            'size': game.player.board.lines_cnt,
+            'ship_types': game.ship_types,
         }
     )
 
@@ -33,17 +38,18 @@ async def get_setup_rules(
 async def place_random_ships(
     game: BattleShipGame = Depends(get_game_by_user),
 ) -> ORJSONResponse:
-    player = game.player
-
     try:
-        game.setup_random_ships(player)
+        with phase('engine'):
+            game, retries = await run_engine(game, operations.setup_random_ships, False)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
+    ENGINE_PLACEMENT_RETRIES.observe(retries)
+
     player_board = game.player_map()
-    ai_board = game.opponent_map(player.user_id)
+    ai_board = game.opponent_map(game.player.user_id)
 
-    await redis_set(BattleShipGame.__name__, player.user_id, game.model_dump())
+    await save_game(game)
 
     return _prepare_response(
         {
@@ -61,14 +67,13 @@ async def place_ship(
     body: PlaceShip,
     game: BattleShipGame = Depends(get_game_by_user),
 ) -> ORJSONResponse:
-    player = game.player
-
     try:
-        game.place_ship(body.coords)
+        with phase('engine'):
+            game.place_ship(body.coords)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
-    await redis_set(BattleShipGame.__name__, player.user_id, game.model_dump())
+    await save_game(game)
 
     return _prepare_response(
         {
@@ -78,8 +83,9 @@ async def place_ship(
 
 
 def _prepare_response(data: Dict[str, Any]) -> ORJSONResponse:
-    return ORJSONResponse(
-        {
-            'data': data,
-        }
-    )
+    with phase('encode'):
+        return ORJSONResponse(
+            {
+                'data': data,
+            }
+        )
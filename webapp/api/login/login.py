@@ -2,11 +2,16 @@ from fastapi import Depends
 from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from conf.config import settings
 from webapp.api.login.router import auth_router
-from webapp.crud.user import create_user, get_user
+from webapp.crud.user import get_or_create_user
 from webapp.db.postgres import get_session
 from webapp.schema.user import UserInfo, UserLoginResponse
 from webapp.utils.auth.jwt import jwt_auth
+from webapp.utils.lru import LRUCache
+
+# usernames are never reassigned, so cached ids can't become stale
+user_id_cache: LRUCache[int, int] = LRUCache(settings.USER_ID_CACHE_SIZE)
 
 
 @auth_router.post(
@@ -17,13 +22,14 @@ async def login(
     body: UserInfo,
     session: AsyncSession = Depends(get_session),
 ) -> ORJSONResponse:
-    user = await get_user(session, body)
+    user_id = user_id_cache.get(body.username)
 
-    if user is None:
-        user = await create_user(session, body)
+    if user_id is None:
+        user_id = await get_or_create_user(session, body)
+        user_id_cache.set(body.username, user_id)
 
     return ORJSONResponse(
         {
-            'access_token': jwt_auth.create_token(user.id),
+            'access_token': jwt_auth.create_token(user_id),
         }
     )
@@ -1 +1 @@
-from . import get_games_stats, save_game_stats
+from . import get_games_stats, get_history, get_leaderboard, get_timeline, save_game_stats
@@ -0,0 +1,61 @@
+from typing import Any, Dict
+
+from fastapi import Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from webapp.api.stats.router import stats_router
+from webapp.crud.stats import get_game_history
+from webapp.db.postgres import get_session
+from webapp.schema.stats import GetHistoryResponse
+from webapp.utils.auth.jwt import JwtTokenT, jwt_auth
+from webapp.utils.cursor import decode_cursor, encode_cursor
+
+
+@stats_router.get(
+    '/history',
+    response_model=GetHistoryResponse,
+)
+async def get_history(
+    cursor: str | None = None,
+    limit: int = Query(default=20, gt=0, le=100),
+    session: AsyncSession = Depends(get_session),
+    access_token: JwtTokenT = Depends(jwt_auth.validate_token),
+) -> ORJSONResponse:
+    try:
+        before = decode_cursor(cursor) if cursor is not None else None
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    rows = await get_game_history(session, access_token['user_id'], limit, before)
+
+    if len(rows) == limit:
+        next_cursor = encode_cursor(rows[-1].timestamp, rows[-1].id)
+    else:
+        next_cursor = None
+
+    return _prepare_response(
+        {
+            'games': [
+                {
+                    'id': row.id,
+                    'timestamp': row.timestamp,
+                    'won': row.won,
+                    'ships_sank': row.ships_sank,
+                    'ships_destroyed': row.ships_destroyed,
+                    'abandoned': row.abandoned,
+                }
+                for row in rows
+            ],
+            'next_cursor': next_cursor,
+        }
+    )
+
+
+def _prepare_response(data: Dict[str, Any]) -> ORJSONResponse:
+    return ORJSONResponse(
+        {
+            'data': data,
+        }
+    )
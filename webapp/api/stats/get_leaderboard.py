@@ -0,0 +1,38 @@
+from typing import Any, Dict, Literal
+
+from fastapi import Depends, Query
+from fastapi.responses import ORJSONResponse
+
+from webapp.api.stats.router import stats_router
+from webapp.cache.leaderboard import get_leaderboard
+from webapp.schema.stats import GetLeaderboardResponse
+from webapp.utils.auth.jwt import JwtTokenT, jwt_auth
+
+
+@stats_router.get(
+    '/leaderboard',
+    response_model=GetLeaderboardResponse,
+)
+async def get_stats_leaderboard(
+    metric: Literal['wins', 'win_rate', 'ships_destroyed'] = 'wins',
+    period: Literal['all', 'week', 'month'] = 'all',
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=10, gt=0, le=100),
+    access_token: JwtTokenT = Depends(jwt_auth.validate_token),
+) -> ORJSONResponse:
+    top, user_rank = await get_leaderboard(metric, period, access_token['user_id'], offset, limit)
+
+    return _prepare_response(
+        {
+            'top': [{'rank': rank, 'user_id': user_id, 'score': score} for rank, user_id, score in top],
+            'me': {'rank': user_rank[0], 'score': user_rank[1]} if user_rank is not None else None,
+        }
+    )
+
+
+def _prepare_response(data: Dict[str, Any]) -> ORJSONResponse:
+    return ORJSONResponse(
+        {
+            'data': data,
+        }
+    )
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Literal
+
+from fastapi import Depends, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from conf.config import settings
+from webapp.api.stats.router import stats_router
+from webapp.crud.stats import get_timeline
+from webapp.db.postgres import get_session
+from webapp.schema.stats import GetTimelineResponse
+from webapp.utils.auth.jwt import JwtTokenT, jwt_auth
+
+BUCKETS = {
+    'hour': timedelta(hours=1),
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1),
+}
+
+
+@stats_router.get(
+    '/timeline',
+    response_model=GetTimelineResponse,
+)
+async def get_stats_timeline(
+    bucket: Literal['hour', 'day', 'week'] = 'day',
+    period: int = 30,
+    cursor: datetime | None = None,
+    limit: int = Query(default=100, gt=0, le=1000),
+    session: AsyncSession = Depends(get_session),
+    access_token: JwtTokenT = Depends(jwt_auth.validate_token),
+) -> ORJSONResponse:
+    end_date = datetime.utcnow()
+    # cursor is the start of the first bucket of the page
+    start_date = cursor or end_date - timedelta(days=period)
+
+    rows = await get_timeline(
+        session,
+        access_token['user_id'],
+        bucket,
+        start_date,
+        end_date,
+        limit,
+        use_rollups=settings.STATS_TIMELINE_USE_ROLLUPS,
+    )
+
+    if len(rows) == limit:
+        next_cursor = rows[-1][0] + BUCKETS[bucket]
+    else:
+        next_cursor = None
+
+    return _prepare_response(
+        {
+            'points': [
+                {
+                    'bucket': row[0],
+                    'wins': row[1],
+                    'losses': row[2],
+                    'ships_sank': row[3],
+                    'ships_destroyed': row[4],
+                }
+                for row in rows
+            ],
+            'next_cursor': next_cursor,
+        }
+    )
+
+
+def _prepare_response(data: Dict[str, Any]) -> ORJSONResponse:
+    return ORJSONResponse(
+        {
+            'data': data,
+        }
+    )
@@ -5,6 +5,8 @@ from starlette import status
 
 from webapp.api.stats.router import stats_router
 from webapp.cache.get_game import get_game_by_user
+from webapp.cache.leaderboard import record_game_result
+from webapp.cache.moves import read_moves
 from webapp.crud.stats import save_game_data
 from webapp.db.postgres import get_session
 from webapp.game.core import BattleShipGame
@@ -25,15 +27,21 @@ async def save_data(
             detail='Game has not been finished yet. Finish the game before saving data.',
         )
 
-    ships_sank = len(list(filter(None, [ship.is_destroyed() for ship in game.player.board.ships])))
-    ships_destroyed = len(list(filter(None, [ship.is_destroyed() for ship in game.ai.board.ships])))
+    ships_sank = game.player.board.destroyed_ships_count()
+    ships_destroyed = game.ai.board.destroyed_ships_count()
 
     if game.winner is not None:
         winner_id = game.winner.user_id
     else:
         winner_id = None
 
-    await save_game_data(session, game.player.user_id, game.player.user_id == winner_id, ships_sank, ships_destroyed)
+    won = game.player.user_id == winner_id
+
+    moves = await read_moves(game.player.user_id)
+
+    timestamp = await save_game_data(session, game.player.user_id, won, ships_sank, ships_destroyed, moves=moves)
+    # the leaderboard periods follow the saved row, so both count the game in the same week and month
+    await record_game_result(game.player.user_id, won, ships_destroyed, timestamp)
 
     return ORJSONResponse(
         {
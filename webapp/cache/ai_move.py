@@ -0,0 +1,41 @@
+import struct
+from typing import Tuple
+
+from webapp.cache.key_builder import get_ai_move_key
+from webapp.db.redis import get_redis
+from webapp.game.core import BattleShipGame
+from webapp.middleware.metrics import AI_MOVE_PRECOMPUTED, integration_latency
+
+# moves count and rng state of the game the move was computed for, rng state after it, x, y
+AI_MOVE = struct.Struct('<IQQHH')
+
+# coordinate of the AI's strike and rng state after choosing it
+PrecomputedMove = Tuple[Tuple[int, int], int]
+
+
+@integration_latency
+async def save_ai_move(game: BattleShipGame, rng_state: int, move: PrecomputedMove, ttl: int | None) -> None:
+    """Saves the AI's next move computed on the game with `rng_state`."""
+    (x_coord, y_coord), rng_after = move
+    value = AI_MOVE.pack(game.moves_count, rng_state, rng_after, x_coord, y_coord)
+
+    await get_redis().set(get_ai_move_key(game.player.user_id), value, ex=ttl)
+
+
+@integration_latency
+async def pop_ai_move(game: BattleShipGame) -> PrecomputedMove | None:
+    """Returns the precomputed AI's move if it was computed on the current state of the game."""
+    value = await get_redis().getdel(get_ai_move_key(game.player.user_id))
+
+    if value is None:
+        AI_MOVE_PRECOMPUTED.labels(outcome='missing').inc()
+        return None
+
+    moves_count, rng_state, rng_after, x_coord, y_coord = AI_MOVE.unpack(value)
+
+    if moves_count != game.moves_count or rng_state != game.rng.state:
+        AI_MOVE_PRECOMPUTED.labels(outcome='stale').inc()
+        return None
+
+    AI_MOVE_PRECOMPUTED.labels(outcome='used').inc()
+    return (x_coord, y_coord), rng_after
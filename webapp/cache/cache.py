@@ -1,17 +1,48 @@
-from typing import Any
+from time import time
+from typing import Any, Dict
 
 import orjson
+from redis.asyncio.client import Pipeline
 
-from webapp.cache.key_builder import get_cache_key
+from webapp.cache.key_builder import get_activity_key, get_cache_key
 from webapp.db.redis import get_redis
-from webapp.middleware.metrics import integration_latency
+from webapp.middleware.metrics import integration_latency, observe_payload
 
 
 @integration_latency
-async def redis_set(model: str, user_id: int, data: Any) -> None:
+async def redis_set(model: str, user_id: int, data: Any, ttl: int | None = None) -> int:
+    """Sets the value, returns its serialized size."""
     redis = get_redis()
-    key = get_cache_key(model, user_id)
-    await redis.set(key, orjson.dumps(data))
+
+    async with redis.pipeline(transaction=False) as pipe:
+        size = _queue_set(pipe, model, user_id, data, ttl)
+        await pipe.execute()
+
+    observe_payload('redis_set', 'written', size)
+    return size
+
+
+@integration_latency
+async def redis_set_and_append(
+    model: str,
+    user_id: int,
+    data: Any,
+    stream_key: str,
+    entry: Dict[str, bytes],
+    ttl: int | None = None,
+) -> int:
+    """Sets the value and appends an entry to the stream in the same round trip, returns the value size."""
+    redis = get_redis()
+
+    async with redis.pipeline(transaction=False) as pipe:
+        size = _queue_set(pipe, model, user_id, data, ttl)
+        pipe.xadd(stream_key, entry)
+        if ttl is not None:
+            pipe.expire(stream_key, ttl)
+        await pipe.execute()
+
+    observe_payload('redis_set_and_append', 'written', size + sum(len(value) for value in entry.values()))
+    return size
 
 
 @integration_latency
@@ -23,6 +54,8 @@ async def redis_get(model: str, user_id: int) -> Any:
     if cached is None:
         return None
 
+    observe_payload('redis_get', 'read', len(cached))
+
     return orjson.loads(cached)
 
 
@@ -30,4 +63,17 @@ async def redis_get(model: str, user_id: int) -> Any:
 async def redis_remove(model: str, user_id: int) -> None:
     redis = get_redis()
     key = get_cache_key(model, user_id)
-    await redis.delete(key)
+
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.delete(key)
+        pipe.zrem(get_activity_key(model), str(user_id))
+        await pipe.execute()
+
+
+def _queue_set(pipe: Pipeline, model: str, user_id: int, data: Any, ttl: int | None) -> int:
+    """Queues the value and its activity index update, returns the size of the serialized value."""
+    value = orjson.dumps(data)
+    pipe.set(get_cache_key(model, user_id), value, ex=ttl)
+    # last activity index is used by the idle sweeper
+    pipe.zadd(get_activity_key(model), {str(user_id): time()})
+    return len(value)
@@ -3,3 +3,19 @@ from conf.config import settings
 
 def get_cache_key(model: str, user_id: int) -> str:
     return f'{settings.REDIS_BATTLESHIP_CACHE_PREFIX}:{model}:{user_id}'
+
+
+def get_activity_key(model: str) -> str:
+    return f'{settings.REDIS_BATTLESHIP_CACHE_PREFIX}:{model}:activity'
+
+
+def get_leaderboard_key(metric: str, period: str) -> str:
+    return f'{settings.REDIS_BATTLESHIP_CACHE_PREFIX}:leaderboard:{metric}:{period}'
+
+
+def get_moves_key(user_id: int) -> str:
+    return f'{settings.REDIS_BATTLESHIP_CACHE_PREFIX}:moves:{user_id}'
+
+
+def get_ai_move_key(user_id: int) -> str:
+    return f'{settings.REDIS_BATTLESHIP_CACHE_PREFIX}:ai_move:{user_id}'
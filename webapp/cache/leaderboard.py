@@ -0,0 +1,168 @@
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from conf.config import settings
+from webapp.cache.key_builder import get_leaderboard_key
+from webapp.db.redis import get_redis
+from webapp.middleware.metrics import integration_latency
+
+METRICS = ('wins', 'win_rate', 'ships_destroyed')
+PERIODS = ('all', 'week', 'month')
+
+# games count is kept to calculate win rate, it isn't exposed as a leaderboard
+GAMES = 'games'
+
+# KEYS: wins, games, ships destroyed, win rate; ARGV: member, won, ships destroyed, ttl, win rate min games
+RECORD_RESULT_SCRIPT = '''
+local wins = tonumber(redis.call('ZINCRBY', KEYS[1], ARGV[2], ARGV[1]))
+local games = tonumber(redis.call('ZINCRBY', KEYS[2], 1, ARGV[1]))
+redis.call('ZINCRBY', KEYS[3], ARGV[3], ARGV[1])
+if games >= tonumber(ARGV[5]) then
+    redis.call('ZADD', KEYS[4], wins / games, ARGV[1])
+end
+if tonumber(ARGV[4]) > 0 then
+    for i = 1, #KEYS do
+        redis.call('EXPIRE', KEYS[i], ARGV[4])
+    end
+end
+return games
+'''
+
+
+def get_period_key(period: str, day: date) -> str:
+    if period == 'week':
+        return f'week:{day.strftime("%G-W%V")}'
+    if period == 'month':
+        return f'month:{day.strftime("%Y-%m")}'
+    return 'all'
+
+
+def get_period_start(period: str, day: date) -> date | None:
+    if period == 'week':
+        return day - timedelta(days=day.weekday())
+    if period == 'month':
+        return day.replace(day=1)
+    return None
+
+
+def get_period_ttl(period: str) -> int:
+    if period == 'week':
+        return settings.LEADERBOARD_WEEK_TTL
+    if period == 'month':
+        return settings.LEADERBOARD_MONTH_TTL
+    return 0
+
+
+def _get_keys(period_key: str, suffix: str = '') -> List[str]:
+    return [
+        get_leaderboard_key(metric, period_key) + suffix for metric in ('wins', GAMES, 'ships_destroyed', 'win_rate')
+    ]
+
+
+@integration_latency
+async def record_game_result(user_id: int, won: bool, ships_destroyed: int, timestamp: datetime) -> None:
+    """Updates all leaderboards the game belongs to in a single round trip."""
+    redis = get_redis()
+    record_result = redis.register_script(RECORD_RESULT_SCRIPT)
+
+    async with redis.pipeline(transaction=False) as pipe:
+        for period in PERIODS:
+            await record_result(
+                keys=_get_keys(get_period_key(period, timestamp.date())),
+                args=[
+                    user_id,
+                    int(won),
+                    ships_destroyed,
+                    get_period_ttl(period),
+                    settings.LEADERBOARD_WIN_RATE_MIN_GAMES,
+                ],
+                client=pipe,
+            )
+        await pipe.execute()
+
+
+@integration_latency
+async def get_leaderboard(
+    metric: str,
+    period: str,
+    user_id: int,
+    offset: int,
+    limit: int,
+) -> Tuple[List[Tuple[int, int, float]], Tuple[int, float] | None]:
+    """Returns (rank, user_id, score) of a top page and (rank, score) of the user. Ranks start from 1."""
+    redis = get_redis()
+    key = get_leaderboard_key(metric, get_period_key(period, datetime.utcnow().date()))
+
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.zrevrange(key, offset, offset + limit - 1, withscores=True)
+        pipe.zrevrank(key, user_id)
+        pipe.zscore(key, user_id)
+        top, user_rank, user_score = await pipe.execute()
+
+    entries = [(offset + i + 1, int(member), score) for i, (member, score) in enumerate(top)]
+
+    if user_rank is None:
+        return entries, None
+
+    return entries, (user_rank + 1, user_score)
+
+
+async def rebuild_leaderboard(period_key: str, totals: AsyncIterator[Any], batch_size: int = 1000) -> int:
+    """Replaces leaderboards of a period with totals of (user_id, wins, games, ships_destroyed).
+
+    Totals are written to temporary keys which then atomically replace the live ones. Results recorded
+    after the totals were read from the database and before the swap are lost, so run it when few games are
+    being saved or rebuild the period again.
+    """
+    redis = get_redis()
+    keys = _get_keys(period_key)
+    tmp_keys = _get_keys(period_key, ':rebuild')
+    written = [False] * len(tmp_keys)
+    users = 0
+
+    await redis.delete(*tmp_keys)
+
+    batch: List[Tuple[int, int, int, int]] = []
+    async for row in totals:
+        batch.append(tuple(row))
+        users += 1
+
+        if len(batch) >= batch_size:
+            await _write_batch(tmp_keys, batch, written)
+            batch = []
+
+    await _write_batch(tmp_keys, batch, written)
+
+    ttl = get_period_ttl(period_key.split(':')[0])
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.delete(*keys)
+        for key, tmp_key, is_written in zip(keys, tmp_keys, written):
+            if not is_written:
+                continue
+            pipe.rename(tmp_key, key)
+            if ttl:
+                pipe.expire(key, ttl)
+        await pipe.execute()
+
+    return users
+
+
+async def _write_batch(tmp_keys: List[str], batch: List[Tuple[int, int, int, int]], written: List[bool]) -> None:
+    """Writes a batch of totals, `written` is updated with the keys that got members."""
+    mappings: List[Dict[Any, float]] = [
+        {user_id: wins for user_id, wins, _, _ in batch},
+        {user_id: games for user_id, _, games, _ in batch},
+        {user_id: ships_destroyed for user_id, _, _, ships_destroyed in batch},
+        {
+            user_id: wins / games
+            for user_id, wins, games, _ in batch
+            if games >= settings.LEADERBOARD_WIN_RATE_MIN_GAMES
+        },
+    ]
+
+    async with get_redis().pipeline(transaction=False) as pipe:
+        for i, (key, mapping) in enumerate(zip(tmp_keys, mappings)):
+            if mapping:
+                pipe.zadd(key, mapping)
+                written[i] = True
+        await pipe.execute()
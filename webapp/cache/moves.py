@@ -0,0 +1,53 @@
+import struct
+from typing import AsyncIterator, Iterator, Tuple
+
+from webapp.cache.key_builder import get_moves_key
+from webapp.db.redis import get_redis
+from webapp.game.core import HitStatus
+
+PLAYER = 0
+AI = 1
+
+ACTORS = ('player', 'ai')
+RESULTS = (HitStatus.MISS, HitStatus.HIT, HitStatus.DESTROYED)
+
+# actor, x, y, result
+MOVE = struct.Struct('BBBB')
+
+# stream entry field holding a packed move
+MOVE_FIELD = 'm'
+
+
+def pack_move(actor: int, coord: Tuple[int, int], result: HitStatus) -> bytes:
+    return MOVE.pack(actor, coord[0], coord[1], RESULTS.index(result))
+
+
+def unpack_moves(data: bytes) -> Iterator[Tuple[int, int, int, int]]:
+    return MOVE.iter_unpack(data)
+
+
+async def iter_moves(user_id: int, page_size: int = 100) -> AsyncIterator[bytes]:
+    """Yields packed moves of the user's current game, reading the stream page by page."""
+    redis = get_redis()
+    key = get_moves_key(user_id)
+    start: bytes | str = '-'
+
+    while True:
+        entries = await redis.xrange(key, min=start, count=page_size)
+
+        for _, fields in entries:
+            yield fields[MOVE_FIELD.encode()]
+
+        if len(entries) < page_size:
+            return
+
+        start = b'(' + entries[-1][0]
+
+
+async def read_moves(user_id: int) -> bytes:
+    """Returns all moves of the user's current game packed together, as archived in Postgres."""
+    return b''.join([move async for move in iter_moves(user_id)])
+
+
+async def delete_moves(user_id: int) -> None:
+    await get_redis().delete(get_moves_key(user_id))
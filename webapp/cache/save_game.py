@@ -0,0 +1,42 @@
+from conf.config import settings
+from webapp.cache.cache import redis_set, redis_set_and_append
+from webapp.cache.key_builder import get_moves_key
+from webapp.cache.moves import MOVE_FIELD
+from webapp.game.core import BattleShipGame
+from webapp.middleware.metrics import ENGINE_GAME_STATE_SIZE
+from webapp.middleware.timing import phase
+from webapp.utils.executor import get_cells_count, offload
+
+
+def get_game_ttl(game: BattleShipGame) -> int:
+    if game.finished:
+        return settings.REDIS_GAME_FINISHED_TTL
+
+    if len(game.player.board.ships) < game.max_ship_count:
+        return settings.REDIS_GAME_SETUP_TTL
+
+    return settings.REDIS_GAME_ACTIVE_TTL
+
+
+async def save_game(game: BattleShipGame, move: bytes | None = None) -> None:
+    """Saves the game state, appending the packed move to the game's move log if given."""
+    user_id = game.player.user_id
+    ttl = get_game_ttl(game)
+
+    with phase('dump'):
+        data = await offload(get_cells_count(game), game.model_dump)
+
+    with phase('redis_set'):
+        if move is None:
+            size = await redis_set(BattleShipGame.__name__, user_id, data, ttl=ttl)
+        else:
+            size = await redis_set_and_append(
+                BattleShipGame.__name__,
+                user_id,
+                data,
+                get_moves_key(user_id),
+                {MOVE_FIELD: move},
+                ttl=ttl,
+            )
+
+    ENGINE_GAME_STATE_SIZE.observe(size)
@@ -0,0 +1,144 @@
+from time import time
+from typing import Any, Dict, List
+
+import orjson
+
+from conf.config import settings
+from webapp.cache.key_builder import get_activity_key, get_ai_move_key, get_cache_key, get_moves_key
+from webapp.cache.save_game import get_game_ttl
+from webapp.crud.stats import save_abandoned_games
+from webapp.db.postgres import async_session
+from webapp.db.redis import get_redis
+from webapp.game.core import BattleShipGame
+from webapp.middleware.metrics import GAME_CACHE_EVICTIONS, GAME_CACHE_KEYS, GAME_CACHE_MEMORY
+
+# Members are removed only if they are still idle, so a game touched after it was selected is kept. Returns the
+# states of the games actually evicted (empty strings unless ARGV[2] is 1), so concurrent sweepers see each game once.
+# The AI move and the moves log of an evicted game are removed with it, the moves log only once the game is recorded
+# if its state is returned for that.
+# KEYS: activity index, then game, moves and AI move keys of every game;
+# ARGV: deadline, return states flag, index members (in the same order as the games).
+EVICT_IDLE_SCRIPT = '''
+local deadline = tonumber(ARGV[1])
+local return_states = ARGV[2] == '1'
+local evicted = {}
+for i = 3, #ARGV do
+    local member = ARGV[i]
+    local game_key = KEYS[3 * i - 7]
+    local score = redis.call('ZSCORE', KEYS[1], member)
+    if score and tonumber(score) <= deadline then
+        redis.call('ZREM', KEYS[1], member)
+        local state = redis.call('GETDEL', game_key)
+        if state then
+            if not return_states then
+                redis.call('DEL', KEYS[3 * i - 6])
+            end
+            redis.call('DEL', KEYS[3 * i - 5])
+            evicted[#evicted + 1] = return_states and state or ''
+        end
+    end
+end
+return evicted
+'''
+
+
+async def sweep_idle_games() -> int:
+    """Evicts games idle for longer than GAME_SWEEPER_IDLE_TIMEOUT. Returns the number of evicted keys."""
+    redis = get_redis()
+    model = BattleShipGame.__name__
+    activity_key = get_activity_key(model)
+    evict_idle = redis.register_script(EVICT_IDLE_SCRIPT)
+    deadline = time() - settings.GAME_SWEEPER_IDLE_TIMEOUT
+    evicted = 0
+
+    while True:
+        members = await redis.zrangebyscore(
+            activity_key, '-inf', deadline, start=0, num=settings.GAME_SWEEPER_BATCH_SIZE
+        )
+        if not members:
+            break
+
+        keys = []
+        for member in members:
+            user_id = int(member)
+            keys.extend((get_cache_key(model, user_id), get_moves_key(user_id), get_ai_move_key(user_id)))
+
+        record = settings.GAME_SWEEPER_RECORD_ABANDONED
+        states = await evict_idle(keys=[activity_key, *keys], args=[deadline, int(record), *members])
+        GAME_CACHE_EVICTIONS.labels(reason='idle').inc(len(states))
+        evicted += len(states)
+
+        # only games removed by this sweeper are recorded, after they can no longer be touched
+        if record and states:
+            await _record_abandoned_games(activity_key, states)
+
+        if len(members) < settings.GAME_SWEEPER_BATCH_SIZE:
+            break
+
+    await _observe_memory_usage(activity_key)
+
+    return evicted
+
+
+async def _record_abandoned_games(activity_key: str, states: List[bytes]) -> None:
+    """Records the evicted games and removes their moves logs, the games are put back if recording fails."""
+    evicted = [BattleShipGame(**orjson.loads(state)) for state in states]
+    games: List[Dict[str, Any]] = []
+
+    for game in evicted:
+        # games which were finished or not even set up are not recorded
+        if game.finished or len(game.player.board.ships) < game.max_ship_count:
+            continue
+
+        games.append(
+            {
+                'user_id': game.player.user_id,
+                'ships_sank': game.player.board.destroyed_ships_count(),
+                'ships_destroyed': game.ai.board.destroyed_ships_count(),
+            }
+        )
+
+    try:
+        async with async_session() as session:
+            await save_abandoned_games(session, games)
+    except Exception:
+        await _restore_games(activity_key, states, evicted)
+        raise
+
+    await get_redis().delete(*(get_moves_key(game.player.user_id) for game in evicted))
+
+
+async def _restore_games(activity_key: str, states: List[bytes], games: List[BattleShipGame]) -> None:
+    """Puts evicted games back as idle since now, unless a new game has been created meanwhile."""
+    model = BattleShipGame.__name__
+    now = time()
+
+    async with get_redis().pipeline(transaction=True) as pipe:
+        for state, game in zip(states, games):
+            user_id = game.player.user_id
+            pipe.set(get_cache_key(model, user_id), state, ex=get_game_ttl(game), nx=True)
+            pipe.zadd(activity_key, {str(user_id): now}, nx=True)
+        await pipe.execute()
+
+
+async def _observe_memory_usage(activity_key: str) -> None:
+    """Estimates memory used by game keys from a random sample of them."""
+    redis = get_redis()
+    model = BattleShipGame.__name__
+
+    keys_count = await redis.zcard(activity_key)
+    GAME_CACHE_KEYS.set(keys_count)
+
+    if not keys_count:
+        GAME_CACHE_MEMORY.set(0)
+        return
+
+    members = await redis.zrandmember(activity_key, settings.GAME_SWEEPER_MEMORY_SAMPLES)
+
+    async with redis.pipeline(transaction=False) as pipe:
+        for member in members:
+            pipe.memory_usage(get_cache_key(model, int(member)))
+        sizes = [size for size in await pipe.execute() if size is not None]
+
+    if sizes:
+        GAME_CACHE_MEMORY.set(sum(sizes) / len(sizes) * keys_count)
@@ -1,12 +1,13 @@
-from datetime import datetime
-from typing import Any, Optional, Tuple
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import Row, func, select
+from sqlalchemy import TIMESTAMP, Row, cast, func, literal, select, tuple_
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from webapp.middleware.metrics import integration_latency
 from webapp.models.sirius.game import Game
+from webapp.models.sirius.game_daily_stats import GameDailyStats
 
 
 @integration_latency
@@ -21,11 +22,92 @@ async def get_statistics(
         func.count(func.nullif(Game.won == False, False)),
         func.coalesce(func.sum(Game.ships_sank), 0),
         func.coalesce(func.sum(Game.ships_destroyed), 0),
-    ).filter(Game.timestamp >= start_date, Game.timestamp <= end_date, Game.user_id == user_id)
+    ).filter(
+        Game.timestamp >= start_date,
+        Game.timestamp <= end_date,
+        Game.user_id == user_id,
+        Game.abandoned == False,
+    )
 
     return (await session.execute(query)).fetchone()
 
 
+@integration_latency
+async def get_timeline(
+    session: AsyncSession,
+    user_id: int,
+    bucket: str,
+    start_date: datetime,
+    end_date: datetime,
+    limit: int,
+    use_rollups: bool = True,
+) -> Sequence[Row[Tuple[Any, ...]]]:
+    """Returns statistics grouped by date_trunc(bucket) starting from start_date.
+
+    Day and week buckets are read from the daily rollup, so their range is extended to whole days.
+    """
+    # inlined, so that the grouping expression is the same in SELECT and GROUP BY
+    bucket_literal = literal(bucket, literal_execute=True)
+
+    if use_rollups and bucket in ('day', 'week'):
+        bucket_column = func.date_trunc(bucket_literal, cast(GameDailyStats.day, TIMESTAMP)).label('bucket')
+        query = select(
+            bucket_column,
+            func.sum(GameDailyStats.wins),
+            func.sum(GameDailyStats.losses),
+            func.sum(GameDailyStats.ships_sank),
+            func.sum(GameDailyStats.ships_destroyed),
+        ).filter(
+            GameDailyStats.user_id == user_id,
+            GameDailyStats.day >= start_date.date(),
+            GameDailyStats.day <= end_date.date(),
+        )
+    else:
+        bucket_column = func.date_trunc(bucket_literal, Game.timestamp).label('bucket')
+        query = select(
+            bucket_column,
+            func.count(func.nullif(Game.won == True, False)),
+            func.count(func.nullif(Game.won == False, False)),
+            func.coalesce(func.sum(Game.ships_sank), 0),
+            func.coalesce(func.sum(Game.ships_destroyed), 0),
+        ).filter(
+            Game.user_id == user_id,
+            Game.timestamp >= start_date,
+            Game.timestamp <= end_date,
+            Game.abandoned == False,
+        )
+
+    query = query.group_by(bucket_column).order_by(bucket_column).limit(limit)
+
+    return (await session.execute(query)).fetchall()
+
+
+@integration_latency
+async def get_game_history(
+    session: AsyncSession,
+    user_id: int,
+    limit: int,
+    before: Tuple[datetime, int] | None = None,
+) -> Sequence[Row[Tuple[Any, ...]]]:
+    """Returns user's games newest first, starting after the (timestamp, id) keyset position."""
+    query = select(
+        Game.id,
+        Game.timestamp,
+        Game.won,
+        Game.ships_sank,
+        Game.ships_destroyed,
+        Game.abandoned,
+    ).filter(Game.user_id == user_id)
+
+    if before is not None:
+        # the plain timestamp condition lets the planner prune partitions
+        query = query.filter(Game.timestamp <= before[0], tuple_(Game.timestamp, Game.id) < tuple_(*before))
+
+    query = query.order_by(Game.timestamp.desc(), Game.id.desc()).limit(limit)
+
+    return (await session.execute(query)).fetchall()
+
+
 @integration_latency
 async def save_game_data(
     session: AsyncSession,
@@ -33,7 +115,11 @@ async def save_game_data(
     won: bool,
     ships_sank: int,
     ships_destroyed: int,
-) -> None:
+    moves: bytes | None = None,
+) -> datetime:
+    """Saves the game and adds it to the daily rollup, returns the timestamp the game is saved with."""
+    timestamp = datetime.utcnow()
+
     await session.execute(
         insert(Game)
         .values(
@@ -41,7 +127,135 @@ async def save_game_data(
             won=won,
             ships_sank=ships_sank,
             ships_destroyed=ships_destroyed,
+            moves=moves,
+            timestamp=timestamp,
         )
         .on_conflict_do_nothing()
     )
+
+    rollup = insert(GameDailyStats).values(
+        user_id=user_id,
+        day=timestamp.date(),
+        wins=int(won),
+        losses=int(not won),
+        ships_sank=ships_sank,
+        ships_destroyed=ships_destroyed,
+    )
+    await session.execute(
+        rollup.on_conflict_do_update(
+            index_elements=[GameDailyStats.user_id, GameDailyStats.day],
+            set_={
+                'wins': GameDailyStats.wins + rollup.excluded.wins,
+                'losses': GameDailyStats.losses + rollup.excluded.losses,
+                'ships_sank': GameDailyStats.ships_sank + rollup.excluded.ships_sank,
+                'ships_destroyed': GameDailyStats.ships_destroyed + rollup.excluded.ships_destroyed,
+            },
+        )
+    )
+    await session.commit()
+
+    return timestamp
+
+
+@integration_latency
+async def get_game_moves(session: AsyncSession, user_id: int, game_id: int) -> bytes | None:
+    query = select(Game.moves).filter(Game.id == game_id, Game.user_id == user_id, Game.moves.is_not(None))
+
+    return (await session.scalars(query)).one_or_none()
+
+
+@integration_latency
+async def save_abandoned_games(session: AsyncSession, games: List[Dict[str, Any]]) -> None:
+    if not games:
+        return
+
+    await session.execute(insert(Game).values([{**game, 'won': False, 'abandoned': True} for game in games]))
+    await session.commit()
+
+
+@integration_latency
+async def rebuild_daily_stats(session: AsyncSession, since: date | None = None) -> None:
+    """Recalculates daily rollups from sirius.game, for all days or starting from `since`."""
+    day = func.date(Game.timestamp)
+    query = select(
+        Game.user_id,
+        day,
+        func.count(func.nullif(Game.won == True, False)),
+        func.count(func.nullif(Game.won == False, False)),
+        func.sum(Game.ships_sank),
+        func.sum(Game.ships_destroyed),
+    ).filter(Game.abandoned == False)
+
+    if since is not None:
+        query = query.filter(Game.timestamp >= since)
+
+    rollup = insert(GameDailyStats).from_select(
+        ['user_id', 'day', 'wins', 'losses', 'ships_sank', 'ships_destroyed'],
+        query.group_by(Game.user_id, day),
+    )
+    await session.execute(
+        rollup.on_conflict_do_update(
+            index_elements=[GameDailyStats.user_id, GameDailyStats.day],
+            set_={
+                'wins': rollup.excluded.wins,
+                'losses': rollup.excluded.losses,
+                'ships_sank': rollup.excluded.ships_sank,
+                'ships_destroyed': rollup.excluded.ships_destroyed,
+            },
+        )
+    )
     await session.commit()
+
+
+async def iter_leaderboard_totals(
+    session: AsyncSession,
+    start_day: date | None = None,
+    yield_per: int = 1000,
+) -> AsyncIterator[Row[Tuple[Any, ...]]]:
+    """Streams (user_id, wins, games, ships_destroyed) per user from daily rollups, optionally from start_day."""
+    query = select(
+        GameDailyStats.user_id,
+        func.sum(GameDailyStats.wins),
+        func.sum(GameDailyStats.wins + GameDailyStats.losses),
+        func.sum(GameDailyStats.ships_destroyed),
+    ).group_by(GameDailyStats.user_id)
+
+    if start_day is not None:
+        query = query.filter(GameDailyStats.day >= start_day)
+
+    result = await session.stream(query.execution_options(yield_per=yield_per))
+    async for row in result:
+        yield row
+
+
+async def iter_games(
+    session: AsyncSession,
+    fetch_size: int,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    user_id: int | None = None,
+) -> AsyncIterator[Row[Tuple[Any, ...]]]:
+    """Streams games through a server side cursor, keeping at most fetch_size rows in memory.
+
+    Both dates are inclusive, like in get_statistics.
+    """
+    query = select(
+        Game.id,
+        Game.user_id,
+        Game.won,
+        Game.ships_sank,
+        Game.ships_destroyed,
+        Game.abandoned,
+        Game.timestamp,
+    )
+
+    if start_date is not None:
+        query = query.filter(Game.timestamp >= start_date)
+    if end_date is not None:
+        query = query.filter(Game.timestamp <= end_date)
+    if user_id is not None:
+        query = query.filter(Game.user_id == user_id)
+
+    result = await session.stream(query.execution_options(yield_per=fetch_size))
+    async for row in result:
+        yield row
@@ -1,4 +1,5 @@
-from sqlalchemy import insert, select
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from webapp.middleware.metrics import integration_latency
@@ -6,17 +7,6 @@ from webapp.models.sirius.user import User
 from webapp.schema.user import UserInfo
 
 
-@integration_latency
-async def get_user(session: AsyncSession, user_info: UserInfo) -> User | None:
-    return (
-        await session.scalars(
-            select(User).where(
-                User.username == user_info.username,
-            )
-        )
-    ).one_or_none()
-
-
 @integration_latency
 async def get_user_by_id(session: AsyncSession, user_id: int) -> User | None:
     return (
@@ -29,10 +19,19 @@ async def get_user_by_id(session: AsyncSession, user_id: int) -> User | None:
 
 
 @integration_latency
-async def create_user(session: AsyncSession, user_info: UserInfo) -> User | None:
-    async with session.begin_nested():
-        query = insert(User).values(user_info.model_dump())
-        result = await session.execute(query)
-        await session.commit()
-    inserted_id = result.inserted_primary_key[0]
-    return await get_user_by_id(session, inserted_id)
+async def get_or_create_user(session: AsyncSession, user_info: UserInfo) -> int:
+    """Returns id of the user, creating it if needed, in a single statement.
+
+    The no-op update on conflict makes RETURNING yield the id of an existing row,
+    so concurrent logins with the same username don't race.
+    """
+    query = insert(User).values(user_info.model_dump())
+    query = query.on_conflict_do_update(
+        index_elements=[User.username],
+        set_={'username': query.excluded.username},
+    ).returning(User.id)
+
+    user_id = (await session.execute(query)).scalar_one()
+    await session.commit()
+
+    return user_id
@@ -0,0 +1,103 @@
+from datetime import date
+from typing import Iterator, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from conf.config import settings
+from webapp.models.meta import DEFAULT_SCHEMA
+from webapp.models.sirius.game import Game
+
+GAME_TABLE = f'{DEFAULT_SCHEMA}.{Game.__tablename__}'
+# catches rows outside of the monthly partitions, they are moved out once their month is partitioned
+DEFAULT_PARTITION = f'{Game.__tablename__}_default'
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def iter_months(start: date, end: date) -> Iterator[date]:
+    """Yields first days of months from the month of start up to the month of end, inclusive."""
+    month = start.replace(day=1)
+    while month <= end:
+        yield month
+        month = add_months(month, 1)
+
+
+def get_partition_name(month: date) -> str:
+    return f'{Game.__tablename__}_y{month:%Y}m{month:%m}'
+
+
+async def create_game_partitions(conn: AsyncConnection, start: date, end: date) -> None:
+    # workers create the partitions on start and on a schedule, one at a time
+    await conn.execute(text('SELECT pg_advisory_xact_lock(hashtext(:table))'), {'table': GAME_TABLE})
+    await conn.execute(
+        text(f'CREATE TABLE IF NOT EXISTS {DEFAULT_SCHEMA}.{DEFAULT_PARTITION} PARTITION OF {GAME_TABLE} DEFAULT')
+    )
+
+    for month in iter_months(start, end):
+        await create_game_partition(conn, month)
+
+
+async def create_game_partition(conn: AsyncConnection, month: date) -> None:
+    """Creates the partition of the month unless it exists, moving the month's rows out of the default partition.
+
+    A partition can't be attached while the default one holds rows of its range, those are written there
+    when no partition was created for the month in time.
+    """
+    name = f'{DEFAULT_SCHEMA}.{get_partition_name(month)}'
+    if await conn.scalar(text('SELECT to_regclass(:name)'), {'name': name}) is not None:
+        return
+
+    bounds = {'start': month, 'end': add_months(month, 1)}
+    await conn.execute(text(f'CREATE TABLE {name} (LIKE {GAME_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'))
+    await conn.execute(
+        text(
+            f'WITH moved AS (DELETE FROM {DEFAULT_SCHEMA}.{DEFAULT_PARTITION} '
+            'WHERE timestamp >= :start AND timestamp < :end RETURNING *) '
+            f'INSERT INTO {name} SELECT * FROM moved'
+        ),
+        bounds,
+    )
+    await conn.execute(
+        text(f"ALTER TABLE {GAME_TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{month}') TO ('{bounds['end']}')")
+    )
+
+
+async def ensure_game_partitions(conn: AsyncConnection, today: date) -> None:
+    """Creates partitions for GAME_PARTITIONS_BEHIND months back and GAME_PARTITIONS_AHEAD months ahead."""
+    month = today.replace(day=1)
+    await create_game_partitions(
+        conn,
+        add_months(month, -settings.GAME_PARTITIONS_BEHIND),
+        add_months(month, settings.GAME_PARTITIONS_AHEAD),
+    )
+
+
+async def get_game_partitions(conn: AsyncConnection) -> List[Tuple[str, date]]:
+    """Returns attached monthly partitions with their months, oldest first."""
+    result = await conn.execute(
+        text(
+            'SELECT child.relname FROM pg_inherits '
+            'JOIN pg_class parent ON pg_inherits.inhparent = parent.oid '
+            'JOIN pg_class child ON pg_inherits.inhrelid = child.oid '
+            'JOIN pg_namespace ON parent.relnamespace = pg_namespace.oid '
+            'WHERE pg_namespace.nspname = :schema AND parent.relname = :table'
+        ),
+        {'schema': DEFAULT_SCHEMA, 'table': Game.__tablename__},
+    )
+
+    partitions = []
+    for (name,) in result:
+        if name == DEFAULT_PARTITION:
+            continue
+        year, month = name.removeprefix(f'{Game.__tablename__}_y').split('m')
+        partitions.append((name, date(int(year), int(month), 1)))
+
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+async def detach_game_partition(conn: AsyncConnection, name: str) -> None:
+    await conn.execute(text(f'ALTER TABLE {GAME_TABLE} DETACH PARTITION {DEFAULT_SCHEMA}.{name}'))
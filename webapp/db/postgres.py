@@ -1,18 +1,44 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from conf.config import settings
 
 
-def create_engine() -> AsyncEngine:
+def get_connect_args(statement_cache_mode: str) -> Dict[str, Any]:
+    if statement_cache_mode == 'direct':
+        return {
+            'statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+            'prepared_statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+        }
+
+    if statement_cache_mode == 'pooler':
+        # asyncpg's own cache names statements by a per-connection counter,
+        # which collides once the pooler hands the server connection to another client
+        return {
+            'statement_cache_size': 0,
+            'prepared_statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE,
+            'prepared_statement_name_func': lambda: f'__asyncpg_{uuid4()}__',
+        }
+
+    return {
+        'statement_cache_size': 0,
+        'prepared_statement_cache_size': 0,
+    }
+
+
+def create_engine(statement_cache_mode: str | None = None) -> AsyncEngine:
     return create_async_engine(
         settings.DB_URL,
         poolclass=AsyncAdaptedQueuePool,
-        connect_args={
-            'statement_cache_size': 0,
-        },
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=get_connect_args(statement_cache_mode or settings.DB_STATEMENT_CACHE_MODE),
     )
 
 
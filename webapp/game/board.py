@@ -1,39 +1,168 @@
-from typing import List, Tuple
+from array import array
+from typing import Annotated, Any, Dict, Iterable, List, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PlainSerializer, PlainValidator, PrivateAttr, field_serializer, model_validator
 
 from webapp.game.exceptions import (
     CordinatesValidationError,
     MaxShipReachedError,
     SquaresNotAttachedError,
     SquareStateError,
+    SquareStrikedError,
 )
 from webapp.game.ship import Ship
-from webapp.game.square import Square, SquareStatus
+from webapp.game.square import SquareStatus
+
+Map = List[List[SquareStatus]]
+
+
+def _to_square_keys(value: Iterable[int]) -> array:
+    return value if isinstance(value, array) else array('I', value)
+
+
+# square keys in 4 bytes each instead of int objects, saved as a list of ints
+SquareKeys = Annotated[array, PlainValidator(_to_square_keys), PlainSerializer(lambda keys: keys.tolist())]
 
 
 class Board(BaseModel):
+    """Sparse board: the ships and the struck squares, any other square is empty.
+
+    Costs of strikes, ship validation and lookup, finish checks and ship counts don't depend
+    on the board or fleet size. The ship index and counters are saved with the board, so a
+    loaded board is ready without walking its ships.
+    """
+
     lines_cnt: int
     rows_cnt: int
-    board: List[List[Square]]
-    weight: List[List[int]]
     ships: List[Ship] = Field(default_factory=list)
     max_ship_count: int = Field(default=10)
-
-    @property
-    def squares(self) -> List[List[Square]]:
-        return self.board
+    # keys (x * rows_cnt + y) of the struck squares, in the order of strikes
+    struck: SquareKeys = Field(default_factory=lambda: array('I'))
+    # square key -> index of the ship on the square in ships
+    ship_index: Dict[int, int] = Field(default_factory=dict)
+    ships_remaining: int = Field(default=0)
+    ships_destroyed: int = Field(default=0)
+
+    # a bit per square, set if struck
+    _struck: bytearray = PrivateAttr(default_factory=bytearray)
+    # AI scratch state, recalculated before every use
+    _weight: List[List[int]] = PrivateAttr(default_factory=list)
+
+    @model_validator(mode='before')
+    @classmethod
+    def convert_legacy_board(cls, data: Any) -> Any:
+        """Converts boards saved as a full grid of squares, without the ship index or with struck coordinates."""
+        if not isinstance(data, dict):
+            return data
+
+        struck = data.get('struck')
+        if 'ship_index' in data and not (struck and isinstance(struck[0], (list, tuple))):
+            return data
+
+        rows_cnt = data['rows_cnt']
+        squares = data.get('board')
+        data = {key: value for key, value in data.items() if key not in ('board', 'weight')}
+        if squares is not None:
+            data['struck'] = [
+                square['x_coord'] * rows_cnt + square['y_coord']
+                for line in squares
+                for square in line
+                if SquareStatus(square['state']) in (SquareStatus.MISSED, SquareStatus.HIT, SquareStatus.DESTROYED)
+            ]
+        elif struck:
+            data['struck'] = [x * rows_cnt + y for x, y in struck]
+        if 'ship_index' in data:
+            return data
+
+        ships = [ship if isinstance(ship, Ship) else Ship(**ship) for ship in data.get('ships', [])]
+        data['ship_index'] = {x * rows_cnt + y: index for index, ship in enumerate(ships) for x, y in ship.coords}
+        data['ships_destroyed'] = sum(ship.is_destroyed() for ship in ships)
+        data['ships_remaining'] = len(ships) - data['ships_destroyed']
+        return data
+
+    @field_serializer('ship_index')
+    def serialize_ship_index(self, ship_index: Dict[int, int], _info: Any) -> Dict[str, int]:
+        # JSON object keys are strings, they are validated back to int
+        return {str(key): index for key, index in ship_index.items()}
+
+    def model_post_init(self, __context: Any) -> None:
+        self._struck = bytearray((self.lines_cnt * self.rows_cnt + 7) // 8)
+        for key in self.struck:
+            self._struck[key >> 3] |= 1 << (key & 7)
+
+    @classmethod
+    def create(cls, lines_cnt: int, rows_cnt: int, max_ship_count: int = 10) -> 'Board':
+        """Creates an empty board."""
+        return cls(lines_cnt=lines_cnt, rows_cnt=rows_cnt, max_ship_count=max_ship_count)
 
     @property
     def coords(self) -> List[Tuple[int, int]]:
-        return [square.cord for squares in self.board for square in squares]
+        return [(x, y) for x in range(self.lines_cnt) for y in range(self.rows_cnt)]
+
+    def get_state(self, coord: Tuple[int, int]) -> SquareStatus:
+        ship = self.get_ship(coord)
 
-    def get_square(self, coord: Tuple[int, int]) -> Square:
+        if self._is_struck(coord[0] * self.rows_cnt + coord[1]):
+            if ship is None:
+                return SquareStatus.MISSED
+            return SquareStatus.DESTROYED if ship.is_destroyed() else SquareStatus.HIT
+
+        return SquareStatus.EMPTY if ship is None else SquareStatus.SHIP
+
+    def get_ship(self, coord: Tuple[int, int]) -> Ship | None:
         self._validate_coordinate(coord)
-        return self.board[coord[0]][coord[1]]
+        index = self.ship_index.get(coord[0] * self.rows_cnt + coord[1])
+        return None if index is None else self.ships[index]
+
+    def strike(self, coord: Tuple[int, int]) -> Ship | None:
+        """Strikes the square, returns the ship hit if there's one.
 
-    def get_squares(self, coordinates: List[Tuple[int, int]]) -> List[Square]:
-        return [self.get_square(coord) for coord in coordinates]
+        Struck squares cannot be targeted again.
+        """
+        ship = self.get_ship(coord)
+        key = coord[0] * self.rows_cnt + coord[1]
+        if self._is_struck(key):
+            raise SquareStrikedError
+
+        self.struck.append(key)
+        self._struck[key >> 3] |= 1 << (key & 7)
+
+        if ship is not None:
+            ship.hit_ship()
+            if ship.is_destroyed():
+                self.ships_remaining -= 1
+                self.ships_destroyed += 1
+        return ship
+
+    def _is_struck(self, key: int) -> bool:
+        return bool(self._struck[key >> 3] & 1 << (key & 7))
+
+    def states_map(self) -> Map:
+        """Returns the states of all the squares."""
+        states = [[SquareStatus.EMPTY] * self.rows_cnt for _ in range(self.lines_cnt)]
+
+        for key in self.ship_index:
+            x, y = divmod(key, self.rows_cnt)
+            states[x][y] = SquareStatus.SHIP
+        self._put_struck(states)
+
+        return states
+
+    def hidden_map(self) -> Map:
+        """Returns the states of the struck squares, the rest are unknown to the opponent."""
+        states = [[SquareStatus.UNKNOWN] * self.rows_cnt for _ in range(self.lines_cnt)]
+        self._put_struck(states)
+
+        return states
+
+    def _put_struck(self, states: Map) -> None:
+        for key in self.struck:
+            x, y = divmod(key, self.rows_cnt)
+            index = self.ship_index.get(key)
+            if index is None:
+                states[x][y] = SquareStatus.MISSED
+            else:
+                states[x][y] = SquareStatus.DESTROYED if self.ships[index].is_destroyed() else SquareStatus.HIT
 
     def create_ship(self, coordinates: List[Tuple[int, int]]) -> Ship:
         """Creates a ship at given coordinates.
@@ -46,26 +175,39 @@ class Board(BaseModel):
         if len(coordinates) > 1:
             self._validate_continuous_coords(coordinates)
         self._validate_empty_surrounding(coordinates)
-        squares = self.get_squares(coordinates)
         ship = Ship(coords=coordinates, hp=len(coordinates))
 
-        for square in squares:
-            square.place_ship(ship)
+        for x, y in ship.coords:
+            self.ship_index[x * self.rows_cnt + y] = len(self.ships)
 
         self.ships.append(ship)
+        self.ships_remaining += 1
         return ship
 
+    def remove_ship(self, ship: Ship) -> None:
+        """Removes a ship placed during the setup, the ships after it move one index down."""
+        position = next(index for index, placed in enumerate(self.ships) if placed is ship)
+        del self.ships[position]
+        self.ships_remaining -= 1
+
+        for x, y in ship.coords:
+            del self.ship_index[x * self.rows_cnt + y]
+        for index in range(position, len(self.ships)):
+            for x, y in self.ships[index].coords:
+                self.ship_index[x * self.rows_cnt + y] = index
+
     # функция возвращает список координат с самым большим коэффициентом шанса попадания
     def get_max_weight_coords(self) -> List[Tuple[int, int]]:
         weights = []
         max_weight = -1
+        weight = self._weight
 
         for x in range(self.lines_cnt):
             for y in range(self.rows_cnt):
-                if self.weight[x][y] > max_weight:
+                if weight[x][y] > max_weight:
                     weights = [(x, y)]
-                    max_weight = self.weight[x][y]
-                elif self.weight[x][y] == max_weight:
+                    max_weight = weight[x][y]
+                elif weight[x][y] == max_weight:
                     weights.append((x, y))
 
         return weights
@@ -75,7 +217,7 @@ class Board(BaseModel):
         # Для начала мы выставляем всем клеткам 1.
         # нам не обязательно знать какой вес был у клетки в предыдущий раз:
         # эффект веса не накапливается от хода к ходу.
-        self.weight = [[1 for _ in range(self.rows_cnt)] for _ in range(self.lines_cnt)]
+        self._weight = weight = [[1 for _ in range(self.rows_cnt)] for _ in range(self.lines_cnt)]
 
         # Пробегаем по всем полю.
         # Если находим раненый корабль - ставим клеткам выше ниже и по бокам
@@ -84,59 +226,57 @@ class Board(BaseModel):
         for x in range(self.lines_cnt):
             for y in range(self.rows_cnt):
                 if opponent_map[x][y] == SquareStatus.HIT:
-                    self.weight[x][y] = 0
+                    weight[x][y] = 0
 
                     if x - 1 >= 0:
                         if y - 1 >= 0:
-                            self.weight[x - 1][y - 1] = 0
-                        self.weight[x - 1][y] *= 50
+                            weight[x - 1][y - 1] = 0
+                        weight[x - 1][y] *= 50
                         if y + 1 < self.rows_cnt:
-                            self.weight[x - 1][y + 1] = 0
+                            weight[x - 1][y + 1] = 0
 
                     if x + 1 < self.lines_cnt:
                         if y - 1 >= 0:
-                            self.weight[x + 1][y - 1] = 0
-                        self.weight[x + 1][y] *= 50
+                            weight[x + 1][y - 1] = 0
+                        weight[x + 1][y] *= 50
                         if y + 1 < self.rows_cnt:
-                            self.weight[x + 1][y + 1] = 0
+                            weight[x + 1][y + 1] = 0
 
                     if y - 1 >= 0:
-                        self.weight[x][y - 1] *= 50
+                        weight[x][y - 1] *= 50
                     if y + 1 < self.rows_cnt:
-                        self.weight[x][y + 1] *= 50
+                        weight[x][y + 1] *= 50
 
                 elif opponent_map[x][y] == SquareStatus.DESTROYED:
-                    self.weight[x][y] = 0
+                    weight[x][y] = 0
 
                     if x - 1 >= 0:
                         if y - 1 >= 0:
-                            self.weight[x - 1][y - 1] = 0
-                        self.weight[x - 1][y] = 0
+                            weight[x - 1][y - 1] = 0
+                        weight[x - 1][y] = 0
                         if y + 1 < self.rows_cnt:
-                            self.weight[x - 1][y + 1] = 0
+                            weight[x - 1][y + 1] = 0
 
                     if x + 1 < self.lines_cnt:
                         if y - 1 >= 0:
-                            self.weight[x + 1][y - 1] = 0
-                        self.weight[x + 1][y] = 0
+                            weight[x + 1][y - 1] = 0
+                        weight[x + 1][y] = 0
                         if y + 1 < self.rows_cnt:
-                            self.weight[x + 1][y + 1] = 0
+                            weight[x + 1][y + 1] = 0
 
                     if y - 1 >= 0:
-                        self.weight[x][y - 1] = 0
+                        weight[x][y - 1] = 0
                     if y + 1 < self.rows_cnt:
-                        self.weight[x][y + 1] = 0
+                        weight[x][y + 1] = 0
 
                 elif opponent_map[x][y] == SquareStatus.MISSED:
-                    self.weight[x][y] = 0
-
-    def mark_destroyed_ship(self, ship: Ship) -> None:
-        squares = self.get_squares(ship.coords)
-        for square in squares:
-            square.state = SquareStatus.DESTROYED
+                    weight[x][y] = 0
 
     def is_finished(self) -> bool:
-        return all(ship.is_destroyed() for ship in self.ships)
+        return self.ships_remaining == 0
+
+    def destroyed_ships_count(self) -> int:
+        return self.ships_destroyed
 
     def _validate_coordinates(self, coords: List[Tuple[int, int]]) -> None:
         for coord in coords:
@@ -155,8 +295,8 @@ class Board(BaseModel):
                 for y in range(coord[1] - 1, coord[1] + 2):
                     if not 0 <= y <= self.rows_cnt - 1:
                         continue
-                    square = self.get_square((x, y))
-                    if square.state != SquareStatus.EMPTY:
+                    key = x * self.rows_cnt + y
+                    if key in self.ship_index or self._is_struck(key):
                         raise SquareStateError("The surrounding squares are not in empty state")
 
     @staticmethod
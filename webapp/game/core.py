@@ -1,8 +1,8 @@
+import logging
 from enum import Enum
-from random import choice, shuffle
 from typing import Any, ClassVar, Dict, List, Tuple
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator, validator
 
 from webapp.game.board import Board
 from webapp.game.exceptions import (
@@ -12,10 +12,14 @@ from webapp.game.exceptions import (
     PlayerDoesNotExist,
     PlayerTurnError,
     SquareStateError,
-    SquareStrikedError,
 )
+from webapp.game.rng import GameRandom
+from webapp.game.rules import DEFAULT_RULES, RULES, RulesName
 from webapp.game.ship import Ship
-from webapp.game.square import Square, SquareStatus
+from webapp.game.square import SquareStatus
+from webapp.game.strategies import DEFAULT_STRATEGY, STRATEGIES, StrategyName
+
+logger = logging.getLogger(__name__)
 
 
 class HitStatus(Enum):
@@ -31,30 +35,84 @@ class Player(BaseModel):
 
 
 class BattleShipGame(BaseModel):
-    SHIP_TYPES: ClassVar[List[int]] = [1, 1, 1, 1, 2, 2, 2, 3, 3, 4]
+    MAX_PLACEMENT_RETRIES: ClassVar[int] = 200
 
     player: Player
     ai: Player
     max_ship_count: int = Field(default=10)
-    turn: Player
+    # the players are saved once, the turn and the winner by their user ids
+    turn_id: int
     started: bool = Field(default=True)
     finished: bool = Field(default=False)
-    winner: Player | None = Field(default=None)
+    winner_id: int | None = Field(default=None)
+    moves_count: int = Field(default=0)
+    # fleet placement and AI tie breaks, saved as its 64-bit state
+    rng: GameRandom = Field(default_factory=GameRandom)
+    ai_strategy: StrategyName = Field(default=DEFAULT_STRATEGY)
+    rules: RulesName = Field(default=DEFAULT_RULES)
+
+    @model_validator(mode='before')
+    @classmethod
+    def convert_player_copies(cls, data: Any) -> Any:
+        """Converts games saved with copies of the turn and winner players."""
+        if isinstance(data, dict) and 'turn' in data:
+            turn, winner = data['turn'], data.get('winner')
+            data = {key: value for key, value in data.items() if key not in ('turn', 'winner')}
+            data['turn_id'] = cls._get_user_id(turn)
+            data['winner_id'] = None if winner is None else cls._get_user_id(winner)
+        return data
+
+    @staticmethod
+    def _get_user_id(player: Any) -> int:
+        return player.user_id if isinstance(player, Player) else player.get('user_id', 0)
 
-    @validator("turn")
+    @validator("turn_id")
     @classmethod
-    def validate_turn(cls, value: Any, values: Dict[str, Any]) -> Player:
-        if value.user_id not in (values['player'].user_id, values['ai'].user_id):
+    def validate_turn(cls, value: Any, values: Dict[str, Any]) -> int:
+        if value not in (values['player'].user_id, values['ai'].user_id):
             raise PlayerTurnError("Player should be one of the game's players. Use change_turn method instead")
         return value
 
-    @validator("winner")
+    @validator("winner_id")
     @classmethod
-    def validate_winner(cls, value: Any, values: Dict[str, Any]) -> Player | None:
-        if value is not None and value.user_id not in (values['player'].user_id, values['ai'].user_id):
+    def validate_winner(cls, value: Any, values: Dict[str, Any]) -> int | None:
+        if value is not None and value not in (values['player'].user_id, values['ai'].user_id):
             raise PlayerDoesNotExist("Should be one of the game's player")
         return value
 
+    @classmethod
+    def new(
+        cls,
+        user_id: int,
+        rules: RulesName = DEFAULT_RULES,
+        ai_user_id: int = 0,
+        seed: int | None = None,
+        ai_strategy: StrategyName = DEFAULT_STRATEGY,
+    ) -> 'BattleShipGame':
+        """Creates a game on empty boards of the rule set, the player moves first.
+
+        Games with the same seed and moves play out the same, a random seed is used if not given.
+        """
+        game_rules = RULES[rules]
+        size, ship_count = game_rules.size, len(game_rules.ship_types)
+
+        player = Player(user_id=user_id, is_ai=False, board=Board.create(size, size, ship_count))
+        ai = Player(user_id=ai_user_id, is_ai=True, board=Board.create(size, size, ship_count))
+        return cls(
+            player=player,
+            ai=ai,
+            turn_id=user_id,
+            max_ship_count=ship_count,
+            rng=GameRandom(seed),
+            ai_strategy=ai_strategy,
+            rules=rules,
+        )
+
+    @classmethod
+    def restore(cls, data: Dict[str, Any]) -> 'BattleShipGame':
+        """Builds the game from its saved state, boards index their ships when created."""
+        return cls(**data)
+
     def get_player(self, user_id: int) -> Player:
         self._validate_player(user_id)
         return next((p for p in self.players if p.user_id == user_id))
@@ -63,60 +121,93 @@ class BattleShipGame(BaseModel):
         self._validate_player(user_id)
         return next((p for p in self.players if p.user_id != user_id))
 
+    @property
+    def ship_types(self) -> List[int]:
+        return list(RULES[self.rules].ship_types)
+
     @property
     def players(self) -> Tuple[Player, Player]:
         return self.player, self.ai
 
+    @property
+    def turn(self) -> Player:
+        return self.player if self.turn_id == self.player.user_id else self.ai
+
+    @property
+    def winner(self) -> Player | None:
+        if self.winner_id is None:
+            return None
+        return self.player if self.winner_id == self.player.user_id else self.ai
+
     def change_turn(self) -> None:
-        if self.turn.user_id == self.player.user_id:
-            self.turn = self.ai
+        if self.turn_id == self.player.user_id:
+            self.turn_id = self.ai.user_id
         else:
-            self.turn = self.player
+            self.turn_id = self.player.user_id
 
     # передается ии и пользователь, если он выбрал рандомную расстановку, иначе только ии
-    def setup_random_ships(self, player: Player) -> None:
+    def setup_random_ships(self, player: Player) -> int:
         """
         Creates n number of ships based on game's ship count.
         The ships are created randomly at players boards.
         Ships can be only created randomly once.
+        Returns the number of placement retries.
         """
         self._validate_finish()
         board = player.board
         if len(board.ships) == self.max_ship_count:
             raise MaxShipReachedError
-        self._create_random_ships(board)
+        return self._create_random_ships(board)
 
-    def _create_random_ships(self, board: Board) -> None:
+    def _create_random_ships(self, board: Board) -> int:
         """Create ships with random positions for given board.
 
         Even though ships positions will be random,
         There will be equal number of ships with equal length
         through the boards.
+        Ships are placed from the longest one, and placement starts over
+        if a ship doesn't fit after MAX_PLACEMENT_RETRIES base coordinates.
+        Returns the number of base coordinates drawn in vain.
         """
-        board_coords = board.coords
-        for length in self.SHIP_TYPES:
-            retry = True
-            while retry:
-                i, j = choice(board_coords)  # base random cord
-                four_sides = [
-                    [(i + z, j) for z in range(length)],
-                    [(i - z, j) for z in range(length)],
-                    [(i, j + z) for z in range(length)],
-                    [(i, j - z) for z in range(length)],
-                ]
-                shuffle(four_sides)
-                for coords in four_sides:
-                    # if is_sub(coords, board_coords):
-                    try:
-                        board.create_ship(coords)
-                    except (CordinatesValidationError, SquareStateError):
+        retries = 0
+        placed_ships = len(board.ships)
+
+        while True:
+            for length in sorted(self.ship_types, reverse=True):
+                for _ in range(self.MAX_PLACEMENT_RETRIES):
+                    base = self.rng.randbelow(board.lines_cnt), self.rng.randbelow(board.rows_cnt)
+                    ship = self._create_random_ship(board, base, length)
+                    if ship is not None:
                         break
-                    print(f'ship coords: {coords}')
-                    for coord in coords:
-                        board_coords.remove(coord)
-                    retry = False
+                    retries += 1
+                else:
                     break
 
+                logger.debug('ship coords: %s', ship.coords)
+            else:
+                return retries
+
+            # the ships placed so far leave no room for the next one
+            for ship in board.ships[placed_ships:]:
+                board.remove_ship(ship)
+
+    def _create_random_ship(self, board: Board, base: Tuple[int, int], length: int) -> Ship | None:
+        """Tries to create a ship from the base coordinate, in the four directions in random order."""
+        i, j = base
+        four_sides = [
+            [(i + z, j) for z in range(length)],
+            [(i - z, j) for z in range(length)],
+            [(i, j + z) for z in range(length)],
+            [(i, j - z) for z in range(length)],
+        ]
+        self.rng.shuffle(four_sides)
+        for coords in four_sides:
+            try:
+                return board.create_ship(coords)
+            except (CordinatesValidationError, SquareStateError):
+                continue
+        return None
+
     def place_ship(self, coords: List[Tuple[int, int]]) -> None:
         """Places a ship on specific coordinates."""
         self._validate_finish()
@@ -130,8 +221,7 @@ class BattleShipGame(BaseModel):
     def get_ship(self, coord: Tuple[int, int], user_id: int) -> Ship | None:
         """Returns the ship associated with the given cordinate."""
         player = self.get_player(user_id)
-        square = player.board.get_square(coord)
-        return square.ship
+        return player.board.get_ship(coord)
 
     def get_ships(self, user_id: Any) -> List[Ship]:
         """Returns all the ships for a user"""
@@ -145,29 +235,37 @@ class BattleShipGame(BaseModel):
         self._validate_finish()
         if not self.started:
             raise GameConditionError("The game hasn't been started")
-        if self.turn.user_id != player.user_id:
+        if self.turn_id != player.user_id:
             raise PlayerTurnError("It's not your turn yet.")
         ai_board = self.ai.board
 
         return self.make_strike(coord, ai_board)
 
-    def ai_strike(self) -> HitStatus:
-        """Returns strike result of the AI."""
-        ai = self.ai
-
+    def ai_strike(self, coord: Tuple[int, int] | None = None) -> HitStatus:
+        """Returns strike result of the AI. The target is chosen by the AI unless given."""
         self._validate_finish()
         if not self.started:
             raise GameConditionError("The game hasn't been started")
 
-        player_hidden_board = self.opponent_map(ai.user_id)
-        player_board = self.player.board
+        if coord is None:
+            coord = self.choose_ai_target()
+
+        return self.make_strike(coord, self.player.board)
 
-        ai_board = ai.board
+    def choose_ai_target(self) -> Tuple[int, int]:
+        """Returns coordinate of the AI's next strike."""
+        return self.choose_target(self.ai)
 
-        ai_board.recalculate_weight_map(player_hidden_board)
-        coord = choice(ai_board.get_max_weight_coords())
+    def choose_target(self, player: Player, strategy: str | None = None) -> Tuple[int, int]:
+        """Returns the coordinate to strike for the player, chosen by the strategy or the game's AI strategy."""
+        # sunk ships are announced in the game, so their lengths are known to the opponent
+        ship_lengths = [
+            ship.length for ship in self.get_opponent(player.user_id).board.ships if not ship.is_destroyed()
+        ]
 
-        return self.make_strike(coord, player_board)
+        return STRATEGIES[strategy or self.ai_strategy].choose(
+            player.board, self.opponent_map(player.user_id), ship_lengths, self.rng
+        )
 
     def make_strike(self, coord: Tuple[int, int], board: Board) -> HitStatus:
         """Strikes a given cord on board depending on who's turn it is. Return the state of strike.
@@ -175,44 +273,32 @@ class BattleShipGame(BaseModel):
         The turn doesn't change if it hits a ship square.
         Missed or hit squares cannot be targeted again.
         """
-        square = board.get_square(coord)
-        if square.state in [SquareStatus.MISSED, SquareStatus.HIT, SquareStatus.DESTROYED]:
-            raise SquareStrikedError
-        if square.state == SquareStatus.EMPTY:
-            square.state = SquareStatus.MISSED
+        ship = board.strike(coord)
+        self.moves_count += 1
+        if ship is None:
             self.change_turn()
             return HitStatus.MISS
-        square.state = SquareStatus.HIT
-        if ship := square.ship:
-            ship.hit_ship()
 
-            if board.is_finished():
-                self.finished = True
-                self.winner = self.turn
+        if not ship.is_destroyed():
+            return HitStatus.HIT
 
-            if ship.is_destroyed():
-                board.mark_destroyed_ship(ship)
-                return HitStatus.DESTROYED
+        # only the last ship destroyed can finish the game
+        if board.is_finished():
+            self.finished = True
+            self.winner_id = self.turn_id
 
-        return HitStatus.HIT
+        return HitStatus.DESTROYED
 
     def player_map(self) -> List[List[SquareStatus]]:
         """Returns a 2D array showing the player's board"""
-        return [[square.state for square in sq_list] for sq_list in self.player.board.squares]
+        return self.player.board.states_map()
 
     def opponent_map(self, user_id: int) -> list[list[SquareStatus]]:
         """
         Returns a 2D array showing the player's hidden board.
         This is the map that should be shown to player's opponent.
         """
-        opp = self.get_opponent(user_id)
-        return [[self._hide_map(square) for square in sq_list] for sq_list in opp.board.squares]
-
-    @staticmethod
-    def _hide_map(square: Square) -> SquareStatus:
-        if square.state in [SquareStatus.MISSED, SquareStatus.HIT, SquareStatus.DESTROYED]:
-            return square.state
-        return SquareStatus.UNKNOWN
+        return self.get_opponent(user_id).board.hidden_map()
 
     def _validate_player(self, user_id: int) -> None:
         user_ids = [p.user_id for p in self.players]
@@ -0,0 +1,43 @@
+"""Engine calls of the game handlers, module level so they can be sent to an executor process."""
+from time import perf_counter
+from typing import List, Tuple
+
+from webapp.game.core import BattleShipGame, HitStatus
+from webapp.game.square import SquareStatus
+
+Map = List[List[SquareStatus]]
+
+
+def player_strike(game: BattleShipGame, coord: Tuple[int, int]) -> Tuple[HitStatus, Map]:
+    result = game.player_strike(coord)
+    return result, game.opponent_map(game.player.user_id)
+
+
+def ai_strike(
+    game: BattleShipGame, precomputed: Tuple[Tuple[int, int], int] | None = None
+) -> Tuple[Tuple[int, int], HitStatus, Map, float | None]:
+    """Returns the AI's target, strike result, player map and seconds spent on choosing the target.
+
+    A precomputed target and the rng state after choosing it are applied as is, no time is spent then.
+    """
+    target_time = None
+
+    if precomputed is None:
+        start_time = perf_counter()
+        coord = game.choose_ai_target()
+        target_time = perf_counter() - start_time
+    else:
+        coord, game.rng.state = precomputed
+
+    result = game.ai_strike(coord)
+    return coord, result, game.player_map(), target_time
+
+
+def choose_ai_target(game: BattleShipGame) -> Tuple[Tuple[int, int], int]:
+    """Returns the AI's next target and the rng state after choosing it."""
+    coord = game.choose_ai_target()
+    return coord, game.rng.state
+
+
+def setup_random_ships(game: BattleShipGame, is_ai: bool) -> int:
+    return game.setup_random_ships(game.ai if is_ai else game.player)
@@ -0,0 +1,74 @@
+import secrets
+from hashlib import blake2b
+from typing import Any, List, Sequence, TypeVar
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+T = TypeVar('T')
+
+MASK = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def derive_seed(*parts: Any) -> int:
+    """A 64-bit seed of the parts, e.g. a run seed and a game number."""
+    return int.from_bytes(blake2b(':'.join(map(str, parts)).encode(), digest_size=8).digest(), 'little')
+
+
+class GameRandom:
+    """SplitMix64 generator, its whole state is a single 64-bit integer.
+
+    Saved with the game as that integer, so a game continues the same sequence after being
+    loaded from the cache and games don't share the global random state.
+    """
+
+    __slots__ = ('state',)
+
+    def __init__(self, seed: int | None = None):
+        self.state = (secrets.randbits(64) if seed is None else seed) & MASK
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_after_validator_function(
+            lambda value: value if isinstance(value, cls) else cls(value),
+            core_schema.union_schema([core_schema.is_instance_schema(cls), core_schema.int_schema(ge=0, le=MASK)]),
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda value: value.state),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, GameRandom) and other.state == self.state
+
+    def __repr__(self) -> str:
+        return f'GameRandom({self.state})'
+
+    def __deepcopy__(self, memo: Any) -> 'GameRandom':
+        return GameRandom(self.state)
+
+    def next(self) -> int:
+        self.state = (self.state + GOLDEN_GAMMA) & MASK
+        z = self.state
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK
+        return z ^ (z >> 31)
+
+    def randbelow(self, n: int) -> int:
+        """Uniform integer in [0, n), Lemire's multiply and reject method."""
+        product = self.next() * n
+        low = product & MASK
+        if low < n:
+            threshold = ((1 << 64) - n) % n
+            while low < threshold:
+                product = self.next() * n
+                low = product & MASK
+        return product >> 64
+
+    def choice(self, seq: Sequence[T]) -> T:
+        if not seq:
+            raise IndexError('Cannot choose from an empty sequence')
+        return seq[self.randbelow(len(seq))]
+
+    def shuffle(self, items: List[Any]) -> None:
+        for i in range(len(items) - 1, 0, -1):
+            j = self.randbelow(i + 1)
+            items[i], items[j] = items[j], items[i]
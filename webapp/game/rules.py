@@ -0,0 +1,22 @@
+"""Rule sets a game can be created with: the board size and the fleet of each side."""
+from dataclasses import dataclass
+from typing import Dict, Literal, Tuple
+
+RulesName = Literal['classic', 'large', 'huge']
+
+CLASSIC_FLEET = (1, 1, 1, 1, 2, 2, 2, 3, 3, 4)
+
+
+@dataclass(frozen=True)
+class GameRules:
+    size: int
+    ship_types: Tuple[int, ...]
+
+
+DEFAULT_RULES: RulesName = 'classic'
+
+RULES: Dict[str, GameRules] = {
+    'classic': GameRules(size=10, ship_types=CLASSIC_FLEET),
+    'large': GameRules(size=50, ship_types=CLASSIC_FLEET * 4),
+    'huge': GameRules(size=100, ship_types=CLASSIC_FLEET * 16),
+}
@@ -1,20 +1,44 @@
-from typing import Any, Dict, List, Tuple
+from typing import Any, Iterable, Tuple
 
-from pydantic import BaseModel, validator
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
 
 from webapp.game.exceptions import ShipHPError
 
 
-class Ship(BaseModel):
-    coords: List[Tuple[int, int]]
-    hp: int
+class Ship:
+    """A ship and its hit points.
 
-    @validator("hp")
-    def validate_hp(cls, value: Any, values: Dict[str, Any]) -> int:
-        coords = values.get("coords")
-        if coords is not None and (value < 0 or value > len(coords)):
+    A plain class with __slots__, as boards hold dozens of ships, saved as {"coords": [[x, y], ...], "hp": hp}.
+    """
+
+    __slots__ = ('coords', 'hp')
+
+    def __init__(self, coords: Iterable[Tuple[int, int]], hp: int):
+        self.coords = tuple((x, y) for x, y in coords)
+        if hp < 0 or hp > len(self.coords):
             raise ShipHPError("Ship hp cannot be below 0 and above its length.")
-        return value
+        self.hp = hp
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        coord_schema = core_schema.tuple_positional_schema([core_schema.int_schema(), core_schema.int_schema()])
+        data_schema = core_schema.typed_dict_schema(
+            {
+                'coords': core_schema.typed_dict_field(core_schema.list_schema(coord_schema)),
+                'hp': core_schema.typed_dict_field(core_schema.int_schema()),
+            }
+        )
+        return core_schema.no_info_after_validator_function(
+            lambda value: value if isinstance(value, cls) else cls(**value),
+            core_schema.union_schema([core_schema.is_instance_schema(cls), data_schema]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: {'coords': value.coords, 'hp': value.hp}
+            ),
+        )
+
+    def __repr__(self) -> str:
+        return f'Ship(coords={list(self.coords)}, hp={self.hp})'
 
     @property
     def length(self) -> int:
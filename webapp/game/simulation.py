@@ -0,0 +1,86 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Dict, Tuple
+
+from webapp.game.core import BattleShipGame
+from webapp.game.exceptions import GameConditionError
+from webapp.game.rng import derive_seed
+from webapp.game.rules import RulesName
+
+PLAYER_USER_ID = 1
+
+
+@dataclass
+class GameResult:
+    winner: str
+    moves: int
+    move_time: Dict[str, float]
+    move_count: Dict[str, int]
+
+
+@dataclass
+class SimulationStats:
+    games: int = 0
+    wins: Counter[str] = field(default_factory=Counter)
+    # game length in moves of both sides -> number of games
+    lengths: Counter[int] = field(default_factory=Counter)
+    move_time: Counter[str] = field(default_factory=Counter)
+    move_count: Counter[str] = field(default_factory=Counter)
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        self.wins[result.winner] += 1
+        self.lengths[result.moves] += 1
+        self.move_time.update(result.move_time)
+        self.move_count.update(result.move_count)
+
+    def merge(self, other: 'SimulationStats') -> None:
+        self.games += other.games
+        self.wins.update(other.wins)
+        self.lengths.update(other.lengths)
+        self.move_time.update(other.move_time)
+        self.move_count.update(other.move_count)
+
+
+def play_game(player_strategy: str, ai_strategy: str, rules: RulesName, seed: int) -> GameResult:
+    """Plays a game between two strategies in memory, the first one moves first."""
+    game = BattleShipGame.new(PLAYER_USER_ID, rules, seed=seed)
+    game.setup_random_ships(game.ai)
+    game.setup_random_ships(game.player)
+
+    seats = {PLAYER_USER_ID: player_strategy, game.ai.user_id: ai_strategy}
+    move_time: Counter[str] = Counter()
+    move_count: Counter[str] = Counter()
+
+    while not game.finished:
+        player = game.turn
+        name = seats[player.user_id]
+
+        start = perf_counter()
+        coord = game.choose_target(player, name)
+        if player.user_id == PLAYER_USER_ID:
+            game.player_strike(coord)
+        else:
+            game.ai_strike(coord)
+        move_time[name] += perf_counter() - start
+        move_count[name] += 1
+
+    if game.winner is None:
+        raise GameConditionError('The game has finished without a winner')
+
+    return GameResult(seats[game.winner.user_id], game.moves_count, move_time, move_count)
+
+
+def run_games(first: int, count: int, strategies: Tuple[str, str], seed: int, rules: RulesName) -> SimulationStats:
+    """Plays games number first..first + count - 1, the strategies swap seats every game.
+
+    Every game is seeded from `seed` and its number, so results don't depend on how games are split between workers.
+    """
+    stats = SimulationStats()
+
+    for number in range(first, first + count):
+        player_strategy, ai_strategy = strategies if number % 2 == 0 else strategies[::-1]
+        stats.add(play_game(player_strategy, ai_strategy, rules, derive_seed(seed, number)))
+
+    return stats
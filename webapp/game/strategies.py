@@ -0,0 +1,184 @@
+"""AI strategies choosing the next square to strike, selected per game when it's created.
+
+A strategy only sees the opponent map, the lengths of the opponent's ships still afloat and
+the game's rng, plus the striking player's own board for the weight map. Each one declares
+its worst-case number of square visits per move, tests/benchmarks holds them to it.
+"""
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import ClassVar, Dict, List, Literal, Set, Tuple
+
+from webapp.game import tables
+from webapp.game.board import Board
+from webapp.game.rng import GameRandom
+from webapp.game.square import SquareStatus
+
+Map = List[List[SquareStatus]]
+StrategyName = Literal['random', 'parity', 'weighted', 'density']
+
+DEFAULT_STRATEGY: StrategyName = 'weighted'
+# score of a density placement per hit it covers, keeps finishing a hit ship ahead of hunting
+DENSITY_HIT_BONUS = 100
+
+
+class Strategy(ABC):
+    name: ClassVar[str]
+    # worst-case time of a move in square visits, by the number of board squares n
+    complexity: ClassVar[str]
+
+    @abstractmethod
+    def choose(self, board: Board, opponent_map: Map, ship_lengths: List[int], rng: GameRandom) -> Tuple[int, int]:
+        """Returns the square to strike."""
+
+    @abstractmethod
+    def cost(self, lines_cnt: int, rows_cnt: int, ship_types: List[int]) -> int:
+        """Worst-case square visits of a move on a board of the size with the given fleet."""
+
+
+class RandomStrategy(Strategy):
+    """Strikes a random square that hasn't been struck yet."""
+
+    name = 'random'
+    complexity = 'O(n)'
+
+    def choose(self, board: Board, opponent_map: Map, ship_lengths: List[int], rng: GameRandom) -> Tuple[int, int]:
+        return rng.choice(
+            [
+                (x, y)
+                for x, line in enumerate(opponent_map)
+                for y, state in enumerate(line)
+                if state == SquareStatus.UNKNOWN
+            ]
+        )
+
+    def cost(self, lines_cnt: int, rows_cnt: int, ship_types: List[int]) -> int:
+        return lines_cnt * rows_cnt
+
+
+class ParityStrategy(Strategy):
+    """Hunts on the diagonals every shortest ship afloat crosses, finishes hit ships along their line."""
+
+    name = 'parity'
+    complexity = 'O(n)'
+
+    def choose(self, board: Board, opponent_map: Map, ship_lengths: List[int], rng: GameRandom) -> Tuple[int, int]:
+        lines_cnt, rows_cnt = len(opponent_map), len(opponent_map[0])
+        free = _free_squares(opponent_map)
+
+        hits = [
+            (x, y) for x, line in enumerate(opponent_map) for y, state in enumerate(line) if state == SquareStatus.HIT
+        ]
+        if hits:
+            return rng.choice(_target_squares(hits, free, lines_cnt, rows_cnt) or sorted(free))
+
+        step = min(ship_lengths, default=1)
+        candidates = [coord for coord in tables.parity(lines_cnt, rows_cnt, step) if coord in free]
+        return rng.choice(candidates or sorted(free))
+
+    def cost(self, lines_cnt: int, rows_cnt: int, ship_types: List[int]) -> int:
+        # the free squares scan visits the halo of every square
+        return lines_cnt * rows_cnt * 10
+
+
+class WeightedStrategy(Strategy):
+    """The original AI, strikes the squares the weight map of the player's board rates highest."""
+
+    name = 'weighted'
+    complexity = 'O(n)'
+
+    def choose(self, board: Board, opponent_map: Map, ship_lengths: List[int], rng: GameRandom) -> Tuple[int, int]:
+        board.recalculate_weight_map(opponent_map)
+        return rng.choice(board.get_max_weight_coords())
+
+    def cost(self, lines_cnt: int, rows_cnt: int, ship_types: List[int]) -> int:
+        # weight map reset, the 3x3 update around every square and the max search
+        return lines_cnt * rows_cnt * 11
+
+
+class DensityStrategy(Strategy):
+    """Strikes the square covered by the most positions of the ships afloat that fit the map.
+
+    Positions through hit squares score DENSITY_HIT_BONUS per hit, so a hit ship is finished first.
+    """
+
+    name = 'density'
+    complexity = 'O(n * sum of distinct ship lengths)'
+
+    def choose(self, board: Board, opponent_map: Map, ship_lengths: List[int], rng: GameRandom) -> Tuple[int, int]:
+        lines_cnt, rows_cnt = len(opponent_map), len(opponent_map[0])
+        free = _free_squares(opponent_map)
+        density: Counter[Tuple[int, int]] = Counter()
+
+        for length, count in Counter(ship_lengths).items():
+            for placement in tables.placements(lines_cnt, rows_cnt, length):
+                hits = 0
+                for x, y in placement:
+                    if opponent_map[x][y] == SquareStatus.HIT:
+                        hits += 1
+                    elif (x, y) not in free:
+                        break
+                else:
+                    score = count * (1 + hits * DENSITY_HIT_BONUS)
+                    for coord in placement:
+                        density[coord] += score
+
+        for x, y in list(density):
+            if opponent_map[x][y] == SquareStatus.HIT:
+                del density[(x, y)]
+
+        if not density:
+            return rng.choice(sorted(free))
+
+        best = max(density.values())
+        return rng.choice(sorted(coord for coord, score in density.items() if score == best))
+
+    def cost(self, lines_cnt: int, rows_cnt: int, ship_types: List[int]) -> int:
+        # the free squares scan, then two orientations of every distinct length with each square of them
+        squares = lines_cnt * rows_cnt
+        return squares * 10 + sum(2 * squares * length for length in set(ship_types))
+
+
+STRATEGIES: Dict[str, Strategy] = {
+    strategy.name: strategy for strategy in (RandomStrategy(), ParityStrategy(), WeightedStrategy(), DensityStrategy())
+}
+
+
+def _free_squares(opponent_map: Map) -> Set[Tuple[int, int]]:
+    """Squares not struck yet that can still hold a ship.
+
+    Ships don't touch, so the squares around a destroyed ship and diagonal to a hit are empty.
+    """
+    lines_cnt, rows_cnt = len(opponent_map), len(opponent_map[0])
+    halo, diagonals = tables.halo(lines_cnt, rows_cnt), tables.diagonals(lines_cnt, rows_cnt)
+
+    free = set()
+    empty = set()
+    for x, line in enumerate(opponent_map):
+        for y, state in enumerate(line):
+            if state == SquareStatus.UNKNOWN:
+                free.add((x, y))
+            elif state == SquareStatus.DESTROYED:
+                empty.update(halo[x][y])
+            elif state == SquareStatus.HIT:
+                empty.update(diagonals[x][y])
+
+    return free - empty
+
+
+def _target_squares(
+    hits: List[Tuple[int, int]], free: Set[Tuple[int, int]], lines_cnt: int, rows_cnt: int
+) -> List[Tuple[int, int]]:
+    """Free squares next to the hits, only the ones in line with them once two hits are adjacent."""
+    hit_set = set(hits)
+    neighbours = tables.neighbours(lines_cnt, rows_cnt)
+
+    in_line = []
+    for x, y in hits:
+        for nx, ny in neighbours[x][y]:
+            # the opposite square of a hit neighbour continues the line
+            if (nx, ny) in hit_set and (2 * x - nx, 2 * y - ny) in free:
+                in_line.append((2 * x - nx, 2 * y - ny))
+    if in_line:
+        return sorted(set(in_line))
+
+    return sorted({coord for x, y in hits for coord in neighbours[x][y] if coord in free})
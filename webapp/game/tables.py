@@ -0,0 +1,62 @@
+"""Per board size lookup tables of the AI strategies.
+
+Built on first use and kept for the life of the process, so games of the same size share them.
+Tables are indexed as [x][y] like the board and hold tuples, nothing in them may be mutated.
+"""
+from functools import lru_cache
+from typing import Tuple
+
+Coord = Tuple[int, int]
+Coords = Tuple[Coord, ...]
+Grid = Tuple[Tuple[Coords, ...], ...]
+
+TABLES_CACHE_SIZE = 32
+
+
+def _grid(lines_cnt: int, rows_cnt: int, offsets: Tuple[Coord, ...]) -> Grid:
+    return tuple(
+        tuple(
+            tuple((x + dx, y + dy) for dx, dy in offsets if 0 <= x + dx < lines_cnt and 0 <= y + dy < rows_cnt)
+            for y in range(rows_cnt)
+        )
+        for x in range(lines_cnt)
+    )
+
+
+@lru_cache(maxsize=TABLES_CACHE_SIZE)
+def neighbours(lines_cnt: int, rows_cnt: int) -> Grid:
+    """Squares sharing a side with the square, where the rest of a hit ship can be."""
+    return _grid(lines_cnt, rows_cnt, ((-1, 0), (1, 0), (0, -1), (0, 1)))
+
+
+@lru_cache(maxsize=TABLES_CACHE_SIZE)
+def diagonals(lines_cnt: int, rows_cnt: int) -> Grid:
+    """Squares sharing a corner with the square, always empty next to a hit as ships don't touch."""
+    return _grid(lines_cnt, rows_cnt, ((-1, -1), (-1, 1), (1, -1), (1, 1)))
+
+
+@lru_cache(maxsize=TABLES_CACHE_SIZE)
+def halo(lines_cnt: int, rows_cnt: int) -> Grid:
+    """All the squares around the square, always empty around a destroyed ship."""
+    return _grid(lines_cnt, rows_cnt, ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)))
+
+
+@lru_cache(maxsize=TABLES_CACHE_SIZE)
+def parity(lines_cnt: int, rows_cnt: int, step: int) -> Coords:
+    """Squares on every step-th diagonal, each ship of length step or longer covers one of them."""
+    return tuple((x, y) for x in range(lines_cnt) for y in range(rows_cnt) if (x + y) % step == 0)
+
+
+@lru_cache(maxsize=TABLES_CACHE_SIZE)
+def placements(lines_cnt: int, rows_cnt: int, length: int) -> Tuple[Coords, ...]:
+    """All the positions of a ship of the given length on an empty board."""
+    horizontal = tuple(
+        tuple((x, y + z) for z in range(length)) for x in range(lines_cnt) for y in range(rows_cnt - length + 1)
+    )
+    if length == 1:
+        return horizontal
+
+    vertical = tuple(
+        tuple((x + z, y) for z in range(length)) for x in range(lines_cnt - length + 1) for y in range(rows_cnt)
+    )
+    return horizontal + vertical
@@ -1,7 +1,14 @@
 import logging
 from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler
+from random import random
+from typing import Any, Dict
 
 import yaml
+import orjson
+
+from webapp.middleware.timing import phase_timings_ctx
 
 with open('conf/logging.conf.yml', 'r') as f:
     LOGGING_CONFIG = yaml.full_load(f)
@@ -9,11 +16,68 @@ with open('conf/logging.conf.yml', 'r') as f:
 
 class ConsoleFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
-        try:
-            correlation_id = correlation_id_ctx.get()
-            return '[%s] %s' % (correlation_id, super().format(record))
-        except LookupError:
+        correlation_id = getattr(record, 'correlation_id', None)
+        if correlation_id is None:
             return super().format(record)
+        return '[%s] %s' % (correlation_id, super().format(record))
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+
+        for key in ('correlation_id', 'phases'):
+            value = getattr(record, key, None)
+            if value:
+                data[key] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data['exc'] = record.exc_text
+
+        return orjson.dumps(data).decode()
+
+
+class ContextFilter(logging.Filter):
+    """Copies the correlation id and phase timings of the request to the record, the listener thread can't see them."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id_ctx.get(None)
+        timings = phase_timings_ctx.get()
+        record.phases = {name: round(duration * 1000, 3) for name, duration in timings.items()} if timings else None
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Passes only `rate` share of debug records."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.rate >= 1 or random() < self.rate
+
+
+class LogQueueHandler(QueueHandler):
+    """Merges the message and the traceback on the emitting thread, formatting is left to the listener."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
 
 
 correlation_id_ctx: ContextVar[str] = ContextVar('correlation_id_ctx')
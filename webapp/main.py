@@ -4,16 +4,28 @@ from typing import AsyncIterator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from conf.config import settings
+from webapp.api.admin.router import admin_router
 from webapp.api.game.router import game_router
 from webapp.api.login.router import auth_router
 from webapp.api.stats.router import stats_router
+from webapp.logger import logger
 from webapp.middleware.logger import LogServerMiddleware
 from webapp.middleware.metrics import MetricsMiddleware, metrics
-from webapp.on_startup.logger import setup_logger
+from webapp.middleware.profiler import ProfilerMiddleware
+from webapp.middleware.timing import TimingMiddleware
+from webapp.on_startup.logger import setup_logger, stop_logger
+from webapp.on_startup.loop_monitor import start_loop_monitor, stop_loop_monitor
+from webapp.on_startup.partitions import start_game_partitions, stop_game_partitions
 from webapp.on_startup.redis import start_redis
+from webapp.on_startup.sweeper import start_game_sweeper, stop_game_sweeper
+from webapp.utils.executor import shutdown_executors
 
 
 def setup_middleware(app: FastAPI) -> None:
+    if settings.REQUEST_PROFILING:
+        app.add_middleware(ProfilerMiddleware)
+
     app.add_middleware(
         LogServerMiddleware,
     )
@@ -23,12 +35,15 @@ def setup_middleware(app: FastAPI) -> None:
         CORSMiddleware, allow_origins=['*'], allow_credentials=True, allow_methods=['*'], allow_headers=['*']
     )
     app.add_middleware(MetricsMiddleware)
+    # outermost, so the phase timings are shared with the tasks started by the inner middlewares
+    app.add_middleware(TimingMiddleware)
 
 
 def setup_routers(app: FastAPI) -> None:
     app.add_route('/metrics', metrics)
 
     routers = [
+        admin_router,
         auth_router,
         game_router,
         stats_router,
@@ -42,9 +57,17 @@ def setup_routers(app: FastAPI) -> None:
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     setup_logger()
     await start_redis()
-    print('START APP')
+    await start_game_sweeper()
+    await start_game_partitions()
+    await start_loop_monitor()
+    logger.info('START APP')
     yield
-    print('STOP APP')
+    await stop_loop_monitor()
+    await stop_game_partitions()
+    await stop_game_sweeper()
+    shutdown_executors()
+    logger.info('STOP APP')
+    stop_logger()
 
 
 def create_app() -> FastAPI:
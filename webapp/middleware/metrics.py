@@ -1,14 +1,19 @@
 import os
+from functools import wraps
 from time import monotonic
-from typing import Any, Awaitable, Callable, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Literal
 
 import prometheus_client
 from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest
 from prometheus_client.multiprocess import MultiProcessCollector
+from prometheus_client.openmetrics import exposition as openmetrics
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
 
+from conf.config import settings
+from webapp.logger import correlation_id_ctx
+
 DEFAULT_BUCKETS = (
     0.005,
     0.01,
@@ -31,6 +36,17 @@ DEFAULT_BUCKETS = (
     float('+inf'),
 )
 
+ENGINE_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, float('+inf'))
+
+RETRIES_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, float('+inf'))
+
+MOVES_BUCKETS = (20, 30, 40, 50, 60, 70, 80, 90, 100, 120, 140, 160, 200, float('+inf'))
+
+PAYLOAD_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, float('+inf'))
+
+# exemplar labels are limited to 128 characters in total
+EXEMPLAR_ID_LENGTH = 64
+
 # histogram_quantile(0.99, sum(rate(sirius_deps_latency_seconds_bucket[1m])) by (le, endpoint))
 # среднее время обработки за 1 мин
 
@@ -60,6 +76,101 @@ INTEGRATIONS_LATENCY = prometheus_client.Histogram(
     buckets=DEFAULT_BUCKETS,
 )
 
+INTEGRATIONS_ERRORS = prometheus_client.Counter(
+    "integrations_errors_total",
+    "Total number of failed integration requests",
+    ['integration', 'error'],
+)
+
+INTEGRATIONS_IN_FLIGHT = prometheus_client.Gauge(
+    "integrations_in_flight",
+    "Number of integration requests in progress",
+    ['integration'],
+    multiprocess_mode='livesum',
+)
+
+INTEGRATIONS_PAYLOAD = prometheus_client.Histogram(
+    "integrations_payload_bytes",
+    "Size of payloads read from and written to integrations",
+    ['integration', 'direction'],
+    buckets=PAYLOAD_BUCKETS,
+)
+
+ENGINE_AI_TARGET_LATENCY = prometheus_client.Histogram(
+    "engine_ai_target_latency_seconds",
+    "Time the AI spends on recalculating the weight map and choosing a target",
+    buckets=ENGINE_BUCKETS,
+)
+
+ENGINE_PLACEMENT_RETRIES = prometheus_client.Histogram(
+    "engine_placement_retries",
+    "Number of random base coordinates drawn in vain while placing random ships",
+    buckets=RETRIES_BUCKETS,
+)
+
+ENGINE_STRIKES = prometheus_client.Counter(
+    "engine_strikes_total",
+    "Total number of strikes",
+    ['actor', 'result'],
+)
+
+ENGINE_GAME_MOVES = prometheus_client.Histogram(
+    "engine_game_moves",
+    "Number of strikes made in finished games",
+    ['winner'],
+    buckets=MOVES_BUCKETS,
+)
+
+ENGINE_GAME_STATE_SIZE = prometheus_client.Histogram(
+    "engine_game_state_bytes",
+    "Size of the serialized game state",
+    buckets=PAYLOAD_BUCKETS,
+)
+
+AI_MOVE_PRECOMPUTED = prometheus_client.Counter(
+    "engine_ai_move_precomputed_total",
+    "AI strikes by what happened to the move precomputed after the player's miss",
+    ['outcome'],
+)
+
+EXECUTOR_QUEUE_DEPTH = prometheus_client.Gauge(
+    "engine_executor_queue_depth",
+    "Number of engine calls submitted to the executor and not finished yet",
+    ['executor'],
+    multiprocess_mode='livesum',
+)
+
+EXECUTOR_WAIT = prometheus_client.Histogram(
+    "engine_executor_wait_seconds",
+    "Time engine calls wait for a free executor thread",
+    ['executor'],
+    buckets=ENGINE_BUCKETS,
+)
+
+EVENT_LOOP_LAG = prometheus_client.Gauge(
+    "event_loop_lag_seconds",
+    "Delay of a periodic event loop callback behind its schedule",
+    multiprocess_mode='max',
+)
+
+GAME_CACHE_EVICTIONS = prometheus_client.Counter(
+    "game_cache_evictions_total",
+    "Total number of game keys evicted from Redis by the idle sweeper",
+    ['reason'],
+)
+
+GAME_CACHE_KEYS = prometheus_client.Gauge(
+    "game_cache_keys",
+    "Number of game keys tracked in the Redis activity index",
+    multiprocess_mode='max',
+)
+
+GAME_CACHE_MEMORY = prometheus_client.Gauge(
+    "game_cache_memory_bytes",
+    "Estimated Redis memory used by game keys",
+    multiprocess_mode='max',
+)
+
 
 # A middleware to count Prometheus metrics
 class MetricsMiddleware(BaseHTTPMiddleware):
@@ -77,16 +188,45 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         return response
 
 
+def get_exemplar() -> Dict[str, str] | None:
+    """Correlation id of the current request to attach to observations, if exemplars are enabled."""
+    if not settings.METRICS_EXEMPLARS:
+        return None
+
+    try:
+        return {'correlation_id': correlation_id_ctx.get()[:EXEMPLAR_ID_LENGTH]}
+    except LookupError:
+        return None
+
+
 def integration_latency(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
-    async def wrapper(*args: List[Any], **kwargs: Dict[Any, Any]) -> Awaitable[Any]:
+    """Observes latency, errors by exception type and in-flight requests of the integration."""
+    integration = func.__name__
+    in_flight = INTEGRATIONS_IN_FLIGHT.labels(integration=integration)
+
+    @wraps(func)
+    async def wrapper(*args: List[Any], **kwargs: Dict[Any, Any]) -> Any:
         start_time: float = monotonic()
-        result = await func(*args, **kwargs)
-        INTEGRATIONS_LATENCY.labels(integration=func.__name__).observe(monotonic() - start_time)
-        return result
+        in_flight.inc()
+
+        try:
+            return await func(*args, **kwargs)
+        except Exception as exc:
+            INTEGRATIONS_ERRORS.labels(integration=integration, error=type(exc).__name__).inc()
+            raise
+        finally:
+            in_flight.dec()
+            INTEGRATIONS_LATENCY.labels(integration=integration).observe(
+                monotonic() - start_time, exemplar=get_exemplar()
+            )
 
     return wrapper
 
 
+def observe_payload(integration: str, direction: Literal['read', 'written'], size: int) -> None:
+    INTEGRATIONS_PAYLOAD.labels(integration=integration, direction=direction).observe(size, exemplar=get_exemplar())
+
+
 def metrics(request: Request) -> Response:
     if 'prometheus_multiproc_dir' in os.environ:
         registry = CollectorRegistry()
@@ -94,4 +234,10 @@ def metrics(request: Request) -> Response:
     else:
         registry = REGISTRY
 
+    # exemplars are only exposed in the OpenMetrics format
+    if 'application/openmetrics-text' in request.headers.get('accept', ''):
+        return Response(
+            openmetrics.generate_latest(registry), headers={'Content-Type': openmetrics.CONTENT_TYPE_LATEST}
+        )
+
     return Response(generate_latest(registry), headers={'Content-Type': CONTENT_TYPE_LATEST})
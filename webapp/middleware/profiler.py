@@ -0,0 +1,63 @@
+import uuid
+import cProfile
+from pathlib import Path
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from conf.config import settings
+from webapp.logger import logger
+from webapp.utils.auth.admin import is_admin_authorization
+
+
+class ProfilerMiddleware:
+    """Runs admins' requests with the X-Profile header under cProfile and dumps stats to REQUEST_PROFILE_DIR.
+
+    Only the last REQUEST_PROFILE_MAX_FILES profiles are kept.
+
+    cProfile follows the thread, not the task, so other requests served by the worker
+    at the same time end up in the profile too. Use it to reproduce slow calls on a quiet worker.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.profiling = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # only one cProfile can be enabled in a thread, overlapping requests are run as is
+        if scope['type'] != 'http' or self.profiling or not self._is_profiled(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = cProfile.Profile()
+        self.profiling = True
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.disable()
+            self.profiling = False
+
+            profile_dir = Path(settings.REQUEST_PROFILE_DIR)
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            # the log line carries the correlation id, which comes from the client and can't be a file name
+            path = profile_dir / f'{uuid.uuid4().hex}.prof'
+            profiler.dump_stats(path)
+            logger.info('Profile of %s %s saved to %s', scope['method'], scope['path'], path)
+            _remove_old_profiles(profile_dir)
+
+    @staticmethod
+    def _is_profiled(scope: Scope) -> bool:
+        headers = dict(scope['headers'])
+        if b'x-profile' not in headers:
+            return False
+
+        # the same check as /admin/profile, so other callers can't fill the disk or slow the worker down
+        authorization = headers.get(b'authorization')
+        return authorization is not None and is_admin_authorization(authorization.decode('latin-1'))
+
+
+def _remove_old_profiles(profile_dir: Path) -> None:
+    profiles = sorted(profile_dir.glob('*.prof'), key=lambda path: path.stat().st_mtime_ns)
+
+    for path in profiles[: max(len(profiles) - settings.REQUEST_PROFILE_MAX_FILES, 0)]:
+        path.unlink(missing_ok=True)
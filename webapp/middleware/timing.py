@@ -0,0 +1,88 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Iterator
+
+import prometheus_client
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from conf.config import settings
+
+PHASE_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    float('+inf'),
+)
+
+PHASE_LATENCY = prometheus_client.Histogram(
+    "http_request_phase_latency_seconds",
+    "Time spent in a phase of HTTP request handling",
+    ['endpoint', 'phase'],
+    buckets=PHASE_BUCKETS,
+)
+
+# phase name -> seconds spent in it during the current request, None outside of requests
+phase_timings_ctx: ContextVar[Dict[str, float] | None] = ContextVar('phase_timings_ctx', default=None)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Adds the time spent in the block to the phase of the current request."""
+    timings = phase_timings_ctx.get()
+    if timings is None:
+        yield
+        return
+
+    start_time = perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.0) + perf_counter() - start_time
+
+
+def format_server_timing(timings: Dict[str, float], total: float) -> str:
+    entries = [f'{name};dur={duration * 1000:.3f}' for name, duration in timings.items()]
+    entries.append(f'total;dur={total * 1000:.3f}')
+    return ', '.join(entries)
+
+
+class TimingMiddleware:
+    """Collects phase timings of a request, sends them as Server-Timing header and per phase histograms."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        # the dict is shared with the contexts copied for dependencies run in threads and tasks
+        timings: Dict[str, float] = {}
+        token = phase_timings_ctx.set(timings)
+        start_time = perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message['type'] == 'http.response.start' and settings.SERVER_TIMING_HEADER:
+                headers = MutableHeaders(scope=message)
+                headers.append('Server-Timing', format_server_timing(timings, perf_counter() - start_time))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            phase_timings_ctx.reset(token)
+            for name, duration in timings.items():
+                PHASE_LATENCY.labels(endpoint=scope['path'], phase=name).observe(duration)
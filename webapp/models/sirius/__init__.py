@@ -1 +1 @@
-from . import game, user
+from . import game, game_daily_stats, user
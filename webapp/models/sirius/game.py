@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, Boolean, ForeignKey, Integer
+from sqlalchemy import TIMESTAMP, Boolean, ForeignKey, Index, Integer, LargeBinary, false
 from sqlalchemy.orm import Mapped, mapped_column
 
 from webapp.models.meta import DEFAULT_SCHEMA, Base
@@ -8,10 +8,22 @@ from webapp.models.meta import DEFAULT_SCHEMA, Base
 
 class Game(Base):
     __tablename__ = 'game'
-
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
-
-    user_id: Mapped[int] = mapped_column(Integer, ForeignKey(f'{DEFAULT_SCHEMA}.user.id'), index=True)
+    __table_args__ = (
+        # covers per user history pages and stats, so they are served by index only scans
+        Index(
+            'ix_game_user_id_timestamp_id',
+            'user_id',
+            'timestamp',
+            'id',
+            postgresql_include=['won', 'ships_sank', 'ships_destroyed', 'abandoned'],
+        ),
+        # partitions are managed by webapp.db.partitions
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey(f'{DEFAULT_SCHEMA}.user.id'))
 
     won: Mapped[bool] = mapped_column(Boolean)
 
@@ -19,4 +31,10 @@ class Game(Base):
 
     ships_destroyed: Mapped[int] = mapped_column(Integer)
 
-    timestamp: Mapped[datetime] = mapped_column(TIMESTAMP, default=datetime.utcnow)
+    abandoned: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+
+    # packed moves log, see webapp.cache.moves
+    moves: Mapped[bytes | None] = mapped_column(LargeBinary)
+
+    # partition key has to be a part of the primary key
+    timestamp: Mapped[datetime] = mapped_column(TIMESTAMP, primary_key=True, default=datetime.utcnow)
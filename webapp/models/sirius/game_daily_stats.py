@@ -0,0 +1,24 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from webapp.models.meta import DEFAULT_SCHEMA, Base
+
+
+class GameDailyStats(Base):
+    """Per user daily rollup of sirius.game, maintained on game save."""
+
+    __tablename__ = 'game_daily_stats'
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey(f'{DEFAULT_SCHEMA}.user.id'), primary_key=True)
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    wins: Mapped[int] = mapped_column(Integer, default=0)
+
+    losses: Mapped[int] = mapped_column(Integer, default=0)
+
+    ships_sank: Mapped[int] = mapped_column(Integer, default=0)
+
+    ships_destroyed: Mapped[int] = mapped_column(Integer, default=0)
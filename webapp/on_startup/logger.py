@@ -1,11 +1,54 @@
 import logging.config
+from logging.handlers import QueueListener
+from queue import SimpleQueue
 
 from conf.config import settings
-from webapp.logger import LOGGING_CONFIG, logger
+from webapp.logger import LOGGING_CONFIG, ContextFilter, DebugSamplingFilter, LogQueueHandler, logger
 
+log_listener: QueueListener | None = None
 
-def setup_logger() -> None:
-    logging.config.dictConfig(LOGGING_CONFIG)
+
+def setup_logger(use_queue: bool = True) -> None:
+    """Configures logging, with `use_queue` handlers write from a listener thread instead of the event loop."""
+    global log_listener
+
+    stop_logger()
+
+    config = dict(LOGGING_CONFIG)
+    config['handlers'] = {
+        name: {**handler, 'formatter': settings.LOG_FORMAT} for name, handler in LOGGING_CONFIG['handlers'].items()
+    }
+    logging.config.dictConfig(config)
 
     if settings.LOG_LEVEL == 'debug':
         logger.setLevel(logging.DEBUG)
+        # the engine logs to module loggers, so it can be imported without the app's logging config
+        logging.getLogger('webapp.game').setLevel(logging.DEBUG)
+
+    root = logging.getLogger()
+    # sampled out debug records are dropped before the context is copied to them
+    filters = [DebugSamplingFilter(settings.LOG_DEBUG_SAMPLE_RATE), ContextFilter()]
+
+    if not use_queue:
+        for handler in root.handlers:
+            for log_filter in filters:
+                handler.addFilter(log_filter)
+        return
+
+    queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    queue_handler = LogQueueHandler(queue)
+    for log_filter in filters:
+        queue_handler.addFilter(log_filter)
+
+    log_listener = QueueListener(queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [queue_handler]
+    log_listener.start()
+
+
+def stop_logger() -> None:
+    """Writes out queued records."""
+    global log_listener
+
+    if log_listener is not None:
+        log_listener.stop()
+        log_listener = None
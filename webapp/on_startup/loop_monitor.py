@@ -0,0 +1,34 @@
+import asyncio
+
+from conf.config import settings
+from webapp.middleware.metrics import EVENT_LOOP_LAG
+
+loop_monitor_task: asyncio.Task[None] | None = None
+
+
+async def start_loop_monitor() -> None:
+    global loop_monitor_task
+
+    if settings.LOOP_LAG_INTERVAL > 0:
+        loop_monitor_task = asyncio.create_task(_run_loop_monitor())
+
+
+async def stop_loop_monitor() -> None:
+    if loop_monitor_task is None:
+        return
+
+    loop_monitor_task.cancel()
+    try:
+        await loop_monitor_task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _run_loop_monitor() -> None:
+    loop = asyncio.get_running_loop()
+
+    while True:
+        scheduled = loop.time() + settings.LOOP_LAG_INTERVAL
+        await asyncio.sleep(settings.LOOP_LAG_INTERVAL)
+        # the sleep ends late by the time other callbacks kept the loop busy
+        EVENT_LOOP_LAG.set(loop.time() - scheduled)
@@ -0,0 +1,39 @@
+import asyncio
+from datetime import datetime
+
+from conf.config import settings
+from webapp.db.partitions import ensure_game_partitions
+from webapp.db.postgres import engine
+from webapp.logger import logger
+
+partitions_task: asyncio.Task[None] | None = None
+
+
+async def start_game_partitions() -> None:
+    global partitions_task
+
+    if settings.GAME_PARTITIONS_INTERVAL > 0:
+        partitions_task = asyncio.create_task(_run_game_partitions())
+
+
+async def stop_game_partitions() -> None:
+    if partitions_task is None:
+        return
+
+    partitions_task.cancel()
+    try:
+        await partitions_task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _run_game_partitions() -> None:
+    # months move forward while the app runs, so partitions are created ahead of them on a schedule
+    while True:
+        try:
+            async with engine.begin() as conn:
+                await ensure_game_partitions(conn, datetime.utcnow().date())
+        except Exception:
+            logger.exception('Game partitions check failed')
+
+        await asyncio.sleep(settings.GAME_PARTITIONS_INTERVAL)
@@ -0,0 +1,39 @@
+import asyncio
+
+from conf.config import settings
+from webapp.cache.sweeper import sweep_idle_games
+from webapp.logger import logger
+
+sweeper_task: asyncio.Task[None] | None = None
+
+
+async def start_game_sweeper() -> None:
+    global sweeper_task
+
+    if settings.GAME_SWEEPER_INTERVAL > 0:
+        sweeper_task = asyncio.create_task(_run_game_sweeper())
+
+
+async def stop_game_sweeper() -> None:
+    if sweeper_task is None:
+        return
+
+    sweeper_task.cancel()
+    try:
+        await sweeper_task
+    except asyncio.CancelledError:
+        pass
+
+
+async def _run_game_sweeper() -> None:
+    while True:
+        await asyncio.sleep(settings.GAME_SWEEPER_INTERVAL)
+
+        try:
+            evicted = await sweep_idle_games()
+        except Exception:
+            logger.exception('Idle games sweep failed')
+            continue
+
+        if evicted:
+            logger.info('Evicted %d idle games', evicted)
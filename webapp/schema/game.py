@@ -2,11 +2,20 @@ from typing import List
 
 from pydantic import BaseModel
 
+from webapp.game.rules import DEFAULT_RULES, RulesName
+from webapp.game.strategies import DEFAULT_STRATEGY, StrategyName
+
 
 class _SetupRules(BaseModel):
+    size: int
     ship_types: List[int]
 
 
+class CreateGame(BaseModel):
+    rules: RulesName = DEFAULT_RULES
+    ai_strategy: StrategyName = DEFAULT_STRATEGY
+
+
 class CreatGameResponse(BaseModel):
     status: str
 
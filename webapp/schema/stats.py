@@ -1,3 +1,6 @@
+from datetime import datetime
+from typing import List
+
 from pydantic import BaseModel
 
 
@@ -14,3 +17,58 @@ class GetStatsResponse(BaseModel):
 
 class SaveDataResponse(BaseModel):
     status: str
+
+
+class _TimelinePoint(BaseModel):
+    bucket: datetime
+    wins: int
+    losses: int
+    ships_sank: int
+    ships_destroyed: int
+
+
+class _Timeline(BaseModel):
+    points: List[_TimelinePoint]
+    next_cursor: datetime | None
+
+
+class GetTimelineResponse(BaseModel):
+    data: _Timeline
+
+
+class _LeaderboardEntry(BaseModel):
+    rank: int
+    user_id: int
+    score: float
+
+
+class _UserRank(BaseModel):
+    rank: int
+    score: float
+
+
+class _Leaderboard(BaseModel):
+    top: List[_LeaderboardEntry]
+    me: _UserRank | None
+
+
+class GetLeaderboardResponse(BaseModel):
+    data: _Leaderboard
+
+
+class _HistoryGame(BaseModel):
+    id: int
+    timestamp: datetime
+    won: bool
+    ships_sank: int
+    ships_destroyed: int
+    abandoned: bool
+
+
+class _History(BaseModel):
+    games: List[_HistoryGame]
+    next_cursor: str | None
+
+
+class GetHistoryResponse(BaseModel):
+    data: _History
@@ -0,0 +1,24 @@
+from fastapi import Depends, HTTPException
+from starlette import status
+
+from conf.config import settings
+from webapp.utils.auth.jwt import JwtTokenT, jwt_auth
+
+
+def is_admin(access_token: JwtTokenT) -> bool:
+    return access_token['user_id'] in settings.ADMIN_USER_IDS
+
+
+def is_admin_authorization(authorization: str) -> bool:
+    """Checks the Authorization header value outside of the routes, e.g. in a middleware."""
+    try:
+        return is_admin(jwt_auth.validate_token(authorization))
+    except (HTTPException, ValueError):
+        return False
+
+
+def validate_admin_token(access_token: JwtTokenT = Depends(jwt_auth.validate_token)) -> JwtTokenT:
+    if not is_admin(access_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+
+    return access_token
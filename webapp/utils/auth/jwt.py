@@ -9,6 +9,7 @@ from starlette import status
 from typing_extensions import TypedDict
 
 from conf.config import settings
+from webapp.middleware.timing import phase
 
 
 class JwtTokenT(TypedDict):
@@ -33,7 +34,8 @@ class JwtAuth:
         _, token = authorization.split()
 
         try:
-            return cast(JwtTokenT, jwt.decode(token, self.secret))
+            with phase('auth'):
+                return cast(JwtTokenT, jwt.decode(token, self.secret))
         except JWTError:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
 
@@ -0,0 +1,19 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Tuple
+
+import orjson
+
+
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """Encodes a (timestamp, id) keyset position into an opaque cursor."""
+    return urlsafe_b64encode(orjson.dumps([timestamp, row_id])).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Raises ValueError if the cursor is malformed."""
+    try:
+        timestamp, row_id = orjson.loads(urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError('Invalid cursor') from exc
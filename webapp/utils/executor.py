@@ -0,0 +1,99 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from time import monotonic
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+import orjson
+
+from conf.config import settings
+from webapp.game.core import BattleShipGame
+from webapp.middleware.metrics import EXECUTOR_QUEUE_DEPTH, EXECUTOR_WAIT
+
+T = TypeVar('T')
+
+executors: Dict[str, Executor] = {}
+
+
+def get_executor(kind: str) -> Executor:
+    if kind not in executors:
+        if kind == 'process':
+            # spawned workers don't inherit the event loop and logging threads of the app
+            executors[kind] = ProcessPoolExecutor(
+                settings.ENGINE_EXECUTOR_WORKERS, mp_context=multiprocessing.get_context('spawn')
+            )
+        else:
+            executors[kind] = ThreadPoolExecutor(settings.ENGINE_EXECUTOR_WORKERS, thread_name_prefix='engine')
+
+    return executors[kind]
+
+
+def shutdown_executors() -> None:
+    for executor in executors.values():
+        executor.shutdown(cancel_futures=True)
+    executors.clear()
+
+
+def get_cells_count(game: BattleShipGame) -> int:
+    board = game.player.board
+    return board.lines_cnt * board.rows_cnt
+
+
+def get_state_cells_count(data: Dict[str, Any]) -> int:
+    board = data['player']['board']
+    return board['lines_cnt'] * board['rows_cnt']
+
+
+def is_costly(cells_count: int) -> bool:
+    return settings.ENGINE_EXECUTOR != 'inline' and cells_count >= settings.ENGINE_OFFLOAD_MIN_CELLS
+
+
+async def offload(cells_count: int, func: Callable[..., T], *args: Any) -> T:
+    """Runs the call in the thread pool if the board is large enough, inline otherwise."""
+    if not is_costly(cells_count):
+        return func(*args)
+
+    return await _submit('thread', func, *args)
+
+
+async def run_engine(game: BattleShipGame, func: Callable[..., T], *args: Any) -> Tuple[BattleShipGame, T]:
+    """Runs func(game, *args) inline or in the configured executor, depending on the board size.
+
+    Returns the game after the call. With the process executor it is a new object, restored from
+    the JSON state sent back by the worker.
+    """
+    if not is_costly(get_cells_count(game)):
+        return game, func(game, *args)
+
+    if settings.ENGINE_EXECUTOR == 'thread':
+        return game, await _submit('thread', func, game, *args)
+
+    state, result = await _submit('process', _run_with_state, func, orjson.dumps(game.model_dump()), *args)
+    return BattleShipGame.restore(orjson.loads(state)), result
+
+
+def _run_with_state(func: Callable[..., T], state: bytes, *args: Any) -> Tuple[bytes, T]:
+    """Runs the call in an executor process, the game is passed there and back as JSON."""
+    game = BattleShipGame.restore(orjson.loads(state))
+    result = func(game, *args)
+    return orjson.dumps(game.model_dump()), result
+
+
+async def _submit(kind: str, func: Callable[..., T], *args: Any) -> T:
+    queue_depth = EXECUTOR_QUEUE_DEPTH.labels(executor=kind)
+    submitted = monotonic()
+
+    def run() -> T:
+        EXECUTOR_WAIT.labels(executor=kind).observe(monotonic() - submitted)
+        return func(*args)
+
+    queue_depth.inc()
+    try:
+        loop = asyncio.get_running_loop()
+        if kind == 'process':
+            # the wait can't be observed from the worker process
+            return await loop.run_in_executor(get_executor(kind), partial(func, *args))
+        return await loop.run_in_executor(get_executor(kind), run)
+    finally:
+        queue_depth.dec()
@@ -0,0 +1,49 @@
+import io
+import csv
+from datetime import datetime
+from typing import Any, AsyncIterator, Sequence
+
+import orjson
+
+# encoded rows are flushed once the buffer grows over this size
+FLUSH_SIZE = 64 * 1024
+
+# columns of the rows yielded by crud.stats.iter_games
+GAME_COLUMNS = ('id', 'user_id', 'won', 'ships_sank', 'ships_destroyed', 'abandoned', 'timestamp')
+
+
+async def encode_csv(columns: Sequence[str], rows: AsyncIterator[Sequence[Any]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    async for row in rows:
+        writer.writerow(value.isoformat() if isinstance(value, datetime) else value for value in row)
+
+        if buffer.tell() >= FLUSH_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode()
+
+
+async def encode_ndjson(columns: Sequence[str], rows: AsyncIterator[Sequence[Any]]) -> AsyncIterator[bytes]:
+    chunk = bytearray()
+
+    async for row in rows:
+        chunk += orjson.dumps(dict(zip(columns, row)))
+        chunk += b'\n'
+
+        if len(chunk) >= FLUSH_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+
+    if chunk:
+        yield bytes(chunk)
+
+
+ENCODERS = {
+    'csv': (encode_csv, 'text/csv'),
+    'ndjson': (encode_ndjson, 'application/x-ndjson'),
+}
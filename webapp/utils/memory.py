@@ -0,0 +1,72 @@
+"""Heap cost of games held in memory and of their saved copies, measured with tracemalloc."""
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import orjson
+
+from webapp.game.core import BattleShipGame
+from webapp.game.rules import RulesName
+
+
+@dataclass
+class GameMemory:
+    # bytes held by a game restored from its saved state, as a cached game or a session would hold it
+    live: float
+    # bytes held by model_dump() of the game, built on every save
+    dumped: float
+    # bytes held by the JSON state sent to Redis
+    serialized: float
+    state_size: int
+
+
+def allocated_per_object(factory: Callable[[], Any], count: int = 100) -> float:
+    """Average traced heap bytes that stay allocated for each of count objects built by the factory.
+
+    The factory is called once before measuring, so caches it fills aren't counted, nor are its freed temporaries.
+    """
+    factory()
+    gc.collect()
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory() for _ in range(count)]
+        allocated = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(objects)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    return allocated / count
+
+
+def measure_game(game: BattleShipGame, count: int = 100) -> GameMemory:
+    state = orjson.dumps(game.model_dump())
+
+    return GameMemory(
+        live=allocated_per_object(lambda: BattleShipGame.restore(orjson.loads(state)), count),
+        dumped=allocated_per_object(game.model_dump, count),
+        serialized=allocated_per_object(lambda: orjson.dumps(game.model_dump()), count),
+        state_size=len(state),
+    )
+
+
+def build_game(rules: RulesName, struck_share: float, seed: int = 0) -> BattleShipGame:
+    """A game with random ships on both boards and a share of the squares of both boards struck."""
+    game = BattleShipGame.new(1, rules, seed=seed)
+    game.setup_random_ships(game.ai)
+    game.setup_random_ships(game.player)
+
+    for board in (game.player.board, game.ai.board):
+        coords = board.coords
+        game.rng.shuffle(coords)
+        for coord in coords[: int(len(coords) * struck_share)]:
+            if game.finished:
+                return game
+            game.make_strike(coord, board)
+
+    return game
@@ -0,0 +1,94 @@
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Any, Dict, List, Tuple
+
+Stack = Tuple[str, ...]
+
+
+def get_frame_name(frame: FrameType) -> str:
+    code = frame.f_code
+    return f'{code.co_name} ({code.co_filename}:{code.co_firstlineno})'
+
+
+def get_stack(frame: FrameType | None) -> Stack:
+    """Frames of the stack from the outermost to the innermost one."""
+    names = []
+
+    while frame is not None:
+        names.append(get_frame_name(frame))
+        frame = frame.f_back
+
+    return tuple(reversed(names))
+
+
+class SamplingProfiler(threading.Thread):
+    """Samples stacks of all other threads of the process every `interval` seconds.
+
+    Only reads frames of running threads, so the profiled code is not slowed down
+    apart from the GIL taken by the sampler itself for a few microseconds.
+    """
+
+    def __init__(self, interval: float):
+        super().__init__(name='sampling-profiler', daemon=True)
+        self.interval = interval
+        self.samples: Counter[Stack] = Counter()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        own_id = threading.get_ident()
+
+        while not self._stopped.wait(self.interval):
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+
+                thread_name = thread_names.get(thread_id, str(thread_id))
+                self.samples[(thread_name,) + get_stack(frame)] += 1
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+def to_collapsed(samples: Counter[Stack]) -> str:
+    """Brendan Gregg's collapsed stacks format, as read by flamegraph.pl and speedscope."""
+    return ''.join(f'{";".join(stack)} {count}\n' for stack, count in samples.most_common())
+
+
+def to_speedscope(samples: Counter[Stack], interval: float, name: str) -> Dict[str, Any]:
+    """Sampled profile in speedscope file format, https://www.speedscope.app/file-format-schema.json"""
+    frames: List[Dict[str, str]] = []
+    frame_indexes: Dict[str, int] = {}
+    stacks: List[List[int]] = []
+    weights: List[float] = []
+
+    for stack, count in samples.items():
+        indexes = []
+        for frame_name in stack:
+            if frame_name not in frame_indexes:
+                frame_indexes[frame_name] = len(frames)
+                frames.append({'name': frame_name})
+            indexes.append(frame_indexes[frame_name])
+
+        stacks.append(indexes)
+        weights.append(count * interval)
+
+    return {
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'shared': {'frames': frames},
+        'profiles': [
+            {
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': stacks,
+                'weights': weights,
+            }
+        ],
+    }